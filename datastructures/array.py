@@ -6,47 +6,308 @@
 """
 
 from __future__ import annotations
-from collections.abc import Sequence
+from collections.abc import Iterable, Sequence
 import os
-from typing import Any, Iterator, overload
+from multiprocessing import shared_memory
+from typing import Any, Callable, Iterator, overload
 import numpy as np
 from numpy.typing import NDArray
 import copy
+import functools
+import hashlib
+import numbers
+import pickle
+import struct
+import weakref
 
 
 from datastructures.iarray import IArray, T
 
 
+NATIVE_DTYPES: dict[type, np.dtype] = {
+    bool: np.dtype(np.bool_),
+    int: np.dtype(np.int64),
+    float: np.dtype(np.float64),
+    complex: np.dtype(np.complex128),
+}
+
+
+def native_dtype(data_type: type) -> np.dtype:
+    """ Return the NumPy dtype used to store items of data_type. Numeric and bool data types are stored
+        unboxed in a native dtype; every other data type falls back to an object array. """
+    return NATIVE_DTYPES.get(data_type, np.dtype(object))
+
+
+def data_type_for(dtype: np.dtype) -> type:
+    """ Return the Python data type whose items are stored in dtype. Unsigned integers map to int when every value
+        fits in int64; wider ones (uint64) map to object, so their items are kept as exact Python ints. """
+    if dtype.kind == 'u':
+        return int if np.can_cast(dtype, NATIVE_DTYPES[int], 'safe') else object
+    return next((data_type for data_type, native in NATIVE_DTYPES.items() if native.kind == dtype.kind), object)
+
+
+def common_data_type(values: Iterable[Any], default: type = object) -> type:
+    """ Return the narrowest of bool, int, float and complex that holds every value (widening as NumPy does),
+        object if some value is none of them, or default when there are no values. """
+    ladder = list(NATIVE_DTYPES)
+    rank = -1
+    for value in values:
+        rank = max(rank, next((i for i, data_type in enumerate(ladder) if isinstance(value, data_type)), len(ladder)))
+        if rank == len(ladder):
+            return object
+    return ladder[rank] if rank >= 0 else default
+
+
+COPY_POLICIES: dict[str, Callable[[Any], Any] | None] = {
+    'none': None,
+    'shallow': copy.copy,
+    'deep': copy.deepcopy,
+}
+
+
 class Array(IArray[T]):  
 
-    def __init__(self, starting_sequence: Sequence[T] = [], data_type: type = object) -> None:
+    def __init__(self, starting_sequence: Sequence[T] = [], data_type: type = object, copy_policy: str = 'deep', validate: bool = True) -> None:
+        """ validate=False skips the per-item isinstance checks here and in every later write (setitem, append, insert,
+            extend, fill). The caller then guarantees the items are data_types: a native dtype still rejects values NumPy
+            cannot convert, but e.g. a float stored in an int Array is truncated instead of raising TypeError. """
+        if copy_policy not in COPY_POLICIES:
+            raise ValueError(f"The copy policy must be one of {', '.join(COPY_POLICIES)}.")
+
         if not isinstance(starting_sequence, Sequence):
             raise ValueError("This sequence type is not a valid sequence type.")
         
         if not isinstance(data_type, type):
             raise TypeError("This data type is not a valid data type.")
         
-        if not all(isinstance(item, data_type) for item in starting_sequence):
+        if validate and not all(isinstance(item, data_type) for item in starting_sequence):
             raise TypeError("All items in the starting sequence must be of the same data type.")
         
         self.__item_count = len(starting_sequence)
-        self.__items = np.empty(self.__item_count, dtype = object)
+        self.__items = np.empty(self.__item_count, dtype = native_dtype(data_type))
+        self.__front = 0
         self.__data_type = data_type
+        self.__copy_policy = copy_policy
+        self.__validate = validate
+        self.__reserved = 0
+        self.__shared = False
+        self.__aliased = False
+        self.__fingerprint: str | None = None
+        self.__backing: _MemoryMap | _SharedMemory | None = None
+
+        if self.__items.dtype != object:
+            try:
+                self.__items[:] = starting_sequence
+            except OverflowError:
+                self.__items = np.empty(self.__item_count, dtype = object)
+
+        if self.__items.dtype == object:
+            copier = COPY_POLICIES[copy_policy]
+            items = starting_sequence if copier is None else (copier(item) for item in starting_sequence)
+            self.__items = np.fromiter(items, dtype = object, count = self.__item_count)
+
+    @classmethod
+    def from_trusted(cls, items: Sequence[T], data_type: type = object, copy_policy: str = 'deep') -> Array[T]:
+        """ Build an Array that takes ownership of items without type checking or copying them.
+            Only use this when the caller guarantees every item is a data_type and is not shared elsewhere.
+            copy_policy still applies to items added later. """
+        array = cls(data_type = data_type, copy_policy = copy_policy)
+        dtype = native_dtype(data_type)
+        try:
+            array.__items = np.fromiter(items, dtype = dtype, count = len(items))
+        except OverflowError:
+            array.__items = np.fromiter(items, dtype = object, count = len(items))
+        array.__item_count = len(items)
+        return array
+
+    @classmethod
+    def from_numpy(cls, array: NDArray, data_type: type | None = None, copy_policy: str = 'deep', validate: bool = True) -> Array[T]:
+        """ Build an Array over a one-dimensional NumPy array. When the array already has the native dtype of
+            data_type it is used as the buffer without copying, so writes through either one are visible in both.
+            data_type is inferred from the dtype of a numeric or bool array when it is not given. Slices of such an
+            Array are copies, so taking one does not stop writes from reaching the NumPy array. Changing the length
+            (append, insert, del, pop, retain, ...) first moves the Array to its own copy of the items, so the NumPy
+            array is never shifted; later writes no longer reach it. validate is as in the constructor. """
+        if not isinstance(array, np.ndarray) or array.ndim != 1:
+            raise ValueError("The array must be a one-dimensional NumPy array.")
+
+        if data_type is None:
+            data_type = data_type_for(array.dtype)
+
+        dtype = native_dtype(data_type)
+        if dtype == object:
+            if validate and not all(isinstance(item, data_type) for item in array):
+                raise TypeError("All items in the array must be of the same data type.")
+            items = array if array.dtype == object else array.astype(object)
+        elif array.dtype == dtype:
+            items = array
+        elif np.can_cast(array.dtype, dtype, 'safe'):
+            items = array.astype(dtype)
+        else:
+            raise TypeError(f"An array of {array.dtype} cannot be safely stored as {data_type}.")
+
+        result = cls(data_type = data_type, copy_policy = copy_policy, validate = validate)
+        result.__items = items
+        result.__item_count = len(items)
+        result.__shared = not items.flags.writeable
+        result.__aliased = items is array
+        return result
+
+    @classmethod
+    def open_mmap(cls, path: str | os.PathLike, data_type: type | None = None, mode: str = 'r+') -> Array[T]:
+        """ Open an Array whose items live in a memory-mapped file, so only the pages being used are resident.
+            mode is 'r' (read-only), 'r+' (read and write an existing file) or 'w+' (create or overwrite the file).
+            Appending grows the file, which never shrinks. Call flush() to record the length in the file and
+            close() (or use the Array as a context manager) when done. Only bool, int, float and complex are supported. """
+        return cls.__from_backing(_MemoryMap(path, data_type, mode))
+
+    def to_shared(self) -> Array[T]:
+        """ Copy the items into a new multiprocessing.shared_memory segment and return an Array backed by it.
+            Other processes use the same buffer through attach_shared(array.shared_name), or by being sent the Array,
+            which pickles as just the segment name. Item writes are seen by every process, so the length is fixed:
+            operations that change it raise BufferError. The returned Array owns the segment and unlinks it on close().
+            Only bool, int, float and complex Arrays can be shared. """
+        return Array.__from_backing(_SharedMemory.create(self.__live()))
 
-        for i, item in enumerate(starting_sequence):
-            self.__items[i] = copy.deepcopy(item) 
+    @classmethod
+    def attach_shared(cls, name: str) -> Array[T]:
+        """ Attach to the shared memory segment of an Array created by to_shared() in another process.
+            Call close() when done; the segment itself is unlinked by the Array that created it. """
+        return cls.__from_backing(_SharedMemory.attach(name))
+
+    @property
+    def shared_name(self) -> str | None:
+        return self.__backing.name if isinstance(self.__backing, _SharedMemory) else None
+
+    def flush(self) -> None:
+        """ Write the items and length of a memory-mapped Array to its file. Does nothing for an in-memory Array. """
+        if self.__backing is not None:
+            self.__backing.flush(self.__items, self.__front, self.__item_count)
+
+    def close(self) -> None:
+        """ Flush a memory-mapped Array and release its file, or release a shared Array's segment.
+            The Array is empty afterwards.
+
+        Raises:
+            BufferError: if a NumPy view of a shared Array's items (from to_numpy or np.asarray) is still alive.
+        """
+        if self.__backing is not None:
+            self.__backing.check_released()
+            self.flush()
+            backing = self.__backing
+            self.__backing = None
+            self.__items = np.empty(0, dtype = self.__items.dtype)
+            self.__front = 0
+            self.__item_count = 0
+            backing.close()
+
+    @classmethod
+    def __from_backing(cls, backing: _MemoryMap | _SharedMemory) -> Array[T]:
+        array = cls(data_type = data_type_for(backing.dtype), copy_policy = 'none')
+        array.__backing = backing
+        array.__items = backing.items
+        array.__front = backing.front
+        array.__item_count = backing.item_count
+        array.__aliased = True
+        return array
+
+    def save(self, path: str | os.PathLike) -> None:
+        """ Write the Array to path. Native dtypes are written in NumPy's .npy format (readable with np.load);
+            object items are written as a count followed by one length-prefixed pickle record per item. """
+        items = self.__live()
+        with open(path, 'wb') as file:
+            if items.dtype != object:
+                np.save(file, items, allow_pickle = False)
+                return
+
+            file.write(_OBJECT_MAGIC)
+            for record in (pickle.dumps(self.__data_type), *(pickle.dumps(item) for item in items)):
+                file.write(_RECORD_LENGTH.pack(len(record)))
+                file.write(record)
+
+    @classmethod
+    def load(cls, path: str | os.PathLike, mmap: bool = False) -> Array[T]:
+        """ Read an Array written by save(). With mmap=True a native dtype file is memory-mapped read-only instead of
+            read, and the Array copies it into memory the first time it is written to.
+
+        Raises:
+            ValueError: if the file was not written by save(), or mmap is requested for object items.
+        """
+        with open(path, 'rb') as file:
+            magic = file.read(len(_OBJECT_MAGIC))
+            if magic.startswith(_NPY_MAGIC):
+                file.seek(0)
+                items = np.load(path, mmap_mode = 'r') if mmap else np.load(file, allow_pickle = False)
+                return cls.from_numpy(items)
+
+            if magic != _OBJECT_MAGIC:
+                raise ValueError(f"{os.fspath(path)} was not written by Array.save.")
+            if mmap:
+                raise ValueError("Only bool, int, float and complex Arrays can be memory-mapped.")
+
+            records = []
+            while header := file.read(_RECORD_LENGTH.size):
+                (length,) = _RECORD_LENGTH.unpack(header)
+                records.append(pickle.loads(file.read(length)))
+            return cls.from_trusted(records[1:], data_type = records[0])
+
+    def __reduce_ex__(self, protocol: Any) -> Any:
+        # Native dtype items are pickled as one raw buffer of the logical items. With protocol 5 that buffer
+        # is a PickleBuffer, so it can be sent out-of-band (and unpickled without a copy).
+        if isinstance(self.__backing, _SharedMemory):
+            return Array.attach_shared, (self.__backing.name,)
+
+        items = self.__live()
+        if items.dtype == object:
+            return super().__reduce_ex__(protocol)
+
+        items = np.ascontiguousarray(items)
+        buffer = pickle.PickleBuffer(items) if protocol >= 5 else items.tobytes()
+        return _unpickle_array, (buffer, items.dtype.str, self.__data_type, self.__copy_policy, self.__validate)
+
+    def __copy__(self) -> Array[T]:
+        # copy.copy and copy.deepcopy always give an in-memory Array with its own buffer; only pickling sends
+        # a shared Array as its segment name.
+        return self.copy()
+
+    def __deepcopy__(self, memo: dict[int, Any]) -> Array[T]:
+        result = self.copy()
+        memo[id(self)] = result
+        items = result.__items
+        if items.dtype == object:
+            for i in range(len(items)):
+                items[i] = copy.deepcopy(items[i], memo)
+        return result
+
+    def __enter__(self) -> Array[T]:
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def to_numpy(self, writable: bool = False) -> NDArray:
+        """ Return a NumPy view (not a copy) of the items in the Array. The view is read-only unless writable is True,
+            in which case writes through it change the Array. The view stops tracking the Array once the Array reallocates. """
+        if writable:
+            self.__before_write()
+            self.__aliased = True
+        view = self.__live()
+        view.flags.writeable = writable
+        if self.__backing is not None:
+            self.__backing.export(view)
+        return view
 
     @overload
     def __getitem__(self, index: int) -> T: ...
     @overload
     def __getitem__(self, index: slice) -> Sequence[T]: ...
     def __getitem__(self, index: int | slice) -> T | Sequence[T]:
-        if isinstance(index, slice):
-            return Array(list(self.__items[index]), self.__data_type)
-        elif isinstance(index, int):
+        if isinstance(index, int):
             if index < 0 or index >= self.__item_count:
                 raise IndexError("The index is out of range.")
-            return self.__items[index]
+            return self.__items.item(self.__front + index)
+        elif isinstance(index, slice):
+            return self.__view(self.__live()[index])
         else:
             raise TypeError("This index type is invalid.")
 
@@ -57,50 +318,66 @@ class Array(IArray[T]):
         if index < 0 or index >= self.__item_count:
             raise IndexError("The index is out of range.")
         
-        if not isinstance(value, self.__data_type):
+        if self.__validate and not isinstance(value, self.__data_type):
             raise TypeError("The data type of the value does not match the array.")
         
-        self.__items[index] = value
+        self.__before_write()
+        self.__store(self.__front + index, value)
         
     def append(self, data: T) -> None:
-        if not isinstance(data, self.__data_type):
+        if self.__validate and not isinstance(data, self.__data_type):
             raise TypeError("This item is not the same type as the array.")
         
-        new_items = np.empty(self.__item_count + 1, dtype = object)
-        
-        for i in range(self.__item_count):
-            new_items[i] = self.__items[i]
-
-        new_items[self.__item_count] = copy.deepcopy(data)
-
-        self.__items = new_items
+        self.__make_room(self.__item_count + 1)
+        self.__before_write()
+        self.__store(self.__front + self.__item_count, data, COPY_POLICIES[self.__copy_policy])
         self.__item_count += 1
 
     def append_front(self, data: T) -> None:
-        if not isinstance(data, self.__data_type):
+        if self.__validate and not isinstance(data, self.__data_type):
             raise TypeError("This item is not the same type as the array.")
         
-        new_items = np.empty(self.__item_count + 1, dtype = object)
-        new_items[0] = copy.deepcopy(data)
+        self.__make_room(self.__item_count + 1, at_front = True)
+        self.__before_write()
+        self.__front -= 1
+        self.__store(self.__front, data, COPY_POLICIES[self.__copy_policy])
+        self.__item_count += 1
 
-        for i in range(self.__item_count):
-            new_items[i + 1] = self.__items[i]
+    def insert(self, index: int, data: T) -> None:
+        """ Insert data before index (0 <= index <= len), shifting whichever side of index is shorter. """
+        if not isinstance(index, int):
+            raise TypeError("The index must be an integer.")
 
-        self.__items = new_items
+        if not (0 <= index <= self.__item_count):
+            raise IndexError("The index is out of range.")
+
+        if self.__validate and not isinstance(data, self.__data_type):
+            raise TypeError("This item is not the same type as the array.")
+
+        at_front = index < self.__item_count // 2
+        self.__make_room(self.__item_count + 1, at_front = at_front)
+        self.__before_write()
+        front = self.__front
+        if at_front:
+            self.__items[front - 1:front - 1 + index] = self.__items[front:front + index]
+            self.__front -= 1
+        else:
+            end = front + self.__item_count
+            self.__items[front + index + 1:end + 1] = self.__items[front + index:end]
+        self.__store(self.__front + index, data, COPY_POLICIES[self.__copy_policy])
         self.__item_count += 1
 
     def pop(self) -> None:
         if self.__item_count == 0:
             raise IndexError("The array is empty, you cannot remove anything.")
         
-        item = self.__items[self.__item_count - 1]
-        removed_item = np.empty(self.__item_count - 1, dtype = object)
-
-        for i in range(self.__item_count - 1):
-            removed_item[i] = self.__items[i]
-
-        self.__items = removed_item
+        last = self.__front + self.__item_count - 1
+        item = self.__items.item(last)
+        self.__before_resize()
+        self.__before_write()
+        self.__release(last)
         self.__item_count -= 1
+        self.__shrink()
 
         return item
     
@@ -108,17 +385,236 @@ class Array(IArray[T]):
         if self.__item_count == 0:
             raise IndexError("The array is empty, you cannot remove anything.")
         
-        item = self.__items[0]
-        removed_item = np.empty(self.__item_count - 1, dtype = object)
-
-        for i in range(1, self.__item_count):
-            removed_item[i - 1] = self.__items[i]
-
-        self.__items = removed_item
+        item = self.__items.item(self.__front)
+        self.__before_resize()
+        self.__before_write()
+        self.__release(self.__front)
+        self.__front += 1
         self.__item_count -= 1
+        self.__shrink()
 
         return item
 
+    def extend(self, items: Iterable[T]) -> None:
+        """ Append every item in items in a single block copy, growing the physical size at most once. """
+        if isinstance(items, Array):
+            items = items.to_numpy()
+
+        native = self.__items.dtype != object
+        if not (native and isinstance(items, np.ndarray) and np.can_cast(items.dtype, self.__items.dtype, 'safe')):
+            items = list(items)
+            if self.__validate and not all(isinstance(item, self.__data_type) for item in items):
+                raise TypeError("All items must be the same type as the array.")
+
+        count = len(items)
+        self.__make_room(self.__item_count + count)
+        self.__before_write()
+        start = self.__front + self.__item_count
+
+        if native:
+            try:
+                self.__items[start:start + count] = items
+            except OverflowError:
+                if self.__backing is not None:
+                    raise
+                self.__items = self.__items.astype(object)
+                native = False
+        if not native:
+            copier = COPY_POLICIES[self.__copy_policy]
+            if copier is not None:
+                items = [copier(item) for item in items]
+            self.__items[start:start + count] = np.fromiter(items, dtype = object, count = count)
+        self.__item_count += count
+
+    def fill(self, value: T) -> None:
+        """ Set every item in the Array to value. """
+        if self.__validate and not isinstance(value, self.__data_type):
+            raise TypeError("The data type of the value does not match the array.")
+
+        self.__before_write()
+        items = self.__live()
+        copier = COPY_POLICIES[self.__copy_policy]
+        if items.dtype == object and copier is not None:
+            for i in range(self.__item_count):
+                items[i] = copier(value)
+            return
+        try:
+            items.fill(value)
+        except OverflowError:
+            if self.__backing is not None:
+                raise
+            self.__items = self.__items.astype(object)
+            self.__live().fill(value)
+
+    def sort(self, key: Callable[[T], Any] | None = None, reverse: bool = False) -> None:
+        """ Sort the items in place (stable, like list.sort). Native dtypes without a key are sorted by NumPy. """
+        self.__before_write()
+        items = self.__live()
+        if items.dtype != object and key is None:
+            items.sort(kind = 'stable')
+            if reverse:
+                items[:] = items[::-1]
+        else:
+            items[:] = np.fromiter(sorted(items, key = key, reverse = reverse), dtype = object, count = len(items))
+
+    def argsort(self, key: Callable[[T], Any] | None = None, reverse: bool = False) -> Array[int]:
+        """ Return the indices that would sort the Array (stable, like sorted) without changing it. """
+        items = self.__live()
+        if items.dtype != object and key is None:
+            if not reverse:
+                return Array.from_numpy(np.argsort(items, kind = 'stable'), int)
+            # Sorting the reversed items and reversing the result keeps equal items in their original order.
+            order = np.argsort(items[::-1], kind = 'stable')[::-1]
+            return Array.from_numpy(len(items) - 1 - order, int)
+
+        item_key = key if key is not None else (lambda item: item)
+        order = sorted(range(len(items)), key = lambda i: item_key(items[i]), reverse = reverse)
+        return Array.from_numpy(np.array(order, dtype = np.int64), int)
+
+    def copy(self) -> Array[T]:
+        """ Return an Array with its own buffer holding the same items (the items themselves are not copied). """
+        return self.__wrap(self.__live().copy())
+
+    def reserve(self, capacity: int) -> None:
+        """ Grow the physical size to at least capacity so that many appends can happen without reallocating.
+            The reserved capacity is also kept as a floor that popping will not shrink below. """
+        if not isinstance(capacity, int) or capacity < 0:
+            raise ValueError("The capacity must be a non-negative integer.")
+        
+        self.__reserved = capacity
+        if self.__front + capacity > len(self.__items):
+            self.__resize(max(capacity, len(self.__items)), 0)
+
+    def shrink_to_fit(self) -> None:
+        """ Release any unused physical space so the physical size equals the logical size. """
+        self.__reserved = 0
+        if len(self.__items) != self.__item_count:
+            self.__resize(self.__item_count, 0)
+
+    @property
+    def capacity(self) -> int:
+        return len(self.__items)
+
+    @property
+    def dtype(self) -> np.dtype:
+        return self.__items.dtype
+
+    @property
+    def copy_policy(self) -> str:
+        return self.__copy_policy
+
+    @property
+    def validate(self) -> bool:
+        return self.__validate
+
+    def __store(self, index: int, value: T, copier: Callable[[T], T] | None = None) -> None:
+        # Native dtypes hold immutable scalars so they never need copying. A value that does not fit
+        # the native dtype (e.g. an int wider than 64 bits) moves the array over to object storage.
+        if self.__items.dtype != object:
+            try:
+                self.__items[index] = value
+                return
+            except OverflowError:
+                if self.__backing is not None:
+                    raise
+                self.__items = self.__items.astype(object)
+        self.__items[index] = copier(value) if copier else value
+
+    def __release(self, index: int) -> None:
+        # Drop the reference held by a vacated object slot so the item can be garbage collected.
+        if self.__items.dtype == object:
+            self.__items[index] = None
+
+    def __wrap(self, items: NDArray) -> Array[T]:
+        array = Array[T](data_type = self.__data_type, copy_policy = self.__copy_policy, validate = self.__validate)
+        array.__items = items
+        array.__item_count = len(items)
+        return array
+
+    def __view(self, items: NDArray) -> Array[T]:
+        # Slicing hands out an O(1) view over the same buffer. Both the view and this Array are then
+        # marked shared, so whichever one is written to first copies the buffer (copy-on-write)
+        # and slices keep behaving like independent Arrays. A buffer that is also written from outside
+        # (a from_numpy or writable to_numpy alias, a file or a shared memory segment) must stay this
+        # Array's buffer, so the slice copies its window instead.
+        if self.__aliased or self.__backing is not None:
+            return self.__wrap(items.copy())
+        view = self.__wrap(items)
+        view.__shared = True
+        self.__shared = True
+        return view
+
+    def __before_write(self) -> None:
+        # Every change to the items goes through here first: a shared buffer is copied (copy-on-write)
+        # and the cached fingerprint is dropped.
+        self.__fingerprint = None
+        if self.__shared:
+            self.__items = self.__items.copy()
+            self.__shared = False
+            self.__aliased = False
+
+    def __before_resize(self) -> None:
+        # Every change to the length goes through here first. Length changes shift items within the buffer, so a
+        # buffer that is also someone else's (a from_numpy array, a writable to_numpy view or an Array2D column)
+        # is first swapped for a copy of the live items; item writes before that still go to the shared buffer.
+        if self.__backing is not None:
+            if self.__backing.fixed_length:
+                raise BufferError("A shared Array has a fixed length.")
+        elif self.__aliased:
+            self.__items = self.__live().copy()
+            self.__front = 0
+            self.__shared = False
+            self.__aliased = False
+
+    def __live(self) -> NDArray:
+        return self.__items[self.__front:self.__front + self.__item_count]
+
+    def __resize(self, capacity: int, front: int) -> None:
+        if self.__backing is not None:
+            # The file only grows, so the items are still in place in the new mapping; move them within it.
+            self.__items = self.__backing.grow(self.__items, capacity)
+            self.__items[front:front + self.__item_count] = self.__live()
+            self.__front = front
+            return
+
+        new_items = np.empty(capacity, dtype = self.__items.dtype)
+        new_items[front:front + self.__item_count] = self.__live()
+        self.__items = new_items
+        self.__front = front
+        self.__shared = False
+        self.__aliased = False
+
+    def __make_room(self, item_count: int, at_front: bool = False) -> None:
+        # The items sit in a window of the buffer with free slots on both sides, so either end can grow
+        # in amortized O(1). When the end being grown has no free slots left, a buffer that would still be
+        # at most half full is re-centered; otherwise the physical size at least doubles and the new free
+        # slots go on the side being grown (so append-only use doubles exactly like a plain dynamic array).
+        self.__before_resize()
+        capacity = len(self.__items)
+        added = item_count - self.__item_count
+        back = capacity - self.__front - self.__item_count
+        if (self.__front if at_front else back) >= added:
+            return
+
+        if item_count <= capacity // 2:
+            front = (capacity - item_count) // 2 + (added if at_front else 0)
+            self.__resize(capacity, front)
+        else:
+            new_capacity = max(2, 2 * capacity, item_count + (back if at_front else self.__front))
+            front = new_capacity - back - self.__item_count if at_front else self.__front
+            self.__resize(new_capacity, front)
+
+    def __shrink(self) -> None:
+        # Halve the physical size at 1/4 full (repeatedly, after a bulk delete). Shrinking at 1/4 rather than 1/2
+        # leaves room so that alternating append/pop at the boundary does not reallocate every call.
+        if self.__backing is not None:
+            return
+        capacity = len(self.__items)
+        while capacity > 2 and self.__item_count <= capacity // 4 and capacity // 2 >= self.__reserved:
+            capacity //= 2
+        if capacity != len(self.__items):
+            self.__resize(capacity, (capacity - self.__item_count) // 2)
+
     def __len__(self) -> int: 
         return self.__item_count
 
@@ -129,32 +625,284 @@ class Array(IArray[T]):
         if self.__item_count != other.__item_count:
             return False
         
-        return all(self[i] == other[i] for i in range(self.__item_count))
+        items, other_items = self.__live(), other.__live()
+        if items.dtype != object and other_items.dtype != object:
+            return bool(np.array_equal(items, other_items))
+        return all(item == other_item for item, other_item in zip(items, other_items))
+
+    def fingerprint(self) -> str:
+        """ Return a hash of the Array's contents, so two calls return the same value exactly when the items are unchanged.
+            For native dtypes the hash is cached until the Array is next written to, making repeat calls O(1).
+            It is recomputed on every call for object items (which can change in place) and for buffers that can be
+            written from outside the Array (from_numpy, to_numpy(writable=True) and memory-mapped Arrays). """
+        if self.__fingerprint is not None:
+            return self.__fingerprint
+
+        items = self.__live()
+        digest = hashlib.blake2b(digest_size = 16)
+        if items.dtype != object:
+            digest.update(items.dtype.str.encode('ascii'))
+            digest.update(np.ascontiguousarray(items).data)
+        else:
+            try:
+                digest.update(pickle.dumps(items.tolist()))
+            except Exception:
+                digest.update(repr(items.tolist()).encode())
+
+        if items.dtype != object and not self.__aliased:
+            self.__fingerprint = digest.hexdigest()
+        return digest.hexdigest()
     
     def __iter__(self) -> Iterator[T]:
-        return iter(self.__items[:self.__item_count])
+        if self.__items.dtype != object:
+            return iter(self.__live().tolist())
+        return iter(self.__live())
 
     def __reversed__(self) -> Iterator[T]:
         return (self[i] for i in range(self.__item_count -1, -1, -1))
 
-    def __delitem__(self, index: int) -> None:
+    def __delitem__(self, index: int | slice | Sequence[int] | NDArray) -> None:
+        if not isinstance(index, (int, np.integer)):
+            self.__compact(~self.__index_mask(index))
+            return
+
         if not (0 <= index < self.__item_count):
             raise IndexError("The index is out of range.")
         
-        for i in range(index, self.__item_count - 1):
-            self.__items[i] = self.__items[i + 1]
-
+        # Close the gap by shifting whichever side of index is shorter.
+        self.__before_resize()
+        self.__before_write()
+        front = self.__front
+        position = front + index
+        if index < self.__item_count // 2:
+            self.__items[front + 1:position + 1] = self.__items[front:position]
+            self.__release(front)
+            self.__front += 1
+        else:
+            last = front + self.__item_count - 1
+            self.__items[position:last] = self.__items[position + 1:last + 1]
+            self.__release(last)
         self.__item_count -= 1
+        self.__shrink()
 
     def __contains__(self, item: Any) -> bool:
-       if item in self.__items:
+       if self.__equal_mask(item, self.__live()).any():
            return True
        else:
            return False
 
+    def index(self, value: Any, start: int = 0, stop: int | None = None) -> int:
+        """ Return the index of the first item equal to value between start and stop (like list.index).
+
+        Raises:
+            ValueError: if no item in the range is equal to value.
+        """
+        start, stop, _ = slice(start, stop).indices(self.__item_count)
+        mask = self.__equal_mask(value, self.__live()[start:stop])
+        position = int(mask.argmax()) if len(mask) else 0
+        if len(mask) == 0 or not mask[position]:
+            raise ValueError(f"{value!r} is not in the array.")
+        return start + position
+
+    def count(self, value: Any) -> int:
+        """ Return the number of items equal to value. """
+        return int(np.count_nonzero(self.__equal_mask(value, self.__live())))
+
+    def find_all(self, predicate: Callable[[Any], Any], vectorized: bool = False) -> Array[int]:
+        """ Return the indices of the items that satisfy predicate, in order. predicate is called once per item.
+            With vectorized=True it is instead called once with a read-only NumPy view of all the items and must return
+            a boolean mask, so an elementwise expression such as `lambda x: x > 5` runs as one NumPy operation. """
+        return Array.from_numpy(np.flatnonzero(self.__predicate_mask(predicate, vectorized)), int)
+
+    def retain(self, predicate: Callable[[Any], Any], vectorized: bool = False) -> None:
+        """ Keep only the items that satisfy predicate (called as in find_all), removing the rest in one pass. """
+        self.__compact(self.__predicate_mask(predicate, vectorized))
+
+    def map(self, fn: Callable[[Any], Any], data_type: type | None = None, vectorized: bool = False) -> Array:
+        """ Return a new Array of fn applied to every item. fn is called once per item, and data_type is inferred
+            from the results when it is not given (see common_data_type). With vectorized=True fn is instead called
+            once with a read-only NumPy view of all the items and must return one result per item, so an elementwise
+            expression such as `lambda x: x * 2` runs as one NumPy operation; data_type is then inferred from the
+            result dtype. """
+        if vectorized:
+            items = self.to_numpy()
+            results = np.asarray(fn(items))
+            if results.shape != items.shape:
+                raise TypeError("The function must return one result per item.")
+            # A result that is (a view of) the items is copied so the new Array does not share this Array's buffer.
+            if np.shares_memory(results, items):
+                results = results.copy()
+            return Array.from_numpy(results, data_type)
+
+        results = [result.item() if isinstance(result, np.generic) else result for result in map(fn, self)]
+        result_type = data_type if data_type is not None else common_data_type(results, self.__data_type)
+        if not all(isinstance(result, result_type) for result in results):
+            raise TypeError(f"All results must be of type {result_type}.")
+        return Array.from_trusted(results, result_type)
+
+    def reduce(self, op: Callable[[Any, Any], Any], initial: Any = None) -> Any:
+        """ Combine the items left to right with op, like functools.reduce. A NumPy ufunc such as np.add
+            or np.maximum runs as one vectorized reduction over native dtypes. """
+        items = self.__live()
+        if isinstance(op, np.ufunc) and items.dtype != object:
+            if len(items) == 0 and initial is None and op.identity is None:
+                raise TypeError("reduce() of an empty array with no initial value.")
+            result = op.reduce(items) if initial is None else op.reduce(items, initial = initial)
+            return result.item() if isinstance(result, np.generic) else result
+        return functools.reduce(op, self, initial) if initial is not None else self.__reduce_items(op)
+
+    def sum(self) -> Any:
+        """ Return the sum of the items (0 for an empty Array). """
+        items = self.__live()
+        if items.dtype != object:
+            return items.sum().item()
+        return sum(items, 0)
+
+    def min(self) -> Any:
+        """ Return the smallest item. Raises ValueError if the Array is empty. """
+        return self.__extreme(np.min, min)
+
+    def max(self) -> Any:
+        """ Return the largest item. Raises ValueError if the Array is empty. """
+        return self.__extreme(np.max, max)
+
+    def mean(self) -> Any:
+        """ Return the arithmetic mean of the items. Raises ValueError if the Array is empty. """
+        if self.__item_count == 0:
+            raise ValueError("The mean of an empty array is undefined.")
+        items = self.__live()
+        if items.dtype != object:
+            return items.mean().item()
+        return sum(items, 0) / self.__item_count
+
+    def __array__(self, dtype: Any = None, copy: bool | None = None) -> NDArray:
+        # np.asarray(array) and friends see a read-only view of the live items; they copy only when asked to.
+        items = self.to_numpy()
+        if dtype is not None and np.dtype(dtype) != items.dtype:
+            if copy is False:
+                raise ValueError("A copy is needed to convert the array to this dtype.")
+            return items.astype(dtype)
+        return items.copy() if copy else items
+
+    def __array_ufunc__(self, ufunc: np.ufunc, method: str, *inputs: Any, **kwargs: Any) -> Any:
+        # Arrays passed to a ufunc (np.add(a, b), np.sqrt(a), np.add.reduce(a), ...) are handed to NumPy as views of
+        # their items, so the ufunc runs one vectorized loop. Array results come back as new Arrays and scalar
+        # results as Python scalars. An Array passed as out= (or as the target of ufunc.at) is written in place.
+        if method == 'at' and isinstance(inputs[0], Array):
+            inputs[0].__before_write()
+        arguments = [item.__live() if isinstance(item, Array) else item for item in inputs]
+        outputs = kwargs.get('out', ())
+        if outputs:
+            for output in outputs:
+                if isinstance(output, Array):
+                    output.__before_write()
+            kwargs['out'] = tuple(output.__live() if isinstance(output, Array) else output for output in outputs)
+
+        result = getattr(ufunc, method)(*arguments, **kwargs)
+        if outputs:
+            return outputs[0] if len(outputs) == 1 else tuple(outputs)
+        if isinstance(result, tuple):
+            return tuple(self.__ufunc_result(item) for item in result)
+        return self.__ufunc_result(result)
+
+    @staticmethod
+    def __ufunc_result(result: Any) -> Any:
+        if isinstance(result, np.ndarray) and result.ndim == 1:
+            return Array.from_numpy(result, data_type_for(result.dtype))
+        if isinstance(result, np.generic):
+            return result.item()
+        return result
+
+    def __reduce_items(self, op: Callable[[Any, Any], Any]) -> Any:
+        if self.__item_count == 0:
+            raise TypeError("reduce() of an empty array with no initial value.")
+        return functools.reduce(op, self)
+
+    def __extreme(self, numpy_op: Callable[[NDArray], Any], python_op: Callable[[Iterable[Any]], Any]) -> Any:
+        if self.__item_count == 0:
+            raise ValueError("The array is empty.")
+        items = self.__live()
+        if items.dtype != object:
+            return numpy_op(items).item()
+        return python_op(items)
+
+    def __predicate_mask(self, predicate: Callable[[Any], Any], vectorized: bool) -> NDArray:
+        if not vectorized:
+            return np.fromiter((bool(predicate(item)) for item in self), dtype = bool, count = self.__item_count)
+        items = self.to_numpy()
+        mask = np.asarray(predicate(items), dtype = bool)
+        if mask.shape != items.shape:
+            raise TypeError("The predicate must return one boolean per item.")
+        return mask
+
+    def __index_mask(self, index: slice | Sequence[int] | NDArray) -> NDArray:
+        # A boolean mask selecting the items named by a slice, a boolean mask or a sequence of indices.
+        mask = np.zeros(self.__item_count, dtype = bool)
+        if isinstance(index, slice):
+            mask[index] = True
+            return mask
+
+        if isinstance(index, Array):
+            index = index.to_numpy()
+        if not isinstance(index, (Sequence, np.ndarray)) or isinstance(index, str):
+            raise TypeError("This index type is invalid.")
+
+        index = np.asarray(index)
+        if index.dtype == bool:
+            if index.shape != mask.shape:
+                raise IndexError("A boolean mask must have one entry per item.")
+            return index
+        if len(index) == 0:
+            return mask
+        if index.dtype.kind not in 'iu':
+            raise TypeError("The indices must be integers.")
+        if index.min() < 0 or index.max() >= self.__item_count:
+            raise IndexError("The index is out of range.")
+        mask[index] = True
+        return mask
+
+    def __compact(self, keep: NDArray) -> None:
+        # Gather the kept items to the front of the live region with one fancy-indexed block move.
+        self.__before_resize()
+        self.__before_write()
+        live = self.__live()
+        kept = live[keep]
+        count = len(kept)
+        live[:count] = kept
+        if live.dtype == object:
+            live[count:] = None
+        self.__item_count = count
+        self.__shrink()
+
+    @staticmethod
+    def __equal_mask(value: Any, items: NDArray) -> NDArray:
+        # One vectorized comparison for native dtypes. Object items are compared with == by NumPy's object loop,
+        # except when value is itself a sequence, which NumPy would broadcast instead of comparing as a whole.
+        if items.dtype != object:
+            if not isinstance(value, (numbers.Number, np.generic)):
+                return np.zeros(len(items), dtype = bool)
+            try:
+                return items == value
+            except OverflowError:
+                return np.zeros(len(items), dtype = bool)
+        if isinstance(value, (Sequence, np.ndarray)) and not isinstance(value, str):
+            return np.fromiter((bool(item == value) for item in items), dtype = bool, count = len(items))
+        return np.asarray(items == value, dtype = bool)
+
     def clear(self) -> None:
+        self.__before_resize()
+        self.__fingerprint = None
+        if self.__backing is not None:
+            self.__item_count = 0
+            self.__front = 0
+            return
+
         self.__item_count = 0
-        self.__items = np.empty(0, dtype = object)
+        self.__items = np.empty(0, dtype = native_dtype(self.__data_type))
+        self.__front = 0
+        self.__reserved = 0
+        self.__shared = False
+        self.__aliased = False
 
     def __str__(self) -> str:
         return '[' + ', '.join(str(item) for item in self) + ']'
@@ -162,6 +910,162 @@ class Array(IArray[T]):
     def __repr__(self) -> str:
         return f'Array {self.__str__()}, Logical: {self.__item_count}, Physical: {len(self.__items)}, type: {self.__data_type}'
     
+_NPY_MAGIC = b'\x93NUMPY'
+_OBJECT_MAGIC = b'NPOBJAR1'
+_RECORD_LENGTH = struct.Struct('<Q')
+
+
+def _unpickle_array(buffer: Any, dtype: str, data_type: type, copy_policy: str, validate: bool = True) -> Array:
+    return Array.from_numpy(np.frombuffer(buffer, dtype = np.dtype(dtype)), data_type, copy_policy, validate)
+
+
+class _MemoryMap:
+    """ The file behind a memory-mapped Array: a 64 byte header (magic, dtype, front offset and logical size)
+        followed by the physical buffer. """
+
+    MAGIC = b'NPARRAY1'
+    HEADER = struct.Struct('<8s16sQQ')
+    HEADER_SIZE = 64
+    fixed_length = False
+
+    def __init__(self, path: str | os.PathLike, data_type: type | None, mode: str) -> None:
+        if mode not in ('r', 'r+', 'w+'):
+            raise ValueError("The mode must be 'r', 'r+' or 'w+'.")
+
+        self.path = os.fspath(path)
+        self.mode = mode
+
+        if mode == 'w+':
+            self.dtype = native_dtype(data_type) if data_type is not None else np.dtype(object)
+            if self.dtype == object:
+                raise TypeError("Only bool, int, float and complex Arrays can be memory-mapped.")
+            self.front = 0
+            self.item_count = 0
+            with open(self.path, 'wb') as file:
+                file.write(self.__header())
+        else:
+            with open(self.path, 'rb') as file:
+                magic, dtype, self.front, self.item_count = self.HEADER.unpack(file.read(self.HEADER.size))
+            if magic != self.MAGIC:
+                raise ValueError(f"{self.path} is not a memory-mapped Array file.")
+            self.dtype = np.dtype(dtype.rstrip(b'\0').decode('ascii'))
+            if data_type is not None and native_dtype(data_type) != self.dtype:
+                raise TypeError(f"{self.path} holds {self.dtype} items, not {data_type}.")
+
+        capacity = (os.path.getsize(self.path) - self.HEADER_SIZE) // self.dtype.itemsize
+        self.items = self.__map(capacity)
+
+    def grow(self, items: NDArray, capacity: int) -> NDArray:
+        if self.mode == 'r':
+            raise ValueError("A memory-mapped Array opened with mode 'r' is read-only.")
+        if capacity <= len(items):
+            return items
+
+        if isinstance(items, np.memmap):
+            items.flush()
+        with open(self.path, 'r+b') as file:
+            file.truncate(self.HEADER_SIZE + capacity * self.dtype.itemsize)
+        self.items = self.__map(capacity)
+        return self.items
+
+    def flush(self, items: NDArray, front: int, item_count: int) -> None:
+        self.front = front
+        self.item_count = item_count
+        if self.mode == 'r':
+            return
+        if isinstance(items, np.memmap):
+            items.flush()
+        with open(self.path, 'r+b') as file:
+            file.write(self.__header())
+
+    def export(self, view: NDArray) -> None:
+        pass
+
+    def check_released(self) -> None:
+        # A NumPy view of a memmap keeps the mapping open, so views may outlive close().
+        pass
+
+    def close(self) -> None:
+        pass
+
+    def __header(self) -> bytes:
+        header = self.HEADER.pack(self.MAGIC, self.dtype.str.encode('ascii'), self.front, self.item_count)
+        return header.ljust(self.HEADER_SIZE, b'\0')
+
+    def __map(self, capacity: int) -> NDArray:
+        # np.memmap cannot map zero bytes, so an empty file is represented by an empty in-memory array.
+        if capacity == 0:
+            return np.empty(0, dtype = self.dtype)
+        return np.memmap(self.path, dtype = self.dtype, mode = 'r' if self.mode == 'r' else 'r+',
+                         offset = self.HEADER_SIZE, shape = (capacity,))
+
+
+class _SharedMemory:
+    """ The shared memory segment behind a shared Array: a 64 byte header (magic, dtype and length)
+        followed by the items. """
+
+    MAGIC = b'NPSHARR1'
+    HEADER = struct.Struct('<8s16sQ')
+    HEADER_SIZE = 64
+    fixed_length = True
+    front = 0
+
+    def __init__(self, segment: shared_memory.SharedMemory, owner: bool) -> None:
+        magic, dtype, self.item_count = self.HEADER.unpack(bytes(segment.buf[:self.HEADER.size]))
+        if magic != self.MAGIC:
+            segment.close()
+            raise ValueError(f"{segment.name} is not a shared Array segment.")
+
+        self.segment = segment
+        self.owner = owner
+        self.name = segment.name
+        self.dtype = np.dtype(dtype.rstrip(b'\0').decode('ascii'))
+        self.items = np.ndarray((self.item_count,), dtype = self.dtype, buffer = segment.buf, offset = self.HEADER_SIZE)
+        self.exports: list[weakref.ref[NDArray]] = []
+
+    @classmethod
+    def create(cls, items: NDArray) -> _SharedMemory:
+        if items.dtype == object:
+            raise TypeError("Only bool, int, float and complex Arrays can be shared.")
+
+        segment = shared_memory.SharedMemory(create = True, size = cls.HEADER_SIZE + max(items.nbytes, 1))
+        segment.buf[:cls.HEADER.size] = cls.HEADER.pack(cls.MAGIC, items.dtype.str.encode('ascii'), len(items))
+        shared = cls(segment, owner = True)
+        shared.items[:] = items
+        return shared
+
+    @classmethod
+    def attach(cls, name: str) -> _SharedMemory:
+        # Only the creating process should unlink the segment, so attachments opt out of resource tracking where supported.
+        try:
+            segment = shared_memory.SharedMemory(name = name, track = False)
+        except TypeError:
+            segment = shared_memory.SharedMemory(name = name)
+        return cls(segment, owner = False)
+
+    def grow(self, items: NDArray, capacity: int) -> NDArray:
+        return items
+
+    def flush(self, items: NDArray, front: int, item_count: int) -> None:
+        pass
+
+    def export(self, view: NDArray) -> None:
+        # Views handed out of the Array are tracked so the segment is never unmapped under them.
+        self.exports = [ref for ref in self.exports if ref() is not None]
+        self.exports.append(weakref.ref(view))
+
+    def check_released(self) -> None:
+        if any(ref() is not None for ref in self.exports):
+            raise BufferError("A shared Array cannot be closed while NumPy views of its items are still alive.")
+
+    def close(self) -> None:
+        # The buffer can only be released once no NumPy array refers to it any more.
+        self.items = None
+        self.segment.close()
+        if self.owner:
+            self.segment.unlink()
+
+
 if __name__ == '__main__':
     filename = os.path.basename(__file__)
-    print(f'This is the {filename} file.\nDid you mean to run your tests or program.py file?\nFor tests, run them from the Test Explorer on the left.')
\ No newline at end of file
+    print(f'This is the {filename} file.\nDid you mean to run your tests or program.py file?\nFor tests, run them from the Test Explorer on the left.')
@@ -1,113 +1,638 @@
 from __future__ import annotations
+from concurrent.futures import ProcessPoolExecutor
+import copy
+from multiprocessing import shared_memory
 import os
-from typing import Iterator, Sequence
+from typing import Any, Callable, Iterator, Sequence
+
+import numpy as np
+from numpy.typing import NDArray
 
 from datastructures.iarray import IArray
-from datastructures.array import Array
+from datastructures.array import Array, common_data_type, data_type_for, native_dtype
 from datastructures.iarray2d import IArray2D, T
 
+# How neighborhood_sum treats cells beyond the edge, as numpy.pad modes.
+_BOUNDARY_MODES = {'zero': 'constant', 'wrap': 'wrap', 'reflect': 'reflect'}
+
+
+def _map_band(fn: Callable[[NDArray], Any], items: NDArray, start: int, stop: int) -> None:
+    # Replace rows [start, stop) of items with fn applied to them.
+    band = items[start:stop]
+    results = np.asarray(fn(band))
+    if results.shape != band.shape:
+        raise TypeError("The function must return one result per item.")
+    if not np.can_cast(results.dtype, band.dtype, 'same_kind'):
+        raise TypeError(f"Results of {results.dtype} cannot be stored in a grid of {band.dtype}.")
+    band[...] = results
+
+
+def _map_shared_band(fn: Callable[[NDArray], Any], name: str, shape: tuple[int, int], dtype: str, start: int, stop: int) -> None:
+    # Runs in a worker process: attach to the grid's shared memory segment and map one band of it in place.
+    # Only the creating process should unlink the segment, so attachments opt out of resource tracking where supported.
+    try:
+        segment = shared_memory.SharedMemory(name = name, track = False)
+    except TypeError:
+        segment = shared_memory.SharedMemory(name = name)
+    try:
+        _map_band(fn, np.ndarray(shape, dtype = dtype, buffer = segment.buf), start, stop)
+    finally:
+        segment.close()
+
 class Array2D(IArray2D[T]):
 
     class Row(IArray2D.IRow[T]):
-        def __init__(self, row_index: int, array: IArray, num_columns: int, data_type: type) -> None:
+        def __init__(self, row_index: int, array: IArray | NDArray, num_columns: int, data_type: type, grid: Array2D | None = None) -> None:
+            # array is a view of this row's items in the Array2D's 2-D buffer, so writes go straight to the grid.
             self.row_index = row_index
             self.array = array
             self.num_columns = num_columns
             self.data_type = data_type
+            self.grid = grid
 
         def __getitem__(self, column_index: int) -> T:
             if not (0 <= column_index < self.num_columns):
                 raise IndexError(f"The column index {column_index} is out of bounds.")
-            
-            index = self.row_index * self.num_columns + column_index
 
-            return self.array[index]
-        
+            return self.array.item(column_index)
+
         def __setitem__(self, column_index: int, value: T) -> None:
             if not (0 <= column_index < self.num_columns):
                 raise IndexError(f"The column index {column_index} is out of bounds.")
-            
+
             if not isinstance(value, self.data_type):
                 raise TypeError(f"Value must be of type {self.data_type}.")
-            
-            index = self.row_index * self.num_columns + column_index
 
-            self.array[index] = value
-        
+            try:
+                self.array[column_index] = value
+            except OverflowError:
+                if self.grid is None:
+                    raise
+                # The grid moves to object storage for a value too wide for its dtype; follow it to the new buffer.
+                self.grid[self.row_index, column_index] = value
+                self.array = self.grid[self.row_index].array
+
+        def to_numpy(self) -> NDArray:
+            """ Return a read-only NumPy view of the items in the row. """
+            view = self.array.view()
+            view.flags.writeable = False
+            return view
+
         def __iter__(self) -> Iterator[T]:
-            for column_index in range(self.num_columns):
-                yield self[column_index]
-        
+            return iter(self.array.tolist() if self.array.dtype != object else self.array)
+
         def __reversed__(self) -> Iterator[T]:
-            for column_index in range(self.num_columns - 1, -1, -1):
-                yield self[column_index]
+            return iter(self.array[::-1].tolist() if self.array.dtype != object else self.array[::-1])
 
         def __len__(self) -> int:
             return self.num_columns
-        
+
         def __str__(self) -> str:
-            return f"[{', '.join([str(self[column_index]) for column_index in range(self.num_columns)])}]"
-        
+            return f"[{', '.join(str(item) for item in self)}]"
+
         def __repr__(self) -> str:
-            return f'Row {self.row_index}: [{", ".join([str(self[column_index]) for column_index in range(self.num_columns - 1)])}, {str(self[self.num_columns - 1])}]'
+            return f'Row {self.row_index}: {str(self)}'
 
 
     def __init__(self, starting_sequence: Sequence[Sequence[T]]=[[]], data_type=object) -> None:
         if not isinstance(starting_sequence, Sequence) or any(not isinstance(row, Sequence) for row in starting_sequence):
             raise ValueError("must be a sequence of sequences")
-        
+
         if isinstance(starting_sequence, str):
             raise ValueError("must be a sequence of sequences")
-        
+
         if any(not isinstance(item, data_type) for row in starting_sequence for item in row):
             raise ValueError("All items must be of the same type")
-        
+
         num_columns = len(starting_sequence[0]) if starting_sequence else 0
         if any(len(row) != num_columns for row in starting_sequence):
             raise ValueError("must be a sequence of sequences with the same length")
-        
-        self.__num_rows = len(starting_sequence)
-        self.__num_columns = num_columns
+
+        shape = (len(starting_sequence), num_columns)
+        items = np.empty(shape, dtype = native_dtype(data_type))
+        if items.dtype != object:
+            try:
+                items[:] = starting_sequence
+            except OverflowError:
+                items = np.empty(shape, dtype = object)
+
+        if items.dtype == object:
+            # Filled through fromiter so that items which are themselves sequences are not broadcast by NumPy.
+            flattened = (item for row in starting_sequence for item in row)
+            items = np.fromiter(flattened, dtype = object, count = shape[0] * shape[1]).reshape(shape)
+
+        # __buffer may have spare rows and columns for growth; __items is the live [:rows, :cols] view of it.
+        # __owns_buffer is False while the buffer is shared with someone else (see __detach).
+        self.__buffer = items
+        self.__items = items
+        self.__owns_buffer = True
         self.__data_type = data_type
 
-        flattened_data = [item for row in starting_sequence for item in row]
+    @staticmethod
+    def empty(rows: int=0, cols: int=0, data_type: type=object) -> Array2D:
+        if native_dtype(data_type) != object:
+            # data_type() is the zero of every native dtype, so the grid is allocated and zeroed in one step.
+            return Array2D.zeros(rows, cols, data_type)
+        return Array2D.from_function(rows, cols, lambda row, column: data_type(), data_type)
 
-        self.__array = Array(flattened_data, data_type)
+    @staticmethod
+    def zeros(rows: int, cols: int, data_type: type = float) -> Array2D:
+        """ Create a rows x cols Array2D of zeros (False for bool) in a single allocation. """
+        dtype = native_dtype(data_type)
+        if dtype == object:
+            raise TypeError("zeros needs a bool, int, float or complex data type.")
+        return Array2D.__wrap(np.zeros((rows, cols), dtype = dtype), data_type, owned = True)
 
-        self.__rows = [Array2D.Row(i, self.__array, self.__num_columns, self.__data_type) for i in range(self.__num_rows)]
+    @staticmethod
+    def full(rows: int, cols: int, value: T, data_type: type | None = None) -> Array2D:
+        """ Create a rows x cols Array2D with every item set to value. data_type defaults to the type of value.
+            For other than bool, int, float and complex each cell gets its own deep copy of value. """
+        data_type = data_type if data_type is not None else type(value)
+        if not isinstance(value, data_type):
+            raise TypeError(f"Value must be of type {data_type}.")
 
-        for row in range(self.__num_rows):
-            for col in range(self.__num_columns):
-                index = row * self.__num_columns + col
-                self.__array[index] = starting_sequence[row][col]
+        dtype = native_dtype(data_type)
+        if dtype != object:
+            try:
+                return Array2D.__wrap(np.full((rows, cols), value, dtype = dtype), data_type, owned = True)
+            except OverflowError:
+                pass
+        return Array2D.from_function(rows, cols, lambda row, column: copy.deepcopy(value), data_type)
 
     @staticmethod
-    def empty(rows: int=0, cols: int=0, data_type: type=object) -> Array2D:
-        grid = [[data_type() for _ in range(cols)] for _ in range(rows)]
-        return Array2D(grid, data_type)
+    def from_numpy(array: NDArray, data_type: type | None = None) -> Array2D:
+        """ Create an Array2D over a 2-D NumPy array. When the array already has the native dtype of data_type it is
+            used as the buffer without copying, so writes through either one are visible in both (and a read-only
+            array gives a read-only Array2D). data_type is inferred from the dtype of a numeric or bool array. """
+        if not isinstance(array, np.ndarray) or array.ndim != 2:
+            raise ValueError("The array must be a two-dimensional NumPy array.")
+
+        if data_type is None:
+            data_type = data_type_for(array.dtype)
+
+        dtype = native_dtype(data_type)
+        if dtype == object:
+            if not all(isinstance(item, data_type) for item in array.flat):
+                raise TypeError("All items in the array must be of the same data type.")
+            items = array if array.dtype == object else array.astype(object)
+        elif array.dtype == dtype:
+            items = array
+        elif np.can_cast(array.dtype, dtype, 'safe'):
+            items = array.astype(dtype)
+        else:
+            raise TypeError(f"An array of {array.dtype} cannot be safely stored as {data_type}.")
+        return Array2D.__wrap(items, data_type, owned = items is not array)
+
+    @staticmethod
+    def from_buffer(buffer: Any, rows: int, cols: int, data_type: type = float) -> Array2D:
+        """ Create a rows x cols Array2D over the raw bytes of buffer (bytes, bytearray, memoryview, mmap, ...)
+            in row-major order, without copying. The buffer must hold at least rows * cols items of the
+            native dtype of data_type; a read-only buffer gives a read-only Array2D. """
+        dtype = native_dtype(data_type)
+        if dtype == object:
+            raise TypeError("from_buffer needs a bool, int, float or complex data type.")
+        items = np.frombuffer(buffer, dtype = dtype, count = rows * cols).reshape(rows, cols)
+        return Array2D.__wrap(items, data_type)
+
+    @staticmethod
+    def from_function(rows: int, cols: int, fn: Callable[[Any, Any], Any], data_type: type | None = None) -> Array2D:
+        """ Create a rows x cols Array2D whose item at (row, column) is fn(row, column). For bool, int, float and
+            complex (or when data_type is not given) fn is called once with a column of row indices and a row of column
+            indices (int NumPy arrays that broadcast against each other), so any elementwise expression such as
+            `lambda r, c: r * cols + c` fills the grid in one step. For other data types fn is called once per cell. """
+        if data_type is None or native_dtype(data_type) != object:
+            items = np.asarray(fn(*np.indices((rows, cols), sparse = True)))
+            if items.shape != (rows, cols) or not items.flags.owndata or not items.flags.writeable:
+                # A broadcast (e.g. a scalar) or borrowed result is copied into a buffer the grid owns.
+                items = np.array(np.broadcast_to(items, (rows, cols)))
+            grid = Array2D.from_numpy(items, data_type)
+            grid.__owns_buffer = True
+            return grid
+
+        items = np.fromiter((fn(row, column) for row in range(rows) for column in range(cols)), dtype = object, count = rows * cols)
+        if not all(isinstance(item, data_type) for item in items):
+            raise TypeError(f"All items must be of type {data_type}.")
+        return Array2D.__wrap(items.reshape(rows, cols), data_type, owned = True)
+
+    def to_numpy(self, writable: bool = False) -> NDArray:
+        """ Return a 2-D NumPy view (not a copy) of the items. The view is read-only unless writable is True,
+            in which case writes through it change the Array2D. The view stops tracking the Array2D once growing
+            it reallocates the buffer. """
+        view = self.__items.view()
+        view.flags.writeable = writable
+        return view
+
+    @property
+    def shape(self) -> tuple[int, int]:
+        return self.__items.shape
+
+    @property
+    def dtype(self) -> np.dtype:
+        return self.__items.dtype
+
+    @property
+    def data_type(self) -> type:
+        return self.__data_type
+
+    def fill(self, value: T) -> None:
+        """ Set every item in the Array2D to value. For other than bool, int, float and complex each cell gets its
+            own deep copy of value, as in full(). """
+        if not isinstance(value, self.__data_type):
+            raise TypeError(f"Value must be of type {self.__data_type}.")
+        if self.__buffer.dtype != object:
+            try:
+                self.__items.fill(value)
+                return
+            except OverflowError:
+                self.__promote()
+        for index in np.ndindex(self.__items.shape):
+            self.__items[index] = copy.deepcopy(value)
+
+    def map(self, fn: Callable[[Any], Any], data_type: type | None = None, vectorized: bool = False) -> Array2D:
+        """ Return a new Array2D of fn applied to every item. fn is called once per item, and data_type is inferred
+            from the results when it is not given (see common_data_type). With vectorized=True fn is instead called once
+            with a read-only 2-D NumPy view of all the items and must return a result of the same shape, so an
+            elementwise expression such as `lambda x: x * 2` runs as one NumPy operation; data_type is then inferred
+            from the result dtype. """
+        items = self.to_numpy()
+        if vectorized:
+            results = np.asarray(fn(items))
+            if results.shape != items.shape:
+                raise TypeError("The function must return one result per item.")
+            result_type = data_type if data_type is not None else data_type_for(results.dtype)
+            if not np.can_cast(results.dtype, native_dtype(result_type), 'safe'):
+                raise TypeError(f"An array of {results.dtype} cannot be safely stored as {result_type}.")
+            # A result that is (a view of) the read-only items is copied so the new Array2D owns a writable buffer.
+            return Array2D.__wrap(np.require(results.astype(native_dtype(result_type), copy = False), requirements = 'W'), result_type)
+
+        values = items.flat if items.dtype == object else items.ravel().tolist()
+        results = np.fromiter((result.item() if isinstance(result, np.generic) else result for result in map(fn, values)),
+                              dtype = object, count = items.size)
+        result_type = data_type if data_type is not None else common_data_type(results, self.__data_type)
+        if not all(isinstance(item, result_type) for item in results):
+            raise TypeError(f"All results must be of type {result_type}.")
+        if native_dtype(result_type) != object:
+            try:
+                results = results.astype(native_dtype(result_type))
+            except OverflowError:
+                pass
+        return Array2D.__wrap(results.reshape(items.shape), result_type, owned = True)
+
+    def sum(self, axis: int | None = None) -> Any:
+        """ Return the sum of all the items, or an Array of the column sums (axis=0) or row sums (axis=1).
+            An empty grid sums to 0, as an empty Array does. """
+        return self.__reduce(np.sum, axis, allow_empty = True)
+
+    def min(self, axis: int | None = None) -> Any:
+        """ Return the smallest item, or an Array of the column (axis=0) or row (axis=1) minimums. """
+        return self.__reduce(np.min, axis)
+
+    def max(self, axis: int | None = None) -> Any:
+        """ Return the largest item, or an Array of the column (axis=0) or row (axis=1) maximums. """
+        return self.__reduce(np.max, axis)
+
+    def mean(self, axis: int | None = None) -> Any:
+        """ Return the mean of all the items, or an Array of the column (axis=0) or row (axis=1) means. """
+        return self.__reduce(np.mean, axis)
+
+    def neighborhood_sum(self, kernel: Sequence[Sequence[Any]] | NDArray | Array2D, boundary: str = 'zero') -> Array2D:
+        """ Return a new Array2D where each item is the kernel-weighted sum of the neighborhood around it:
+            result[r, c] = sum(kernel[i, j] * grid[r + i - kr, c + j - kc]), with the kernel (odd sized, kr x kc from
+            its center) placed over every cell. For example a 3x3 kernel of ones with a 0 in the middle counts the
+            eight neighbors of every cell. boundary says what lies beyond the edges: 'zero', 'wrap' (the grid is a torus)
+            or 'reflect' (mirrored about the edge cell, as numpy.pad does). The whole grid is computed with one shifted
+            slice addition per nonzero kernel weight. Bool grids are summed as ints. """
+        if boundary not in _BOUNDARY_MODES:
+            raise ValueError(f"The boundary must be one of {', '.join(_BOUNDARY_MODES)}.")
 
-    def __getitem__(self, row_index: int) -> Array2D.IRow[T]:
-        if not (0 <= row_index < self.__num_rows):
+        weights = kernel.to_numpy() if isinstance(kernel, Array2D) else np.asarray(kernel)
+        if weights.ndim != 2 or weights.shape[0] % 2 == 0 or weights.shape[1] % 2 == 0:
+            raise ValueError("The kernel must be two-dimensional with an odd number of rows and columns.")
+        if weights.dtype.kind not in 'biufc' or self.__items.dtype == object:
+            raise TypeError("neighborhood_sum needs numeric items and weights; map object items to numbers first.")
+
+        values = self.__items.astype(np.int64) if self.__items.dtype == bool else self.__items
+        rows, cols = values.shape
+        result = np.zeros((rows, cols), dtype = np.result_type(values.dtype, weights.dtype))
+        if values.size == 0:
+            return Array2D.from_numpy(result)
+
+        pad_rows, pad_cols = weights.shape[0] // 2, weights.shape[1] // 2
+        padded = np.pad(values, ((pad_rows, pad_rows), (pad_cols, pad_cols)), mode = _BOUNDARY_MODES[boundary])
+        for (i, j), weight in np.ndenumerate(weights):
+            if weight == 0:
+                continue
+            window = padded[i:i + rows, j:j + cols]
+            result += window if weight == 1 else weight * window
+        return Array2D.from_numpy(result)
+
+    def parallel_map_blocks(self, fn: Callable[[NDArray], Any], block_rows: int | None = None, workers: int | None = None) -> None:
+        """ Replace the items, in place, with fn applied to bands of block_rows rows at a time, spread over a pool of
+            workers processes (os.cpu_count() when not given). fn is called with a 2-D NumPy array of a band and must
+            return a result of the same shape whose dtype can be stored in the grid. The items are copied once into a
+            shared memory segment that every worker maps its own bands of, so no cells are pickled; fn itself is
+            pickled, so it must be a module-level function. With a single band fn runs in this process.
+            Only bool, int, float and complex grids are supported. """
+        items = self.__items
+        if items.dtype == object:
+            raise TypeError("Only bool, int, float and complex grids can be mapped in parallel.")
+        workers = workers if workers is not None else os.cpu_count() or 1
+        if workers < 1:
+            raise ValueError("The number of workers must be positive.")
+        rows = items.shape[0]
+        # By default each worker gets about four bands, so a slow band does not leave the other workers idle.
+        block_rows = block_rows if block_rows is not None else max(1, -(-rows // (workers * 4)))
+        if block_rows < 1:
+            raise ValueError("The number of rows per block must be positive.")
+
+        bands = [(start, min(start + block_rows, rows)) for start in range(0, rows, block_rows)]
+        if len(bands) <= 1 or workers == 1 or items.size == 0:
+            for start, stop in bands:
+                _map_band(fn, items, start, stop)
+            return
+
+        segment = shared_memory.SharedMemory(create = True, size = items.nbytes)
+        shared = np.ndarray(items.shape, dtype = items.dtype, buffer = segment.buf)
+        try:
+            shared[...] = items
+            with ProcessPoolExecutor(max_workers = min(workers, len(bands))) as pool:
+                futures = [pool.submit(_map_shared_band, fn, segment.name, items.shape, items.dtype.str, start, stop)
+                           for start, stop in bands]
+                for future in futures:
+                    future.result()
+            items[...] = shared
+        finally:
+            # The buffer can only be released once no NumPy array refers to it any more.
+            del shared
+            segment.close()
+            segment.unlink()
+
+    def __reduce(self, operation: Callable[..., Any], axis: int | None, allow_empty: bool = False) -> Any:
+        # Only operations with an identity (sum) are defined on an empty grid; min, max and mean raise.
+        if axis not in (None, 0, 1):
+            raise ValueError("The axis must be None, 0 (columns) or 1 (rows).")
+        if self.__items.size == 0 and not allow_empty:
+            raise ValueError("The array is empty.")
+        result = operation(self.__items, axis = axis)
+        if isinstance(result, np.ndarray):
+            return Array.from_numpy(result, data_type_for(result.dtype))
+        return result.item() if isinstance(result, np.generic) else result
+
+    @staticmethod
+    def __wrap(items: NDArray, data_type: type, owned: bool = False) -> Array2D:
+        # Build an Array2D over a 2-D NumPy array without checking or copying it. owned says whether the grid is
+        # the only user of the array (a new allocation) or shares it (a view of another grid, a given array or buffer).
+        grid = Array2D[T](data_type = data_type)
+        grid.__buffer = items
+        grid.__items = items
+        grid.__owns_buffer = owned
+        return grid
+
+    def __getitem__(self, index: int | slice | tuple[int | slice, int | slice]) -> Any:
+        # grid[r, c] reads one item directly from the 2-D buffer, without building a Row. Any slice makes a view:
+        # grid[r0:r1] and grid[r0:r1, c0:c1] are Array2D views and grid[r, c0:c1] / grid[r0:r1, c] are Array views,
+        # all sharing the grid's buffer so writes through them change the grid. Inserting, deleting or resizing
+        # a view first gives it a buffer of its own, so that never changes the grid.
+        if isinstance(index, tuple):
+            if len(index) != 2:
+                raise IndexError("An Array2D is indexed by a row and a column.")
+            row_index, column_index = index
+            if isinstance(row_index, (int, np.integer)) and isinstance(column_index, (int, np.integer)):
+                self.__check_cell(row_index, column_index)
+                return self.__items.item(row_index, column_index)
+            return self.__select(row_index, column_index)
+
+        if isinstance(index, slice):
+            return Array2D.__wrap(self.__items[index], self.__data_type)
+
+        if not isinstance(index, (int, np.integer)):
+            raise TypeError("This index type is invalid.")
+
+        if not (0 <= index < len(self.__items)):
+            raise IndexError(f"Row index {index} out of bounds.")
+        return Array2D.Row(index, self.__items[index], self.__items.shape[1], self.__data_type, self)
+
+    def __setitem__(self, index: tuple[int, int], value: T) -> None:
+        if not isinstance(index, tuple) or len(index) != 2:
+            raise TypeError("Items are set with grid[row, column] = value.")
+
+        row_index, column_index = index
+        if not isinstance(row_index, (int, np.integer)) or not isinstance(column_index, (int, np.integer)):
+            raise TypeError("Items are set with grid[row, column] = value.")
+        self.__check_cell(row_index, column_index)
+        if not isinstance(value, self.__data_type):
+            raise TypeError(f"Value must be of type {self.__data_type}.")
+        try:
+            self.__items[row_index, column_index] = value
+        except OverflowError:
+            self.__store((row_index, slice(column_index, column_index + 1)), [value])
+
+    def column(self, column_index: int) -> Array[T]:
+        """ Return the items of a column as an Array view of the grid's buffer, so writes through it change the grid.
+            Changing the view's length (del, pop, retain, ...) first gives it its own copy and leaves the grid alone. """
+        if not isinstance(column_index, (int, np.integer)):
+            raise TypeError("The column index must be an integer.")
+        if not (0 <= column_index < self.__items.shape[1]):
+            raise IndexError(f"The column index {column_index} is out of bounds.")
+        return self.__array_view(self.__items[:, column_index])
+
+    @property
+    def capacity(self) -> tuple[int, int]:
+        return self.__buffer.shape
+
+    def append_row(self, row: Sequence[T]) -> None:
+        """ Add a row after the last row. Row capacity doubles when it runs out, so appending is amortized
+            O(columns). A grid with no columns takes its number of columns from the first row added. """
+        self.insert_row(self.__items.shape[0], row)
+
+    def insert_row(self, index: int, row: Sequence[T]) -> None:
+        """ Insert a row before index (0 <= index <= rows), moving the rows below it down by one. """
+        rows, cols = self.__items.shape
+        if not (0 <= index <= rows):
+            raise IndexError(f"Row index {index} out of bounds.")
+        if rows == 0 and cols == 0 and isinstance(row, Sequence):
+            cols = len(row)
+        values = self.__validated(row, cols)
+
+        self.__detach()
+        self.__reserve(rows + 1, cols)
+        self.__buffer[index + 1:rows + 1, :cols] = self.__buffer[index:rows, :cols]
+        self.__items = self.__buffer[:rows + 1, :cols]
+        self.__store((index, slice(None)), values)
+
+    def append_column(self, column: Sequence[T]) -> None:
+        """ Add a column after the last column. Column capacity doubles when it runs out, so appending is
+            amortized O(rows). """
+        self.insert_column(self.__items.shape[1], column)
+
+    def insert_column(self, index: int, column: Sequence[T]) -> None:
+        """ Insert a column before index (0 <= index <= columns), moving the columns to its right over by one. """
+        rows, cols = self.__items.shape
+        if not (0 <= index <= cols):
+            raise IndexError(f"The column index {index} is out of bounds.")
+        values = self.__validated(column, rows)
+
+        self.__detach()
+        self.__reserve(rows, cols + 1)
+        self.__buffer[:rows, index + 1:cols + 1] = self.__buffer[:rows, index:cols]
+        self.__items = self.__buffer[:rows, :cols + 1]
+        self.__store((slice(None), index), values)
+
+    def delete_row(self, index: int) -> None:
+        """ Remove the row at index, moving the rows below it up by one. The capacity is kept. """
+        rows, cols = self.__items.shape
+        if not (0 <= index < rows):
+            raise IndexError(f"Row index {index} out of bounds.")
+        self.__detach()
+        self.__buffer[index:rows - 1, :cols] = self.__buffer[index + 1:rows, :cols]
+        self.__release((rows - 1, slice(0, cols)))
+        self.__items = self.__buffer[:rows - 1, :cols]
+
+    def delete_column(self, index: int) -> None:
+        """ Remove the column at index, moving the columns to its right over by one. The capacity is kept. """
+        rows, cols = self.__items.shape
+        if not (0 <= index < cols):
+            raise IndexError(f"The column index {index} is out of bounds.")
+        self.__detach()
+        self.__buffer[:rows, index:cols - 1] = self.__buffer[:rows, index + 1:cols]
+        self.__release((slice(0, rows), cols - 1))
+        self.__items = self.__buffer[:rows, :cols - 1]
+
+    def resize(self, rows: int, cols: int) -> None:
+        """ Change the shape to rows x cols, keeping the items that still fit. New cells are set the way empty()
+            sets them: zero for numeric types and data_type() for other types. """
+        if not isinstance(rows, int) or not isinstance(cols, int) or rows < 0 or cols < 0:
+            raise ValueError("The number of rows and columns must be non-negative integers.")
+
+        old_rows, old_cols = self.__items.shape
+        self.__detach()
+        self.__reserve(rows, cols)
+        if cols > old_cols:
+            self.__fill_new((slice(0, min(rows, old_rows)), slice(old_cols, cols)))
+        if rows > old_rows:
+            self.__fill_new((slice(old_rows, rows), slice(0, cols)))
+        if rows < old_rows:
+            self.__release((slice(rows, old_rows), slice(0, old_cols)))
+        if cols < old_cols:
+            self.__release((slice(0, min(rows, old_rows)), slice(cols, old_cols)))
+        self.__items = self.__buffer[:rows, :cols]
+
+    def shrink_to_fit(self) -> None:
+        """ Release the spare capacity so the buffer holds exactly the live rows and columns. """
+        if self.__buffer.shape != self.__items.shape:
+            self.__buffer = self.__items.copy()
+            self.__items = self.__buffer
+            self.__owns_buffer = True
+
+    def __detach(self) -> None:
+        # A view of another grid (or a grid over a NumPy array or buffer it was given) shares its memory, so it
+        # takes its own copy before an operation that shifts or clears cells in place.
+        if not self.__owns_buffer:
+            self.__buffer = self.__items.copy()
+            self.__items = self.__buffer
+            self.__owns_buffer = True
+
+    def __reserve(self, rows: int, cols: int) -> None:
+        # Reallocate (doubling the dimension that ran out) when rows x cols does not fit in the buffer.
+        # Views handed out earlier (rows, columns, to_numpy) keep the old buffer once this happens.
+        capacity_rows, capacity_cols = self.__buffer.shape
+        if rows <= capacity_rows and cols <= capacity_cols:
+            return
+        new_rows = max(rows, 2 * capacity_rows if rows > capacity_rows else capacity_rows, 1)
+        new_cols = max(cols, 2 * capacity_cols if cols > capacity_cols else capacity_cols, 1)
+        buffer = np.empty((new_rows, new_cols), dtype = self.__buffer.dtype)
+        live_rows, live_cols = self.__items.shape
+        buffer[:live_rows, :live_cols] = self.__items
+        self.__buffer = buffer
+        self.__items = buffer[:live_rows, :live_cols]
+        self.__owns_buffer = True
+
+    def __validated(self, values: Sequence[T] | NDArray | Array, length: int) -> NDArray | list[T]:
+        # A new row or column: a NumPy array (or Array) that safely casts to the native dtype is used as is,
+        # anything else must be a sequence of data_type items.
+        if isinstance(values, Array):
+            values = values.to_numpy()
+        if isinstance(values, np.ndarray) and values.dtype != object and np.can_cast(values.dtype, self.__buffer.dtype, 'safe'):
+            if values.shape != (length,):
+                raise ValueError(f"Expected {length} items, got {len(values)}.")
+            return values
+        if not isinstance(values, (Sequence, np.ndarray)) or isinstance(values, str):
+            raise ValueError("must be a sequence")
+        if len(values) != length:
+            raise ValueError(f"Expected {length} items, got {len(values)}.")
+        if not all(isinstance(item, self.__data_type) for item in values):
+            raise TypeError(f"Value must be of type {self.__data_type}.")
+        return list(values)
+
+    def __store(self, region: tuple[int | slice, int | slice], values: NDArray | list[T]) -> None:
+        # A value that does not fit the native dtype (an int wider than 64 bits) moves the grid to object storage.
+        if self.__buffer.dtype != object:
+            try:
+                self.__items[region] = values
+                return
+            except OverflowError:
+                self.__promote()
+        self.__items[region] = np.fromiter(values, dtype = object, count = len(values))
+
+    def __promote(self) -> None:
+        self.__buffer = self.__buffer.astype(object)
+        self.__items = self.__buffer[:self.__items.shape[0], :self.__items.shape[1]]
+        self.__owns_buffer = True
+
+    def __release(self, region: tuple[int | slice, int | slice]) -> None:
+        # Drop the references held by vacated object cells so the items can be garbage collected.
+        if self.__buffer.dtype == object:
+            self.__buffer[region] = None
+
+    def __fill_new(self, region: tuple[slice, slice]) -> None:
+        if self.__buffer.dtype != object:
+            self.__buffer[region] = 0
+            return
+        cells = self.__buffer[region]
+        for index in np.ndindex(cells.shape):
+            cells[index] = self.__data_type()
+
+    def __check_cell(self, row_index: int, column_index: int) -> None:
+        if not (0 <= row_index < self.__items.shape[0]):
             raise IndexError(f"Row index {row_index} out of bounds.")
-        return self.__rows[row_index]
-    
+        if not (0 <= column_index < self.__items.shape[1]):
+            raise IndexError(f"The column index {column_index} is out of bounds.")
+
+    def __select(self, row_index: int | slice, column_index: int | slice) -> Array2D[T] | Array[T]:
+        for i, size, name in ((row_index, self.__items.shape[0], 'Row'), (column_index, self.__items.shape[1], 'Column')):
+            if isinstance(i, (int, np.integer)):
+                if not (0 <= i < size):
+                    raise IndexError(f"{name} index {i} out of bounds.")
+            elif not isinstance(i, slice):
+                raise TypeError("This index type is invalid.")
+
+        view = self.__items[row_index, column_index]
+        if view.ndim == 2:
+            return Array2D.__wrap(view, self.__data_type)
+        return self.__array_view(view)
+
+    def __array_view(self, view: NDArray) -> Array[T]:
+        # Ints too wide for int64 live in an object buffer, whose views become object Arrays.
+        data_type = self.__data_type if view.dtype == native_dtype(self.__data_type) else object
+        return Array.from_numpy(view, data_type)
+
     def __iter__(self) -> Iterator[Sequence[T]]:
-        for row_index in range(self.__num_rows):
+        for row_index in range(len(self.__items)):
             yield self[row_index]
-    
+
     def __reversed__(self):
-        for row_index in range(self.__num_rows - 1, -1, -1):
+        for row_index in range(len(self.__items) - 1, -1, -1):
             yield self[row_index]
 
     def __len__(self):
-        return self.__num_rows
-                                  
-    def __str__(self) -> str: 
+        return len(self.__items)
+
+    def __str__(self) -> str:
         return f'[{", ".join(f"{str(row)}" for row in self)}]'
-    
-    def __repr__(self) -> str: 
-        return f'Array2D {self.__num_rows} Rows x {self.__num_columns} Columns, items: {str(self)}'
+
+    def __repr__(self) -> str:
+        return f'Array2D {self.__items.shape[0]} Rows x {self.__items.shape[1]} Columns, items: {str(self)}'
 
 if __name__ == '__main__':
     filename = os.path.basename(__file__)
-    print(f'This is the {filename} file.\nDid you mean to run your tests or program.py file?\nFor tests, run them from the Test Explorer on the left.')
\ No newline at end of file
+    print(f'This is the {filename} file.\nDid you mean to run your tests or program.py file?\nFor tests, run them from the Test Explorer on the left.')
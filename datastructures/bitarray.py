@@ -0,0 +1,239 @@
+# datastructures.bitarray.BitArray
+
+""" This module defines a BitArray class, an Array of bools that packs 8 flags into each byte of its NumPy buffer.
+    It follows the stipulations in iarray.py, and adds whole-array bitwise operators, popcount and find_first_set
+    which work a byte (or more) at a time instead of a flag at a time.
+"""
+
+from __future__ import annotations
+from collections.abc import Sequence
+import os
+from typing import Any, Iterator, overload
+import numpy as np
+from numpy.typing import NDArray
+
+from datastructures.iarray import IArray
+
+
+# The number of set bits in every possible byte value.
+_POPCOUNT = np.array([bin(byte).count('1') for byte in range(256)], dtype = np.uint8)
+
+
+class BitArray(IArray[bool]):
+
+    def __init__(self, starting_sequence: Sequence[bool] = [], data_type: type = bool) -> None:
+        if not isinstance(starting_sequence, Sequence):
+            raise ValueError("This sequence type is not a valid sequence type.")
+
+        if data_type is not bool:
+            raise TypeError("A BitArray can only hold bools.")
+
+        if not all(isinstance(item, (bool, np.bool_)) for item in starting_sequence):
+            raise TypeError("All items in the starting sequence must be bools.")
+
+        self.__load(np.asarray(starting_sequence, dtype = bool))
+
+    @classmethod
+    def from_numpy(cls, bits: NDArray) -> BitArray:
+        """ Build a BitArray from a one-dimensional NumPy array, treating every nonzero entry as True. """
+        if not isinstance(bits, np.ndarray) or bits.ndim != 1:
+            raise ValueError("The array must be a one-dimensional NumPy array.")
+
+        array = cls()
+        array.__load(bits.astype(bool, copy = False))
+        return array
+
+    @classmethod
+    def zeros(cls, bit_count: int) -> BitArray:
+        """ Build a BitArray of bit_count False flags. """
+        array = cls()
+        array.__bytes = np.zeros((bit_count + 7) // 8, dtype = np.uint8)
+        array.__bit_count = bit_count
+        return array
+
+    def to_numpy(self) -> NDArray:
+        """ Return the flags unpacked into a new NumPy bool array. """
+        return np.unpackbits(self.__bytes, count = self.__bit_count, bitorder = 'little').view(bool)
+
+    @property
+    def packed(self) -> NDArray:
+        """ A read-only view of the bytes holding the flags (least significant bit first). """
+        view = self.__bytes[:(self.__bit_count + 7) // 8]
+        view.flags.writeable = False
+        return view
+
+    @property
+    def capacity(self) -> int:
+        return len(self.__bytes) * 8
+
+    @overload
+    def __getitem__(self, index: int) -> bool: ...
+    @overload
+    def __getitem__(self, index: slice) -> Sequence[bool]: ...
+    def __getitem__(self, index: int | slice) -> bool | Sequence[bool]:
+        if isinstance(index, slice):
+            return BitArray.from_numpy(self.to_numpy()[index])
+        elif isinstance(index, int):
+            if index < 0 or index >= self.__bit_count:
+                raise IndexError("The index is out of range.")
+            return bool((self.__bytes[index >> 3] >> (index & 7)) & 1)
+        else:
+            raise TypeError("This index type is invalid.")
+
+    def __setitem__(self, index: int, value: bool) -> None:
+        if not isinstance(index, int):
+            raise TypeError("The index must be an integer.")
+
+        if index < 0 or index >= self.__bit_count:
+            raise IndexError("The index is out of range.")
+
+        if not isinstance(value, (bool, np.bool_)):
+            raise TypeError("The value must be a bool.")
+
+        self.__set_bit(index, value)
+
+    def append(self, data: bool) -> None:
+        if not isinstance(data, (bool, np.bool_)):
+            raise TypeError("The value must be a bool.")
+
+        if self.__bit_count == len(self.__bytes) * 8:
+            self.__resize(max(1, 2 * len(self.__bytes)))
+        self.__bit_count += 1
+        self.__set_bit(self.__bit_count - 1, data)
+
+    def append_front(self, data: bool) -> None:
+        # Every flag moves by one bit, so this repacks the whole BitArray (O(n / 8) vectorized).
+        if not isinstance(data, (bool, np.bool_)):
+            raise TypeError("The value must be a bool.")
+
+        self.__load(np.concatenate(([bool(data)], self.to_numpy())))
+
+    def pop(self) -> bool:
+        if self.__bit_count == 0:
+            raise IndexError("The array is empty, you cannot remove anything.")
+
+        item = self[self.__bit_count - 1]
+        self.__set_bit(self.__bit_count - 1, False)
+        self.__bit_count -= 1
+        if len(self.__bytes) > 1 and (self.__bit_count + 7) // 8 <= len(self.__bytes) // 4:
+            self.__resize(len(self.__bytes) // 2)
+        return item
+
+    def pop_front(self) -> bool:
+        if self.__bit_count == 0:
+            raise IndexError("The array is empty, you cannot remove anything.")
+
+        item = self[0]
+        self.__load(self.to_numpy()[1:])
+        return item
+
+    def popcount(self) -> int:
+        """ Return the number of True flags. """
+        return int(_POPCOUNT[self.__bytes].sum(dtype = np.int64))
+
+    def count(self, value: Any) -> int:
+        if not isinstance(value, (bool, np.bool_, int)) or value not in (0, 1):
+            return 0
+        set_bits = self.popcount()
+        return set_bits if value else self.__bit_count - set_bits
+
+    def find_first_set(self) -> int:
+        """ Return the index of the first True flag, or -1 if there is none. """
+        nonzero = np.flatnonzero(self.__bytes)
+        if len(nonzero) == 0:
+            return -1
+        byte_index = int(nonzero[0])
+        byte = int(self.__bytes[byte_index])
+        return byte_index * 8 + (byte & -byte).bit_length() - 1
+
+    def __and__(self, other: BitArray) -> BitArray:
+        return self.__combine(other, np.bitwise_and)
+
+    def __or__(self, other: BitArray) -> BitArray:
+        return self.__combine(other, np.bitwise_or)
+
+    def __xor__(self, other: BitArray) -> BitArray:
+        return self.__combine(other, np.bitwise_xor)
+
+    def __invert__(self) -> BitArray:
+        result = BitArray.zeros(self.__bit_count)
+        np.invert(self.__bytes[:len(result.__bytes)], out = result.__bytes)
+        result.__clear_tail()
+        return result
+
+    def __len__(self) -> int:
+        return self.__bit_count
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, BitArray):
+            return False
+
+        if self.__bit_count != other.__bit_count:
+            return False
+
+        used = (self.__bit_count + 7) // 8
+        return bool(np.array_equal(self.__bytes[:used], other.__bytes[:used]))
+
+    def __iter__(self) -> Iterator[bool]:
+        return iter(self.to_numpy().tolist())
+
+    def __reversed__(self) -> Iterator[bool]:
+        return iter(self.to_numpy()[::-1].tolist())
+
+    def __delitem__(self, index: int) -> None:
+        if not (0 <= index < self.__bit_count):
+            raise IndexError("The index is out of range.")
+
+        self.__load(np.delete(self.to_numpy(), index))
+
+    def __contains__(self, item: Any) -> bool:
+        return self.count(item) > 0
+
+    def clear(self) -> None:
+        self.__bytes = np.zeros(0, dtype = np.uint8)
+        self.__bit_count = 0
+
+    def __str__(self) -> str:
+        return '[' + ', '.join(str(item) for item in self) + ']'
+
+    def __repr__(self) -> str:
+        return f'BitArray {self.__str__()}, Logical: {self.__bit_count}, Physical: {self.capacity}, type: {bool}'
+
+    def __load(self, bits: NDArray) -> None:
+        self.__bytes = np.packbits(bits, bitorder = 'little')
+        self.__bit_count = len(bits)
+
+    def __set_bit(self, index: int, value: bool) -> None:
+        if value:
+            self.__bytes[index >> 3] |= np.uint8(1 << (index & 7))
+        else:
+            self.__bytes[index >> 3] &= np.uint8(~(1 << (index & 7)) & 0xFF)
+
+    def __resize(self, byte_count: int) -> None:
+        new_bytes = np.zeros(byte_count, dtype = np.uint8)
+        used = min(byte_count, (self.__bit_count + 7) // 8)
+        new_bytes[:used] = self.__bytes[:used]
+        self.__bytes = new_bytes
+
+    def __clear_tail(self) -> None:
+        # Bits past the logical size are kept at zero so that popcount and the bitwise operators can work on whole bytes.
+        self.__bytes[(self.__bit_count + 7) // 8:] = 0
+        if self.__bit_count % 8:
+            self.__bytes[self.__bit_count // 8] &= np.uint8((1 << (self.__bit_count % 8)) - 1)
+
+    def __combine(self, other: BitArray, operation: np.ufunc) -> BitArray:
+        if not isinstance(other, BitArray):
+            return NotImplemented
+
+        if self.__bit_count != other.__bit_count:
+            raise ValueError("Both BitArrays must have the same length.")
+
+        result = BitArray.zeros(self.__bit_count)
+        used = len(result.__bytes)
+        operation(self.__bytes[:used], other.__bytes[:used], out = result.__bytes)
+        return result
+
+
+if __name__ == '__main__':
+    filename = os.path.basename(__file__)
+    print(f'This is the {filename} file.\nDid you mean to run your tests or program.py file?\nFor tests, run them from the Test Explorer on the left.')
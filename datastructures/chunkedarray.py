@@ -0,0 +1,416 @@
+# datastructures.chunkedarray.ChunkedArray
+
+""" This module defines a ChunkedArray class, a one-dimensional array stored as a sequence of fixed-size NumPy blocks.
+    It follows the stipulations in iarray.py and adds insert, slice deletion and slice assignment (splicing).
+    A Fenwick (binary indexed) tree over the block lengths finds the block holding an index in O(log n), and an insert
+    or delete only shifts the items of one block, so editing the middle of a long sequence costs O(log n + block size)
+    instead of the O(n) shift of an Array.
+"""
+
+from __future__ import annotations
+from collections.abc import Sequence
+import numbers
+import os
+from typing import Any, Iterator, overload
+import numpy as np
+from numpy.typing import NDArray
+
+from datastructures.array import COPY_POLICIES, native_dtype
+from datastructures.iarray import IArray, T
+
+
+class ChunkedArray(IArray[T]):
+
+    BLOCK_SIZE = 1024
+
+    def __init__(self, starting_sequence: Sequence[T] = [], data_type: type = object, copy_policy: str = 'deep', block_size: int = BLOCK_SIZE) -> None:
+        if copy_policy not in COPY_POLICIES:
+            raise ValueError(f"The copy policy must be one of {', '.join(COPY_POLICIES)}.")
+
+        if not isinstance(starting_sequence, Sequence):
+            raise ValueError("This sequence type is not a valid sequence type.")
+
+        if not isinstance(data_type, type):
+            raise TypeError("This data type is not a valid data type.")
+
+        if not isinstance(block_size, int) or block_size < 4:
+            raise ValueError("The block size must be an integer of at least 4.")
+
+        self.__data_type = data_type
+        self.__copy_policy = copy_policy
+        self.__block_size = block_size
+        self.__dtype = native_dtype(data_type)
+        self.__blocks: list[NDArray] = []
+        self.__counts: list[int] = []
+        self.__tree: list[int] = [0]
+        self.__item_count = 0
+
+        self.__blocks, self.__counts = self.__chunk(self.__validated(starting_sequence))
+        self.__item_count = sum(self.__counts)
+        self.__rebuild_tree()
+
+    @overload
+    def __getitem__(self, index: int) -> T: ...
+    @overload
+    def __getitem__(self, index: slice) -> Sequence[T]: ...
+    def __getitem__(self, index: int | slice) -> T | Sequence[T]:
+        if isinstance(index, slice):
+            start, stop, step = index.indices(self.__item_count)
+            if step > 0:
+                items = self.__gather(start, max(start, stop))[::step]
+            else:
+                items = self.__gather(stop + 1, start + 1)[::-1][::-step] if start > stop else self.__gather(0, 0)
+            return self.__wrap(items)
+        elif isinstance(index, int):
+            if index < 0 or index >= self.__item_count:
+                raise IndexError("The index is out of range.")
+            block, offset = self.__locate(index)
+            return self.__blocks[block].item(offset)
+        else:
+            raise TypeError("This index type is invalid.")
+
+    def __setitem__(self, index: int | slice, value: T | Sequence[T]) -> None:
+        if isinstance(index, slice):
+            self.__splice(index, value)
+            return
+
+        if not isinstance(index, int):
+            raise TypeError("The index must be an integer.")
+
+        if index < 0 or index >= self.__item_count:
+            raise IndexError("The index is out of range.")
+
+        if not isinstance(value, self.__data_type):
+            raise TypeError("The data type of the value does not match the array.")
+
+        block, offset = self.__locate(index)
+        self.__store(block, offset, value, copy = False)
+
+    def insert(self, index: int, data: T) -> None:
+        """ Insert data before index (0 <= index <= len). Only the block holding index is shifted;
+            a full block is first split in two. """
+        if not isinstance(index, int):
+            raise TypeError("The index must be an integer.")
+
+        if not (0 <= index <= self.__item_count):
+            raise IndexError("The index is out of range.")
+
+        if not isinstance(data, self.__data_type):
+            raise TypeError("This item is not the same type as the array.")
+
+        if not self.__blocks:
+            self.__blocks, self.__counts = [self.__new_block()], [0]
+            self.__rebuild_tree()
+
+        if index == self.__item_count:
+            block, offset = len(self.__blocks) - 1, self.__counts[-1]
+        else:
+            block, offset = self.__locate(index)
+
+        if self.__counts[block] == self.__block_size:
+            if block == len(self.__blocks) - 1 and offset == self.__block_size:
+                self.__blocks.append(self.__new_block())
+                self.__counts.append(0)
+                block, offset = block + 1, 0
+            else:
+                self.__split(block)
+                if offset > self.__counts[block]:
+                    block, offset = block + 1, offset - self.__counts[block]
+            self.__rebuild_tree()
+
+        items, count = self.__blocks[block], self.__counts[block]
+        items[offset + 1:count + 1] = items[offset:count]
+        self.__counts[block] += 1
+        self.__item_count += 1
+        self.__add_to_tree(block, 1)
+        self.__store(block, offset, data, copy = True)
+
+    def append(self, data: T) -> None:
+        self.insert(self.__item_count, data)
+
+    def append_front(self, data: T) -> None:
+        self.insert(0, data)
+
+    def pop(self) -> T:
+        if self.__item_count == 0:
+            raise IndexError("The array is empty, you cannot remove anything.")
+
+        item = self[self.__item_count - 1]
+        del self[self.__item_count - 1]
+        return item
+
+    def pop_front(self) -> T:
+        if self.__item_count == 0:
+            raise IndexError("The array is empty, you cannot remove anything.")
+
+        item = self[0]
+        del self[0]
+        return item
+
+    def to_numpy(self) -> NDArray:
+        """ Return the items as one new contiguous NumPy array. """
+        return self.__gather(0, self.__item_count)
+
+    @property
+    def block_count(self) -> int:
+        return len(self.__blocks)
+
+    @property
+    def dtype(self) -> np.dtype:
+        return self.__dtype
+
+    def __len__(self) -> int:
+        return self.__item_count
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, ChunkedArray):
+            return False
+
+        if self.__item_count != other.__item_count:
+            return False
+
+        items, other_items = self.to_numpy(), other.to_numpy()
+        if items.dtype != object and other_items.dtype != object:
+            return bool(np.array_equal(items, other_items))
+        return all(item == other_item for item, other_item in zip(items, other_items))
+
+    def __iter__(self) -> Iterator[T]:
+        for items, count in zip(self.__blocks, self.__counts):
+            yield from items[:count].tolist() if items.dtype != object else items[:count]
+
+    def __reversed__(self) -> Iterator[T]:
+        for items, count in zip(reversed(self.__blocks), reversed(self.__counts)):
+            if count == 0:
+                continue
+            yield from items[count - 1::-1].tolist() if items.dtype != object else items[count - 1::-1]
+
+    def __delitem__(self, index: int | slice) -> None:
+        if isinstance(index, slice):
+            self.__splice(index, None)
+            return
+
+        if not isinstance(index, int):
+            raise TypeError("This index type is invalid.")
+
+        if not (0 <= index < self.__item_count):
+            raise IndexError("The index is out of range.")
+
+        block, offset = self.__locate(index)
+        items, count = self.__blocks[block], self.__counts[block]
+        items[offset:count - 1] = items[offset + 1:count]
+        if items.dtype == object:
+            items[count - 1] = None
+        self.__counts[block] -= 1
+        self.__item_count -= 1
+
+        if self.__merge(block):
+            self.__rebuild_tree()
+        else:
+            self.__add_to_tree(block, -1)
+
+    def __contains__(self, item: Any) -> bool:
+        if self.__dtype != object and not isinstance(item, (numbers.Number, np.generic)):
+            return False
+        for items, count in zip(self.__blocks, self.__counts):
+            live = items[:count]
+            if self.__dtype == object and isinstance(item, (Sequence, np.ndarray)) and not isinstance(item, str):
+                if any(bool(element == item) for element in live):
+                    return True
+            elif np.asarray(live == item, dtype = bool).any():
+                return True
+        return False
+
+    def clear(self) -> None:
+        self.__blocks, self.__counts = [], []
+        self.__item_count = 0
+        self.__rebuild_tree()
+
+    def __str__(self) -> str:
+        return '[' + ', '.join(str(item) for item in self) + ']'
+
+    def __repr__(self) -> str:
+        return f'ChunkedArray {self.__str__()}, Logical: {self.__item_count}, Blocks: {len(self.__blocks)}, type: {self.__data_type}'
+
+    def __validated(self, items: Sequence[T]) -> NDArray:
+        # Type check and copy (per the copy policy) a sequence of new items into one NumPy array.
+        if not all(isinstance(item, self.__data_type) for item in items):
+            raise TypeError("All items must be the same type as the array.")
+
+        if self.__dtype != object:
+            try:
+                return np.array(items, dtype = self.__dtype)
+            except OverflowError:
+                self.__promote()
+        copier = COPY_POLICIES[self.__copy_policy]
+        source = items if copier is None else (copier(item) for item in items)
+        return np.fromiter(source, dtype = object, count = len(items))
+
+    def __store(self, block: int, offset: int, value: T, copy: bool) -> None:
+        if self.__dtype != object:
+            try:
+                self.__blocks[block][offset] = value
+                return
+            except OverflowError:
+                self.__promote()
+        copier = COPY_POLICIES[self.__copy_policy] if copy else None
+        self.__blocks[block][offset] = copier(value) if copier else value
+
+    def __promote(self) -> None:
+        # A value that does not fit the native dtype moves every block over to object storage, as Array does.
+        self.__dtype = np.dtype(object)
+        self.__blocks = [items.astype(object) for items in self.__blocks]
+
+    def __new_block(self) -> NDArray:
+        return np.empty(self.__block_size, dtype = self.__dtype)
+
+    def __chunk(self, items: NDArray) -> tuple[list[NDArray], list[int]]:
+        # Blocks are filled to 3/4 so that inserts have room before a block has to split.
+        fill = self.__block_size - self.__block_size // 4
+        blocks, counts = [], []
+        for start in range(0, len(items), fill):
+            part = items[start:start + fill]
+            block = self.__new_block()
+            block[:len(part)] = part
+            blocks.append(block)
+            counts.append(len(part))
+        return blocks, counts
+
+    def __wrap(self, items: NDArray) -> ChunkedArray[T]:
+        array = ChunkedArray[T](data_type = self.__data_type, copy_policy = self.__copy_policy, block_size = self.__block_size)
+        array.__dtype = self.__dtype
+        array.__blocks, array.__counts = array.__chunk(items)
+        array.__item_count = len(items)
+        array.__rebuild_tree()
+        return array
+
+    def __gather(self, start: int, stop: int) -> NDArray:
+        # Copy the items in [start, stop) out of the blocks that hold them into one NumPy array.
+        if start >= stop:
+            return np.empty(0, dtype = self.__dtype)
+        first, first_offset = self.__locate(start)
+        last, last_offset = self.__locate(stop - 1)
+        if first == last:
+            return self.__blocks[first][first_offset:last_offset + 1].copy()
+        parts = [self.__blocks[first][first_offset:self.__counts[first]]]
+        parts.extend(self.__blocks[block][:self.__counts[block]] for block in range(first + 1, last))
+        parts.append(self.__blocks[last][:last_offset + 1])
+        return np.concatenate(parts)
+
+    def __splice(self, index: slice, replacement: Sequence[T] | None) -> None:
+        # Replace (or, when replacement is None, delete) the items selected by a slice. Only the blocks
+        # spanning the slice are gathered, edited with NumPy and re-chunked.
+        if replacement is not None and not isinstance(replacement, Sequence):
+            raise TypeError("Only a sequence can be assigned to a slice.")
+        start, stop, step = index.indices(self.__item_count)
+        new_items = self.__validated(replacement) if replacement is not None else None
+
+        positions = np.arange(start, stop, step)
+        if step != 1 and new_items is not None and len(new_items) != len(positions):
+            raise ValueError(f"Attempt to assign a sequence of size {len(new_items)} to an extended slice of size {len(positions)}.")
+
+        if step == 1:
+            low, high = start, max(start, stop)
+        elif len(positions):
+            low, high = int(positions.min()), int(positions.max()) + 1
+        else:
+            return
+
+        first = self.__locate(low)[0] if low < self.__item_count else len(self.__blocks) - 1
+        last = self.__locate(high - 1)[0] if high > low else first
+        if first < 0:
+            self.__blocks, self.__counts = self.__chunk(new_items if new_items is not None else np.empty(0, dtype = self.__dtype))
+            self.__item_count = sum(self.__counts)
+            self.__rebuild_tree()
+            return
+
+        region_start = self.__prefix(first)
+        region = np.concatenate([self.__blocks[block][:self.__counts[block]] for block in range(first, last + 1)])
+        if new_items is not None and region.dtype != new_items.dtype:
+            region = region.astype(object)
+
+        if step == 1:
+            replacement_items = new_items if new_items is not None else region[:0]
+            region = np.concatenate((region[:low - region_start], replacement_items, region[high - region_start:]))
+        elif new_items is None:
+            region = np.delete(region, positions - region_start)
+        else:
+            region[positions - region_start] = new_items
+
+        blocks, counts = self.__chunk(region)
+        self.__blocks[first:last + 1] = blocks
+        self.__counts[first:last + 1] = counts
+        self.__item_count = sum(self.__counts)
+        self.__rebuild_tree()
+
+    def __split(self, block: int) -> None:
+        items, count = self.__blocks[block], self.__counts[block]
+        half = count // 2
+        right = self.__new_block()
+        right[:count - half] = items[half:count]
+        if items.dtype == object:
+            items[half:count] = None
+        self.__blocks.insert(block + 1, right)
+        self.__counts[block] = half
+        self.__counts.insert(block + 1, count - half)
+
+    def __merge(self, block: int) -> bool:
+        # Keep blocks at least 1/4 full: an emptied block is dropped, and a sparse one is merged into a neighbor
+        # with room for it. Returns True when the block layout changed.
+        count = self.__counts[block]
+        if count == 0:
+            del self.__blocks[block]
+            del self.__counts[block]
+            return True
+        if count >= self.__block_size // 4:
+            return False
+        for neighbor in (block - 1, block + 1):
+            if 0 <= neighbor < len(self.__blocks) and self.__counts[neighbor] + count <= self.__block_size // 2:
+                left, right = min(block, neighbor), max(block, neighbor)
+                left_count, right_count = self.__counts[left], self.__counts[right]
+                self.__blocks[left][left_count:left_count + right_count] = self.__blocks[right][:right_count]
+                self.__counts[left] += right_count
+                del self.__blocks[right]
+                del self.__counts[right]
+                return True
+        return False
+
+    def __rebuild_tree(self) -> None:
+        # Build the Fenwick tree over the block lengths in O(number of blocks).
+        tree = [0] + self.__counts
+        for i in range(1, len(tree)):
+            parent = i + (i & -i)
+            if parent < len(tree):
+                tree[parent] += tree[i]
+        self.__tree = tree
+
+    def __add_to_tree(self, block: int, delta: int) -> None:
+        i = block + 1
+        while i < len(self.__tree):
+            self.__tree[i] += delta
+            i += i & -i
+
+    def __prefix(self, block: int) -> int:
+        # The number of items in the blocks before block.
+        total, i = 0, block
+        while i > 0:
+            total += self.__tree[i]
+            i -= i & -i
+        return total
+
+    def __locate(self, index: int) -> tuple[int, int]:
+        # Descend the Fenwick tree to the block holding index; returns (block, offset within the block).
+        tree = self.__tree
+        position, remaining = 0, index
+        step = 1 << (len(tree).bit_length() - 1)
+        while step:
+            following = position + step
+            if following < len(tree) and tree[following] <= remaining:
+                position = following
+                remaining -= tree[following]
+            step >>= 1
+        return position, remaining
+
+
+if __name__ == '__main__':
+    filename = os.path.basename(__file__)
+    print(f'This is the {filename} file.\nDid you mean to run your tests or program.py file?\nFor tests, run them from the Test Explorer on the left.')
@@ -14,8 +14,9 @@ class HashMap(IHashMap[KT, VT]):
         self._size = 0
         self._load_factor = load_factor
         self._hash_function = custom_hash_function or self._default_hash_function
-        self._buckets = Array(
+        self._buckets = Array.from_trusted(
             [LinkedList(tuple) for _ in range(self._capacity)],
+            data_type = LinkedList
         )
 
     def _hash(self, key: KT) -> int:
@@ -24,7 +25,7 @@ class HashMap(IHashMap[KT, VT]):
     def _resize(self):
         old_items = list(self.items())
         self._capacity *= 2
-        self._buckets = Array(
+        self._buckets = Array.from_trusted(
             [LinkedList(tuple) for _ in range(self._capacity)],
             data_type = LinkedList
         )
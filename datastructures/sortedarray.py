@@ -0,0 +1,135 @@
+import bisect
+import numbers
+import os
+from collections.abc import Sequence
+from typing import Any, Iterator, overload
+
+import numpy as np
+
+from datastructures.array import Array
+from datastructures.iarray import T
+
+
+class SortedArray(Sequence[T]):
+    ''' An Array that keeps its items in ascending order. Lookups (in, bisect_left, bisect_right and range)
+        binary search the underlying Array in O(log n): NumPy's searchsorted for native dtypes and the
+        bisect module for objects. Adding or removing an item is one block shift of the Array.
+    '''
+
+    def __init__(self, starting_sequence: Sequence[T] = [], data_type: type = object) -> None:
+        ''' Initializes the SortedArray with the items of starting_sequence in sorted order.
+
+            Examples:
+                >>> numbers = SortedArray([5, 1, 4], data_type=int)
+                >>> print(numbers)
+                [1, 4, 5]
+
+            Arguments:
+                starting_sequence: The items to start with, in any order
+                data_type: The type of the items
+
+            Raises:
+                ValueError: If starting_sequence is not a sequence
+                TypeError: If an item is not of data_type
+        '''
+        self.__array = Array[T](starting_sequence, data_type)
+        self.__array.sort()
+
+    def add(self, item: T) -> None:
+        ''' Adds an item after any equal items already in the SortedArray.
+
+            Examples:
+                >>> numbers = SortedArray([1, 4, 5], data_type=int)
+                >>> numbers.add(3)
+                >>> print(numbers)
+                [1, 3, 4, 5]
+
+            Raises:
+                TypeError: If the item is not of the SortedArray's data type
+        '''
+        self.__array.insert(self.bisect_right(item), item)
+
+    def remove(self, item: T) -> None:
+        ''' Removes the first item equal to item.
+
+            Raises:
+                ValueError: If the item is not in the SortedArray
+        '''
+        index = self.__index_of(item)
+        if index < 0:
+            raise ValueError(f"{item!r} is not in the sorted array.")
+        del self.__array[index]
+
+    def bisect_left(self, item: Any) -> int:
+        ''' Returns the index where item would be inserted before any equal items. '''
+        items = self.__array.to_numpy()
+        if items.dtype != object:
+            return int(np.searchsorted(items, item, side = 'left'))
+        return bisect.bisect_left(self.__array, item)
+
+    def bisect_right(self, item: Any) -> int:
+        ''' Returns the index where item would be inserted after any equal items. '''
+        items = self.__array.to_numpy()
+        if items.dtype != object:
+            return int(np.searchsorted(items, item, side = 'right'))
+        return bisect.bisect_right(self.__array, item)
+
+    def range(self, low: Any, high: Any) -> Array[T]:
+        ''' Returns the items where low <= item < high as a view of the SortedArray.
+
+            Examples:
+                >>> numbers = SortedArray([1, 3, 4, 5, 8], data_type=int)
+                >>> print(numbers.range(3, 6))
+                [3, 4, 5]
+        '''
+        start = self.bisect_left(low)
+        return self.__array[start:max(start, self.bisect_left(high))]
+
+    def clear(self) -> None:
+        self.__array.clear()
+
+    @overload
+    def __getitem__(self, index: int) -> T: ...
+    @overload
+    def __getitem__(self, index: slice) -> Sequence[T]: ...
+    def __getitem__(self, index: int | slice) -> T | Sequence[T]:
+        return self.__array[index]
+
+    def __contains__(self, item: Any) -> bool:
+        return self.__index_of(item) >= 0
+
+    def __index_of(self, item: Any) -> int:
+        # The index of the first item equal to item, or -1. As in Array, a value that cannot be compared
+        # with the items (a non-number for a native dtype, or an unorderable object) is never in it.
+        if self.__array.dtype != object and not isinstance(item, (numbers.Number, np.generic)):
+            return -1
+        try:
+            index = self.bisect_left(item)
+        except (TypeError, OverflowError):
+            return -1
+        return index if index < len(self.__array) and self.__array[index] == item else -1
+
+    def __len__(self) -> int:
+        return len(self.__array)
+
+    def __iter__(self) -> Iterator[T]:
+        return iter(self.__array)
+
+    def __reversed__(self) -> Iterator[T]:
+        return reversed(self.__array)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, SortedArray):
+            return False
+        return self.__array == other.__array
+
+    def __str__(self) -> str:
+        return str(self.__array)
+
+    def __repr__(self) -> str:
+        return f'SortedArray {self.__array}, Logical: {len(self.__array)}, type: {self.__array.dtype}'
+
+
+if __name__ == '__main__':
+    filename = os.path.basename(__file__)
+    print(f'This is the {filename} file.\nDid you mean to run your tests or program.py file?\nFor tests, run them from the Test Explorer on the left.')
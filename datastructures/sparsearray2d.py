@@ -0,0 +1,246 @@
+# datastructures.sparsearray2d.SparseArray2D
+
+""" This module defines a SparseArray2D class, a two-dimensional array for grids that are mostly a default value.
+    It follows the stipulations in iarray2d.py. Only the cells that differ from the default are stored, in a
+    dictionary of keys that makes setting a cell O(1), so memory scales with the number of non-default cells rather
+    than with rows x columns. Compressed sparse row (CSR) and column (CSC) arrays are built on demand (and cached
+    until the next change) to scan the non-default cells of a row or column in order.
+"""
+
+from __future__ import annotations
+from collections.abc import Sequence
+import os
+from typing import Any, Iterator
+import numpy as np
+from numpy.typing import NDArray
+
+from datastructures.array import data_type_for, native_dtype
+from datastructures.array2d import Array2D
+from datastructures.iarray2d import IArray2D, T
+
+
+class SparseArray2D(IArray2D[T]):
+
+    class Row(IArray2D.IRow[T]):
+        def __init__(self, row_index: int, array: SparseArray2D[T], num_columns: int) -> None:
+            self.row_index = row_index
+            self.array = array
+            self.num_columns = num_columns
+
+        def __getitem__(self, column_index: int) -> T:
+            if not (0 <= column_index < self.num_columns):
+                raise IndexError(f"The column index {column_index} is out of bounds.")
+            return self.array[self.row_index, column_index]
+
+        def __setitem__(self, column_index: int, value: T) -> None:
+            if not (0 <= column_index < self.num_columns):
+                raise IndexError(f"The column index {column_index} is out of bounds.")
+            self.array[self.row_index, column_index] = value
+
+        def __iter__(self) -> Iterator[T]:
+            values = [self.array.default] * self.num_columns
+            for column_index, value in self.array.row_items(self.row_index):
+                values[column_index] = value
+            return iter(values)
+
+        def __reversed__(self) -> Iterator[T]:
+            return reversed(list(self))
+
+        def __len__(self) -> int:
+            return self.num_columns
+
+        def __str__(self) -> str:
+            return f"[{', '.join(str(item) for item in self)}]"
+
+        def __repr__(self) -> str:
+            return f'Row {self.row_index}: {str(self)}'
+
+
+    def __init__(self, starting_sequence: Sequence[Sequence[T]]=[[]], data_type=object, default: T | None = None) -> None:
+        if not isinstance(starting_sequence, Sequence) or any(not isinstance(row, Sequence) for row in starting_sequence):
+            raise ValueError("must be a sequence of sequences")
+
+        if isinstance(starting_sequence, str):
+            raise ValueError("must be a sequence of sequences")
+
+        if any(not isinstance(item, data_type) for row in starting_sequence for item in row):
+            raise ValueError("All items must be of the same type")
+
+        num_columns = len(starting_sequence[0]) if starting_sequence else 0
+        if any(len(row) != num_columns for row in starting_sequence):
+            raise ValueError("must be a sequence of sequences with the same length")
+
+        default = default if default is not None else data_type()
+        if not isinstance(default, data_type):
+            raise TypeError(f"The default must be of type {data_type}.")
+
+        self.__num_rows = len(starting_sequence)
+        self.__num_columns = num_columns
+        self.__data_type = data_type
+        self.__default = default
+        self.__cells: dict[tuple[int, int], T] = {
+            (row_index, column_index): item
+            for row_index, row in enumerate(starting_sequence)
+            for column_index, item in enumerate(row)
+            if item != default
+        }
+        self.__csr: tuple[NDArray, NDArray, NDArray] | None = None
+        self.__csc: tuple[NDArray, NDArray, NDArray] | None = None
+
+    @staticmethod
+    def empty(rows: int=0, cols: int=0, data_type: type=object, default: Any = None) -> SparseArray2D:
+        grid = SparseArray2D[T](data_type = data_type, default = default)
+        grid.__num_rows, grid.__num_columns = rows, cols
+        return grid
+
+    @staticmethod
+    def from_numpy(array: NDArray, default: Any = None) -> SparseArray2D:
+        """ Create a SparseArray2D holding the cells of a 2-D NumPy array that differ from default (zero when not given).
+            The non-default cells are found with one vectorized comparison. """
+        if not isinstance(array, np.ndarray) or array.ndim != 2:
+            raise ValueError("The array must be a two-dimensional NumPy array.")
+
+        grid = SparseArray2D.empty(array.shape[0], array.shape[1], data_type_for(array.dtype), default)
+        rows, columns = np.nonzero(array != grid.__default)
+        grid.__cells = dict(zip(zip(rows.tolist(), columns.tolist()), array[rows, columns].tolist()))
+        return grid
+
+    def to_array2d(self) -> Array2D[T]:
+        """ Return a dense Array2D with the same items. """
+        dense = Array2D.full(self.__num_rows, self.__num_columns, self.__default, self.__data_type)
+        for (row_index, column_index), value in self.__cells.items():
+            dense[row_index, column_index] = value
+        return dense
+
+    @property
+    def default(self) -> T:
+        return self.__default
+
+    @property
+    def shape(self) -> tuple[int, int]:
+        return self.__num_rows, self.__num_columns
+
+    @property
+    def nnz(self) -> int:
+        """ The number of cells that hold something other than the default. """
+        return len(self.__cells)
+
+    def items(self) -> Iterator[tuple[tuple[int, int], T]]:
+        """ Iterate over ((row, column), value) for the non-default cells, in row-major order. """
+        values, columns, offsets = self.to_csr()
+        rows = np.repeat(np.arange(self.__num_rows), np.diff(offsets))
+        return zip(zip(rows.tolist(), columns.tolist()), self.__list(values))
+
+    def row_items(self, row_index: int) -> Iterator[tuple[int, T]]:
+        """ Iterate over (column, value) for the non-default cells of a row, in column order. """
+        if not (0 <= row_index < self.__num_rows):
+            raise IndexError(f"Row index {row_index} out of bounds.")
+        values, columns, offsets = self.to_csr()
+        start, stop = offsets[row_index], offsets[row_index + 1]
+        return zip(columns[start:stop].tolist(), self.__list(values[start:stop]))
+
+    def column_items(self, column_index: int) -> Iterator[tuple[int, T]]:
+        """ Iterate over (row, value) for the non-default cells of a column, in row order. """
+        if not (0 <= column_index < self.__num_columns):
+            raise IndexError(f"The column index {column_index} is out of bounds.")
+        values, rows, offsets = self.to_csc()
+        start, stop = offsets[column_index], offsets[column_index + 1]
+        return zip(rows[start:stop].tolist(), self.__list(values[start:stop]))
+
+    def to_csr(self) -> tuple[NDArray, NDArray, NDArray]:
+        """ Return the non-default cells in compressed sparse row form: (values, column indices, row offsets),
+            where the cells of row r are values[offsets[r]:offsets[r + 1]]. The arrays are read-only and cached
+            until the next change. """
+        if self.__csr is None:
+            self.__csr = self.__compress(major = 0)
+        return self.__csr
+
+    def to_csc(self) -> tuple[NDArray, NDArray, NDArray]:
+        """ Return the non-default cells in compressed sparse column form: (values, row indices, column offsets). """
+        if self.__csc is None:
+            self.__csc = self.__compress(major = 1)
+        return self.__csc
+
+    def __compress(self, major: int) -> tuple[NDArray, NDArray, NDArray]:
+        count = len(self.__cells)
+        keys = np.fromiter((index for key in self.__cells for index in key), dtype = np.int64, count = 2 * count).reshape(count, 2)
+        order = np.lexsort((keys[:, 1 - major], keys[:, major]))
+        values = self.__values(list(self.__cells.values()))[order]
+        minors = keys[order, 1 - major]
+        size = self.__num_rows if major == 0 else self.__num_columns
+        offsets = np.zeros(size + 1, dtype = np.int64)
+        np.cumsum(np.bincount(keys[:, major], minlength = size), out = offsets[1:])
+        for array in (values, minors, offsets):
+            array.flags.writeable = False
+        return values, minors, offsets
+
+    def __values(self, values: list[T]) -> NDArray:
+        dtype = native_dtype(self.__data_type)
+        if dtype != object:
+            try:
+                return np.array(values, dtype = dtype)
+            except OverflowError:
+                pass
+        return np.fromiter(values, dtype = object, count = len(values))
+
+    @staticmethod
+    def __list(values: NDArray) -> list[Any]:
+        return values.tolist() if values.dtype != object else list(values)
+
+    def __getitem__(self, index: int | tuple[int, int]) -> Any:
+        if isinstance(index, tuple):
+            row_index, column_index = index
+            self.__check_cell(row_index, column_index)
+            return self.__cells.get((row_index, column_index), self.__default)
+
+        if not isinstance(index, int):
+            raise TypeError("This index type is invalid.")
+        if not (0 <= index < self.__num_rows):
+            raise IndexError(f"Row index {index} out of bounds.")
+        return SparseArray2D.Row(index, self, self.__num_columns)
+
+    def __setitem__(self, index: tuple[int, int], value: T) -> None:
+        if not isinstance(index, tuple) or len(index) != 2:
+            raise TypeError("Items are set with grid[row, column] = value.")
+
+        row_index, column_index = index
+        self.__check_cell(row_index, column_index)
+        if not isinstance(value, self.__data_type):
+            raise TypeError(f"Value must be of type {self.__data_type}.")
+
+        # Setting a cell back to the default removes it, so only non-default cells are ever stored.
+        if value == self.__default:
+            self.__cells.pop((row_index, column_index), None)
+        else:
+            self.__cells[(row_index, column_index)] = value
+        self.__csr = self.__csc = None
+
+    def __check_cell(self, row_index: int, column_index: int) -> None:
+        if not isinstance(row_index, int) or not isinstance(column_index, int):
+            raise TypeError("The row and column indices must be integers.")
+        if not (0 <= row_index < self.__num_rows):
+            raise IndexError(f"Row index {row_index} out of bounds.")
+        if not (0 <= column_index < self.__num_columns):
+            raise IndexError(f"The column index {column_index} is out of bounds.")
+
+    def __iter__(self) -> Iterator[Sequence[T]]:
+        for row_index in range(self.__num_rows):
+            yield self[row_index]
+
+    def __reversed__(self) -> Iterator[Sequence[T]]:
+        for row_index in range(self.__num_rows - 1, -1, -1):
+            yield self[row_index]
+
+    def __len__(self) -> int:
+        return self.__num_rows
+
+    def __str__(self) -> str:
+        return f'[{", ".join(f"{str(row)}" for row in self)}]'
+
+    def __repr__(self) -> str:
+        return f'SparseArray2D {self.__num_rows} Rows x {self.__num_columns} Columns, non-default items: {len(self.__cells)}, default: {self.__default!r}'
+
+
+if __name__ == '__main__':
+    filename = os.path.basename(__file__)
+    print(f'This is the {filename} file.\nDid you mean to run your tests or program.py file?\nFor tests, run them from the Test Explorer on the left.')
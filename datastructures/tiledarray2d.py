@@ -0,0 +1,340 @@
+# datastructures.tiledarray2d.TiledArray2D
+
+""" This module defines a TiledArray2D class, a two-dimensional array whose items live in a memory-mapped file
+    instead of in memory, for grids larger than RAM. It follows the stipulations in iarray2d.py.
+    The grid is cut into fixed-size tiles (256 x 256 by default) stored one after another in the file. Reads come straight
+    from the memory-mapped file. A tile that is written to is copied into memory, where a bounded number of tiles is kept
+    in least-recently-used order; it is marked dirty and written back to the file when it is evicted or on flush().
+    Only bool, int, float and complex items are supported.
+"""
+
+from __future__ import annotations
+from collections import OrderedDict
+from collections.abc import Sequence
+import os
+import struct
+import tempfile
+from typing import Any, Iterator
+import weakref
+import numpy as np
+from numpy.typing import NDArray
+
+from datastructures.array import data_type_for, native_dtype
+from datastructures.iarray2d import IArray2D, T
+
+
+class TiledArray2D(IArray2D[T]):
+    """ A file of tiles: a 64 byte header (magic, dtype, rows, columns and tile shape) followed by the tiles in
+        row-major tile order, each tile_rows x tile_columns items in row-major order. Edge tiles are stored full size. """
+
+    MAGIC = b'TILEDA2D'
+    HEADER = struct.Struct('<8s16sQQQQ')
+    HEADER_SIZE = 64
+    TILE_SHAPE = (256, 256)
+    CACHE_TILES = 64
+
+    class Row(IArray2D.IRow[T]):
+        def __init__(self, row_index: int, array: TiledArray2D[T], num_columns: int) -> None:
+            self.row_index = row_index
+            self.array = array
+            self.num_columns = num_columns
+
+        def __getitem__(self, column_index: int) -> T:
+            if not (0 <= column_index < self.num_columns):
+                raise IndexError(f"The column index {column_index} is out of bounds.")
+            return self.array[self.row_index, column_index]
+
+        def __setitem__(self, column_index: int, value: T) -> None:
+            if not (0 <= column_index < self.num_columns):
+                raise IndexError(f"The column index {column_index} is out of bounds.")
+            self.array[self.row_index, column_index] = value
+
+        def __iter__(self) -> Iterator[T]:
+            return iter(self.array.read_block(self.row_index, self.row_index + 1, 0, self.num_columns)[0].tolist())
+
+        def __reversed__(self) -> Iterator[T]:
+            return reversed(list(self))
+
+        def __len__(self) -> int:
+            return self.num_columns
+
+        def __str__(self) -> str:
+            return f"[{', '.join(str(item) for item in self)}]"
+
+        def __repr__(self) -> str:
+            return f'Row {self.row_index}: {str(self)}'
+
+
+    def __init__(self, starting_sequence: Sequence[Sequence[T]]=[[]], data_type=float, path: str | os.PathLike | None = None,
+                 tile_shape: tuple[int, int] = TILE_SHAPE, cache_tiles: int = CACHE_TILES) -> None:
+        """ Write starting_sequence to a new tile file at path (or to a temporary file, removed on close(),
+            when path is None). Use create() for a grid of a given size and open_mmap() for an existing file. """
+        if not isinstance(starting_sequence, Sequence) or any(not isinstance(row, Sequence) for row in starting_sequence):
+            raise ValueError("must be a sequence of sequences")
+
+        if isinstance(starting_sequence, str):
+            raise ValueError("must be a sequence of sequences")
+
+        if any(not isinstance(item, data_type) for row in starting_sequence for item in row):
+            raise ValueError("All items must be of the same type")
+
+        num_columns = len(starting_sequence[0]) if starting_sequence else 0
+        if any(len(row) != num_columns for row in starting_sequence):
+            raise ValueError("must be a sequence of sequences with the same length")
+
+        self.__create(path, len(starting_sequence), num_columns, data_type, tile_shape, cache_tiles)
+        if self.__shape[0] and num_columns:
+            self.write_block(0, 0, np.array(starting_sequence, dtype = self.__dtype))
+
+    @staticmethod
+    def empty(rows: int=0, cols: int=0, data_type: type=float) -> TiledArray2D:
+        return TiledArray2D.create(None, rows, cols, data_type)
+
+    @staticmethod
+    def create(path: str | os.PathLike | None, rows: int, cols: int, data_type: type = float,
+               tile_shape: tuple[int, int] = TILE_SHAPE, cache_tiles: int = CACHE_TILES) -> TiledArray2D:
+        """ Create (or overwrite) a tile file at path for a rows x cols grid of zeros and open it. The file is sized
+            without writing the zeros, so on most file systems untouched tiles take no disk space. A path of None
+            uses a temporary file that is removed on close(). """
+        grid = TiledArray2D.__new__(TiledArray2D)
+        grid.__create(path, rows, cols, data_type, tile_shape, cache_tiles)
+        return grid
+
+    @staticmethod
+    def open_mmap(path: str | os.PathLike, mode: str = 'r+', cache_tiles: int = CACHE_TILES) -> TiledArray2D:
+        """ Open an existing tile file. mode is 'r' (read-only) or 'r+' (read and write). """
+        if mode not in ('r', 'r+'):
+            raise ValueError("The mode must be 'r' or 'r+'.")
+
+        with open(path, 'rb') as file:
+            magic, dtype, rows, cols, tile_rows, tile_cols = TiledArray2D.HEADER.unpack(file.read(TiledArray2D.HEADER.size))
+        if magic != TiledArray2D.MAGIC:
+            raise ValueError(f"{os.fspath(path)} is not a TiledArray2D file.")
+
+        grid = TiledArray2D.__new__(TiledArray2D)
+        grid.__open(os.fspath(path), mode, np.dtype(dtype.rstrip(b'\0').decode('ascii')), (rows, cols), (tile_rows, tile_cols), cache_tiles)
+        return grid
+
+    def flush(self) -> None:
+        """ Write every dirty resident tile back to the file. """
+        for key in list(self.__dirty):
+            self.__write_back(key)
+        if isinstance(self.__tiles, np.memmap):
+            self.__tiles.flush()
+
+    def close(self) -> None:
+        """ Flush the dirty tiles and release the file (deleting it if it is temporary). """
+        if self.__tiles is None:
+            return
+        if self.__mode != 'r':
+            self.flush()
+        self.__resident.clear()
+        self.__tiles = None
+        self.__finalizer()
+
+    def __enter__(self) -> TiledArray2D[T]:
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    @property
+    def shape(self) -> tuple[int, int]:
+        return self.__shape
+
+    @property
+    def tile_shape(self) -> tuple[int, int]:
+        return self.__tile_shape
+
+    @property
+    def dtype(self) -> np.dtype:
+        return self.__dtype
+
+    @property
+    def path(self) -> str:
+        return self.__path
+
+    @property
+    def resident_tiles(self) -> int:
+        """ The number of written tiles currently held in memory (at most cache_tiles). """
+        return len(self.__resident)
+
+    def read_block(self, row_start: int, row_stop: int, column_start: int, column_stop: int) -> NDArray:
+        """ Return a copy of the items in rows [row_start, row_stop) and columns [column_start, column_stop),
+            gathered a tile at a time. """
+        self.__check_block(row_start, row_stop, column_start, column_stop)
+        block = np.empty((row_stop - row_start, column_stop - column_start), dtype = self.__dtype)
+        for key, tile_region, block_region in self.__overlaps(row_start, row_stop, column_start, column_stop):
+            block[block_region] = self.__source(key)[tile_region]
+        return block
+
+    def write_block(self, row_start: int, column_start: int, values: NDArray) -> None:
+        """ Write a 2-D block of values with its top left item at (row_start, column_start), a tile at a time. """
+        values = np.asarray(values)
+        if values.ndim != 2:
+            raise ValueError("The values must be two-dimensional.")
+        if not np.can_cast(values.dtype, self.__dtype, 'same_kind'):
+            raise TypeError(f"An array of {values.dtype} cannot be stored as {self.__dtype}.")
+        row_stop, column_stop = row_start + values.shape[0], column_start + values.shape[1]
+        self.__check_block(row_start, row_stop, column_start, column_stop)
+        for key, tile_region, block_region in self.__overlaps(row_start, row_stop, column_start, column_stop):
+            self.__tile(key)[tile_region] = values[block_region]
+            self.__dirty.add(key)
+
+    def __getitem__(self, index: int | tuple[int, int]) -> Any:
+        if isinstance(index, tuple):
+            row_index, column_index = index
+            self.__check_cell(row_index, column_index)
+            tile_rows, tile_cols = self.__tile_shape
+            tile = self.__source((row_index // tile_rows, column_index // tile_cols))
+            return tile.item(row_index % tile_rows, column_index % tile_cols)
+
+        if not isinstance(index, int):
+            raise TypeError("This index type is invalid.")
+        if not (0 <= index < self.__shape[0]):
+            raise IndexError(f"Row index {index} out of bounds.")
+        return TiledArray2D.Row(index, self, self.__shape[1])
+
+    def __setitem__(self, index: tuple[int, int], value: T) -> None:
+        if not isinstance(index, tuple) or len(index) != 2:
+            raise TypeError("Items are set with grid[row, column] = value.")
+
+        row_index, column_index = index
+        self.__check_cell(row_index, column_index)
+        if not isinstance(value, self.__data_type):
+            raise TypeError(f"Value must be of type {self.__data_type}.")
+
+        tile_rows, tile_cols = self.__tile_shape
+        key = (row_index // tile_rows, column_index // tile_cols)
+        self.__tile(key)[row_index % tile_rows, column_index % tile_cols] = value
+        self.__dirty.add(key)
+
+    def __iter__(self) -> Iterator[Sequence[T]]:
+        for row_index in range(self.__shape[0]):
+            yield self[row_index]
+
+    def __reversed__(self) -> Iterator[Sequence[T]]:
+        for row_index in range(self.__shape[0] - 1, -1, -1):
+            yield self[row_index]
+
+    def __len__(self) -> int:
+        return self.__shape[0]
+
+    def __str__(self) -> str:
+        return f'[{", ".join(f"{str(row)}" for row in self)}]'
+
+    def __repr__(self) -> str:
+        return (f'TiledArray2D {self.__shape[0]} Rows x {self.__shape[1]} Columns, tiles: {self.__tile_shape[0]} x {self.__tile_shape[1]}, '
+                f'resident: {len(self.__resident)}, file: {self.__path}')
+
+    def __create(self, path: str | os.PathLike | None, rows: int, cols: int, data_type: type,
+                 tile_shape: tuple[int, int], cache_tiles: int) -> None:
+        dtype = native_dtype(data_type)
+        if dtype == object:
+            raise TypeError("Only bool, int, float and complex items can be stored in a TiledArray2D.")
+        if rows < 0 or cols < 0:
+            raise ValueError("The number of rows and columns must not be negative.")
+        if len(tile_shape) != 2 or min(tile_shape) < 1:
+            raise ValueError("The tile shape must be two positive integers.")
+
+        temporary = path is None
+        if temporary:
+            descriptor, path = tempfile.mkstemp(suffix = '.tiles')
+            os.close(descriptor)
+        path = os.fspath(path)
+
+        tile_count = -(-rows // tile_shape[0]) * -(-cols // tile_shape[1])
+        with open(path, 'wb') as file:
+            header = self.HEADER.pack(self.MAGIC, dtype.str.encode('ascii'), rows, cols, tile_shape[0], tile_shape[1])
+            file.write(header.ljust(self.HEADER_SIZE, b'\0'))
+            file.truncate(self.HEADER_SIZE + tile_count * tile_shape[0] * tile_shape[1] * dtype.itemsize)
+        self.__open(path, 'r+', dtype, (rows, cols), tuple(tile_shape), cache_tiles, temporary)
+
+    def __open(self, path: str, mode: str, dtype: np.dtype, shape: tuple[int, int], tile_shape: tuple[int, int],
+               cache_tiles: int, temporary: bool = False) -> None:
+        if cache_tiles < 1:
+            raise ValueError("At least one tile must be allowed to stay resident.")
+
+        self.__path = path
+        self.__mode = mode
+        self.__dtype = dtype
+        self.__data_type = data_type_for(dtype)
+        self.__shape = (int(shape[0]), int(shape[1]))
+        self.__tile_shape = (int(tile_shape[0]), int(tile_shape[1]))
+        self.__cache_tiles = cache_tiles
+        self.__resident: OrderedDict[tuple[int, int], NDArray] = OrderedDict()
+        self.__dirty: set[tuple[int, int]] = set()
+
+        tiles_down = -(-self.__shape[0] // self.__tile_shape[0])
+        tiles_across = -(-self.__shape[1] // self.__tile_shape[1])
+        if tiles_down * tiles_across == 0:
+            # np.memmap cannot map zero bytes, so a grid without tiles uses an empty in-memory array.
+            self.__tiles = np.empty((tiles_down, tiles_across) + self.__tile_shape, dtype = dtype)
+        else:
+            self.__tiles = np.memmap(path, dtype = dtype, mode = mode, offset = self.HEADER_SIZE,
+                                     shape = (tiles_down, tiles_across) + self.__tile_shape)
+        self.__finalizer = weakref.finalize(self, os.unlink, path) if temporary else (lambda: None)
+
+    def __source(self, key: tuple[int, int]) -> NDArray:
+        # The tile a read sees: its resident copy, which may hold writes not yet in the file, or else the tile in the
+        # memory-mapped file itself, so reading never copies tiles or evicts the ones being written.
+        tile = self.__resident.get(key)
+        if tile is not None:
+            return tile
+        if self.__tiles is None:
+            raise ValueError("The TiledArray2D is closed.")
+        return self.__tiles[key]
+
+    def __tile(self, key: tuple[int, int]) -> NDArray:
+        # The resident copy of a tile to write to, read from the file (evicting the least recently used tile) when it
+        # is not resident.
+        tile = self.__resident.get(key)
+        if tile is not None:
+            self.__resident.move_to_end(key)
+            return tile
+
+        if self.__tiles is None:
+            raise ValueError("The TiledArray2D is closed.")
+        if len(self.__resident) >= self.__cache_tiles:
+            oldest = next(iter(self.__resident))
+            self.__write_back(oldest)
+            del self.__resident[oldest]
+
+        tile = np.array(self.__tiles[key])
+        tile.flags.writeable = self.__mode != 'r'
+        self.__resident[key] = tile
+        return tile
+
+    def __write_back(self, key: tuple[int, int]) -> None:
+        if key in self.__dirty:
+            self.__tiles[key] = self.__resident[key]
+            self.__dirty.discard(key)
+
+    def __overlaps(self, row_start: int, row_stop: int, column_start: int, column_stop: int) -> Iterator[tuple[tuple[int, int], tuple[slice, slice], tuple[slice, slice]]]:
+        # For every tile overlapping the block: its key, the overlapping region within the tile and within the block.
+        tile_rows, tile_cols = self.__tile_shape
+        for tile_row in range(row_start // tile_rows, -(-row_stop // tile_rows)):
+            top, bottom = max(row_start, tile_row * tile_rows), min(row_stop, (tile_row + 1) * tile_rows)
+            for tile_col in range(column_start // tile_cols, -(-column_stop // tile_cols)):
+                left, right = max(column_start, tile_col * tile_cols), min(column_stop, (tile_col + 1) * tile_cols)
+                tile_region = (slice(top - tile_row * tile_rows, bottom - tile_row * tile_rows),
+                               slice(left - tile_col * tile_cols, right - tile_col * tile_cols))
+                block_region = (slice(top - row_start, bottom - row_start), slice(left - column_start, right - column_start))
+                yield (tile_row, tile_col), tile_region, block_region
+
+    def __check_block(self, row_start: int, row_stop: int, column_start: int, column_stop: int) -> None:
+        if not (0 <= row_start <= row_stop <= self.__shape[0]) or not (0 <= column_start <= column_stop <= self.__shape[1]):
+            raise IndexError("The block is out of bounds.")
+
+    def __check_cell(self, row_index: int, column_index: int) -> None:
+        if not isinstance(row_index, int) or not isinstance(column_index, int):
+            raise TypeError("The row and column indices must be integers.")
+        if not (0 <= row_index < self.__shape[0]):
+            raise IndexError(f"Row index {row_index} out of bounds.")
+        if not (0 <= column_index < self.__shape[1]):
+            raise IndexError(f"The column index {column_index} is out of bounds.")
+
+
+if __name__ == '__main__':
+    filename = os.path.basename(__file__)
+    print(f'This is the {filename} file.\nDid you mean to run your tests or program.py file?\nFor tests, run them from the Test Explorer on the left.')
@@ -9,6 +9,8 @@ sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")
 # Was having path issues trying to call on the Array2D file. So I found this workaround on Slack. https://stackoverflow.com/questions/21005822/what-does-os-path-abspathos-path-joinos-path-dirname-file-os-path-pardir
 from datastructures.array2d import Array2D
 
+NEIGHBOR_KERNEL = [[1, 1, 1], [1, 0, 1], [1, 1, 1]] # Weights for the eight cells around a cell (the cell itself is 0).
+
     
 class Cell:
     """Represents the cells within the Game of Life grid."""
@@ -34,15 +36,6 @@ class Grid:
             for col in range(self.cols):
                 self.grid[row][col].set_as_alive(random.random() < 0.5)
 
-    def count_neighbors(self, row, col):
-        directions = [(-1, -1), (-1, 0), (-1, 1), (0, -1), (0, 1), (1, -1), (1, 0), (1, 1)] # Handles indexing for directional checks. 
-        count = 0
-        for dr, dc in directions: # Learnt that delta row and delta column are used to signify change in direction. https://stackoverflow.com/questions/65247308/find-indices-of-elements-in-all-eight-directions-of-a-python-2d-array-matrix | https://www.reddit.com/r/leetcode/comments/1hswzgt/coming_from_java_python_has_so_many_niceties_that/ 
-            r, c = row + dr, col + dc
-            if 0 <= r < self.rows and 0 <= c < self.cols and self.grid[r][c].is_alive:
-                count += 1
-        return count
-    
     def copy_grid(self):
         new_grid = Grid(self.rows, self.cols)
         for row in range(self.rows):
@@ -52,9 +45,11 @@ class Grid:
     
     def update_grid(self):
         new_grid = self.copy_grid()
+        alive = self.grid.map(lambda cell: cell.is_alive, bool)
+        neighbor_counts = alive.neighborhood_sum(NEIGHBOR_KERNEL) # Counts the live neighbors of every cell in one pass instead of 8 lookups per cell.
         for row in range(self.rows):
             for col in range(self.cols):
-                neighbors = self.count_neighbors(row, col)
+                neighbors = neighbor_counts[row, col]
                 if self.grid[row][col].is_alive:
                     new_grid.grid[row][col].set_as_alive(neighbors in [2, 3])
                 else:
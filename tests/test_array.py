@@ -1,9 +1,20 @@
 import copy
+import numpy as np
 import pytest
 from datastructures.array import Array
 
 from tests.car import Car, Color, Make, Model
 
+
+def double_shared_items(array: Array[int]) -> int:
+    """ Runs in a worker process: doubles every item of a shared Array in place. """
+    items = array.to_numpy(writable=True)
+    items *= 2
+    del items
+    total = sum(array)
+    array.close()
+    return total
+
 class TestArray:
     car1 = Car('123', Color.RED, Make.TOYOTA, Model.CAMRY)
     car2 = Car('456', Color.BLUE, Make.TOYOTA, Model.CIVIC)
@@ -130,3 +141,613 @@ class TestArray:
     def test_bracket_operator_should_raise_a_type_error_if_the_index_is_not_an_integer_or_slice(self, setup_numerical_array: Array):
         with pytest.raises(TypeError):
             setup_numerical_array['string'] #type: ignore
+
+    def test_append_should_double_the_physical_size_only_when_the_array_is_full(self):
+        array = Array[int](data_type=int)
+        capacities = []
+        for i in range(9):
+            array.append(i)
+            capacities.append(array.capacity)
+        assert capacities == [2, 2, 4, 4, 8, 8, 8, 8, 16]
+        assert list(array) == list(range(9))
+
+    def test_append_front_should_keep_the_order_of_the_items(self):
+        array = Array[int](data_type=int)
+        for i in range(10, 0, -1):
+            array.append_front(i)
+        assert list(array) == list(range(1, 11))
+
+    def test_pop_should_shrink_the_physical_size_by_half_at_one_quarter_full(self):
+        array = Array[int](starting_sequence=list(range(16)), data_type=int)
+        for _ in range(12):
+            array.pop()
+        assert len(array) == 4
+        assert array.capacity == 8
+        assert list(array) == [0, 1, 2, 3]
+
+    def test_pop_front_should_return_the_items_in_order(self, setup_numerical_array: Array):
+        assert [setup_numerical_array.pop_front() for _ in range(10)] == list(range(10))
+        assert len(setup_numerical_array) == 0
+
+    def test_reserve_should_grow_the_physical_size_without_changing_the_items(self, setup_numerical_array: Array):
+        setup_numerical_array.reserve(100)
+        assert setup_numerical_array.capacity == 100
+        assert list(setup_numerical_array) == list(range(10))
+        setup_numerical_array.pop()
+        assert setup_numerical_array.capacity == 100
+
+    def test_shrink_to_fit_should_make_the_physical_size_equal_the_logical_size(self, setup_numerical_array: Array):
+        setup_numerical_array.append(10)
+        setup_numerical_array.shrink_to_fit()
+        assert setup_numerical_array.capacity == len(setup_numerical_array) == 11
+
+    def test_contains_operator_should_ignore_unused_physical_slots(self):
+        array = Array[object]()
+        array.append(1)
+        assert None not in array
+
+    def test_numerical_array_should_use_a_native_numpy_dtype(self, setup_numerical_array: Array):
+        assert setup_numerical_array.dtype == np.int64
+        assert Array[float]([1.5, 2.5], data_type=float).dtype == np.float64
+        assert Array[bool]([True, False], data_type=bool).dtype == np.bool_
+
+    def test_complex_object_array_should_fall_back_to_object_storage(self, setup_complex_object_array: Array):
+        assert setup_complex_object_array.dtype == object
+
+    def test_native_dtype_array_should_return_python_scalars(self, setup_numerical_array: Array):
+        assert type(setup_numerical_array[3]) is int
+        assert all(type(item) is int for item in setup_numerical_array)
+        assert type(setup_numerical_array.pop()) is int
+
+    def test_int_array_should_fall_back_to_object_storage_when_a_value_does_not_fit(self, setup_numerical_array: Array):
+        setup_numerical_array.append(2 ** 70)
+        assert setup_numerical_array.dtype == object
+        assert setup_numerical_array[10] == 2 ** 70
+        assert list(setup_numerical_array)[:10] == list(range(10))
+
+    def test_constructor_with_the_none_copy_policy_should_store_the_original_objects(self):
+        array = Array[Car]([self.car1, self.car2], data_type=Car, copy_policy='none')
+        assert array[0] is self.car1
+        array.append(self.car3)
+        assert array[2] is self.car3
+
+    def test_constructor_with_the_shallow_copy_policy_should_copy_the_objects(self):
+        array = Array[Car]([self.car1], data_type=Car, copy_policy='shallow')
+        assert array[0] is not self.car1
+        assert array[0].vin == self.car1.vin
+
+    def test_constructor_should_deep_copy_the_objects_by_default(self):
+        array = Array[Car]([self.car1], data_type=Car)
+        assert array.copy_policy == 'deep'
+        assert array[0] is not self.car1
+
+    def test_constructor_should_raise_a_value_error_for_an_unknown_copy_policy(self):
+        with pytest.raises(ValueError):
+            Array([1], int, copy_policy='sometimes')
+
+    def test_from_trusted_should_take_ownership_of_the_items_without_copying(self):
+        cars = [self.car1, self.car2, self.car3]
+        array = Array.from_trusted(cars, data_type=Car)
+        assert len(array) == 3
+        assert all(array[i] is cars[i] for i in range(3))
+        assert Array.from_trusted([1, 2, 3], data_type=int) == Array([1, 2, 3], int)
+
+    def test_slice_should_share_the_buffer_until_it_is_written_to(self, setup_numerical_array: Array):
+        window = setup_numerical_array[2:6]
+        assert list(window) == [2, 3, 4, 5]
+        window[0] = 100
+        assert window[0] == 100
+        assert setup_numerical_array[2] == 2
+
+    def test_writing_to_the_array_should_not_change_an_existing_slice(self, setup_numerical_array: Array):
+        window = setup_numerical_array[::3]
+        setup_numerical_array[0] = 100
+        del setup_numerical_array[1]
+        assert list(window) == [0, 3, 6, 9]
+        assert setup_numerical_array[0] == 100
+
+    def test_slice_of_a_slice_should_index_relative_to_the_slice(self, setup_numerical_array: Array):
+        assert list(setup_numerical_array[2:8][1:3]) == [3, 4]
+        assert list(setup_numerical_array[::-1][:3]) == [9, 8, 7]
+
+    def test_appending_to_a_slice_should_not_change_the_array(self, setup_complex_object_array: Array):
+        window = setup_complex_object_array[:2]
+        window.append(self.car3)
+        window.pop_front()
+        assert len(window) == 2
+        assert len(setup_complex_object_array) == 3
+        assert setup_complex_object_array[0].vin == '123'
+
+    def test_copy_should_return_an_independent_array_with_the_same_items(self, setup_numerical_array: Array):
+        copied = setup_numerical_array.copy()
+        copied[0] = 100
+        assert copied == Array([100] + list(range(1, 10)), int)
+        assert setup_numerical_array[0] == 0
+
+    def test_extend_should_append_every_item_in_order(self, setup_numerical_array: Array):
+        setup_numerical_array.extend(range(10, 15))
+        setup_numerical_array.extend(np.arange(15, 20, dtype=np.int32))
+        setup_numerical_array.extend(Array([20, 21], int))
+        assert list(setup_numerical_array) == list(range(22))
+
+    def test_extend_should_raise_a_type_error_if_an_item_is_not_the_same_type_as_the_array(self, setup_numerical_array: Array):
+        with pytest.raises(TypeError):
+            setup_numerical_array.extend([10, 'eleven'])
+        with pytest.raises(TypeError):
+            setup_numerical_array.extend(np.array([1.5, 2.5]))
+        assert len(setup_numerical_array) == 10
+
+    def test_extend_should_apply_the_copy_policy_to_objects(self):
+        array = Array[Car](data_type=Car)
+        array.extend([self.car1, self.car2])
+        assert array[0] is not self.car1 and array[0].vin == self.car1.vin
+
+    def test_from_numpy_should_use_the_numpy_array_without_copying_when_the_dtype_matches(self):
+        values = np.arange(5, dtype=np.int64)
+        array = Array.from_numpy(values)
+        values[0] = 42
+        assert array[0] == 42
+        assert Array.from_numpy(np.array([0.5]))[0] == 0.5
+        assert Array.from_numpy(np.array([1, 2], dtype=np.int8), int).dtype == np.int64
+
+    def test_from_numpy_should_keep_writing_through_after_a_slice_is_taken(self):
+        values = np.arange(5, dtype=np.int64)
+        array = Array.from_numpy(values)
+        part = array[1:3]
+        array[0] = 42
+        values[1] = 7
+        assert values[0] == 42 and array[1] == 7
+        assert list(part) == [1, 2]
+        other = Array[int]([1, 2, 3], data_type=int)
+        view = other.to_numpy(writable=True)
+        other[0:2]
+        other[2] = 30
+        assert view[2] == 30
+
+    def test_changing_the_length_should_never_shift_the_numpy_array(self):
+        values = np.arange(6, dtype=np.int64)
+        array = Array.from_numpy(values)
+        del array[3]
+        assert values.tolist() == [0, 1, 2, 3, 4, 5] and list(array) == [0, 1, 2, 4, 5]
+        values = np.arange(6, dtype=np.int64)
+        array = Array.from_numpy(values)
+        array.retain(lambda item: item % 2 == 0)
+        array.pop_front()
+        assert values.tolist() == [0, 1, 2, 3, 4, 5] and list(array) == [2, 4]
+
+    def test_from_numpy_should_raise_a_type_error_if_the_dtype_cannot_be_stored_safely(self):
+        with pytest.raises(TypeError):
+            Array.from_numpy(np.array([1.5]), int)
+
+    def test_from_numpy_and_load_should_keep_uint64_items_as_exact_python_ints(self, tmp_path):
+        assert Array.from_numpy(np.arange(3, dtype=np.uint8)).dtype == np.int64
+        array = Array.from_numpy(np.array([0, 2**64 - 1], dtype=np.uint64))
+        assert array.dtype == object and list(array) == [0, 2**64 - 1]
+        path = tmp_path / 'unsigned.npy'
+        np.save(path, np.arange(3, dtype=np.uint64))
+        assert list(Array.load(path)) == [0, 1, 2] and list(Array.load(path, mmap=True)) == [0, 1, 2]
+
+    def test_to_numpy_should_return_a_read_only_view_of_the_items(self, setup_numerical_array: Array):
+        view = setup_numerical_array.to_numpy()
+        assert view.tolist() == list(range(10))
+        with pytest.raises(ValueError):
+            view[0] = 1
+        setup_numerical_array.to_numpy(writable=True)[0] = 100
+        assert setup_numerical_array[0] == 100
+
+    def test_fill_should_set_every_item_to_the_value(self, setup_numerical_array: Array):
+        setup_numerical_array.fill(7)
+        assert list(setup_numerical_array) == [7] * 10
+        with pytest.raises(TypeError):
+            setup_numerical_array.fill('seven')
+
+    def test_from_numpy_over_a_read_only_view_should_copy_on_the_first_write(self, setup_numerical_array: Array):
+        array = Array.from_numpy(setup_numerical_array.to_numpy())
+        array[0] = 100
+        assert array[0] == 100
+        assert setup_numerical_array[0] == 0
+
+    def test_append_front_should_double_the_physical_size_only_when_the_array_is_full(self):
+        array = Array[int](data_type=int)
+        capacities = []
+        for i in range(9):
+            array.append_front(i)
+            capacities.append(array.capacity)
+        assert capacities == [2, 2, 4, 4, 8, 8, 8, 8, 16]
+        assert list(array) == list(range(8, -1, -1))
+
+    def test_mixed_front_and_back_operations_should_behave_like_a_double_ended_queue(self):
+        from collections import deque
+        array = Array[int](data_type=int)
+        expected = deque()
+        for i in range(500):
+            if i % 3 == 0:
+                array.append_front(i)
+                expected.appendleft(i)
+            elif i % 7 == 0:
+                assert array.pop_front() == expected.popleft()
+            elif i % 11 == 0:
+                assert array.pop() == expected.pop()
+            else:
+                array.append(i)
+                expected.append(i)
+        assert list(array) == list(expected)
+        assert list(reversed(array)) == list(reversed(expected))
+        assert list(array[5:20]) == list(expected)[5:20]
+
+    def test_pop_front_should_not_shift_the_remaining_items(self):
+        array = Array[int](starting_sequence=list(range(8)), data_type=int)
+        array.pop_front()
+        array.append_front(100)
+        assert array.capacity == 8
+        assert list(array) == [100] + list(range(1, 8))
+
+    def test_del_operator_should_close_the_gap_from_either_side(self):
+        array = Array[int](starting_sequence=list(range(10)), data_type=int)
+        del array[1]
+        del array[7]
+        assert list(array) == [0, 2, 3, 4, 5, 6, 7, 9]
+        array.append_front(-1)
+        array.append(10)
+        assert list(array) == [-1, 0, 2, 3, 4, 5, 6, 7, 9, 10]
+
+    def test_open_mmap_should_store_appended_items_in_the_file(self, tmp_path):
+        path = tmp_path / 'numbers.bin'
+        with Array.open_mmap(path, int, 'w+') as array:
+            for i in range(100):
+                array.append(i)
+            array.append_front(-1)
+            assert array.capacity >= 101
+
+        with Array.open_mmap(path) as array:
+            assert array.dtype == np.int64
+            assert list(array) == [-1] + list(range(100))
+            array[0] = 1000
+            array.extend(range(100, 200))
+
+        array = Array.open_mmap(path, int, 'r')
+        assert len(array) == 201
+        assert array[0] == 1000 and array[200] == 199
+        array.close()
+
+    def test_open_mmap_in_read_only_mode_should_not_allow_writes(self, tmp_path):
+        path = tmp_path / 'numbers.bin'
+        with Array.open_mmap(path, float, 'w+') as array:
+            array.extend([1.0, 2.0])
+        array = Array.open_mmap(path, float, 'r')
+        with pytest.raises(ValueError):
+            array[0] = 3.0
+        with pytest.raises(ValueError):
+            array.extend([3.0, 4.0, 5.0])
+
+    def test_open_mmap_should_not_fall_back_to_object_storage_or_share_slices(self, tmp_path):
+        path = tmp_path / 'numbers.bin'
+        with Array.open_mmap(path, int, 'w+') as array:
+            array.extend([1, 2, 3])
+            part = array[0:2]
+            array[0] = 42
+            assert list(part) == [1, 2]
+            with pytest.raises(OverflowError):
+                array.extend([2 ** 70])
+            with pytest.raises(OverflowError):
+                array.fill(2 ** 70)
+            assert array.dtype == np.int64
+        with Array.open_mmap(path, int, 'r') as array:
+            assert list(array) == [42, 2, 3]
+
+    def test_open_mmap_should_reject_object_data_types_and_mismatched_files(self, tmp_path):
+        path = tmp_path / 'numbers.bin'
+        with pytest.raises(TypeError):
+            Array.open_mmap(path, Car, 'w+')
+        Array.open_mmap(path, int, 'w+').close()
+        with pytest.raises(TypeError):
+            Array.open_mmap(path, float)
+
+    def test_contains_operator_should_find_objects_and_sequences_in_an_object_array(self, setup_complex_object_array: Array):
+        assert self.car2 in setup_complex_object_array
+        array = Array[tuple]([(1, 2), (3, 4)], data_type=tuple)
+        assert (3, 4) in array
+        assert (1, 4) not in array
+        assert 'one' not in setup_complex_object_array
+
+    def test_index_should_return_the_first_matching_index_in_the_range(self):
+        array = Array[int]([5, 1, 5, 2, 5], data_type=int)
+        assert array.index(5) == 0
+        assert array.index(5, 1) == 2
+        assert array.index(5, -2) == 4
+        with pytest.raises(ValueError):
+            array.index(5, 1, 2)
+        with pytest.raises(ValueError):
+            array.index('five')
+
+    def test_count_should_return_the_number_of_matching_items(self):
+        array = Array[int]([5, 1, 5, 2, 5], data_type=int)
+        assert array.count(5) == 3
+        assert array.count(7) == 0
+        assert Array[str](['a', 'b', 'a'], data_type=str).count('a') == 2
+
+    def test_find_all_should_return_the_indices_of_the_items_that_satisfy_the_predicate(self, setup_numerical_array: Array, setup_complex_object_array: Array):
+        assert list(setup_numerical_array.find_all(lambda item: item % 3 == 0)) == [0, 3, 6, 9]
+        assert list(setup_numerical_array.find_all(lambda items: items > 7, vectorized=True)) == [8, 9]
+        assert list(setup_complex_object_array.find_all(lambda car: car.make == Make.TOYOTA)) == [0, 1]
+
+    def test_insert_should_place_the_item_before_the_index(self):
+        array = Array[int](starting_sequence=list(range(6)), data_type=int)
+        array.insert(1, 100)
+        array.insert(5, 200)
+        array.insert(len(array), 300)
+        array.insert(0, 400)
+        assert list(array) == [400, 0, 100, 1, 2, 3, 200, 4, 5, 300]
+        with pytest.raises(IndexError):
+            array.insert(11, 1)
+
+    def test_sort_should_sort_the_items_in_place(self, setup_complex_object_array: Array):
+        array = Array[int]([3, 1, 2, 1], data_type=int)
+        array.sort()
+        assert list(array) == [1, 1, 2, 3]
+        array.sort(reverse=True)
+        assert list(array) == [3, 2, 1, 1]
+        array.sort(key=lambda item: item % 3)
+        assert list(array) == [3, 1, 1, 2]
+        setup_complex_object_array.sort(key=lambda car: car.vin, reverse=True)
+        assert [car.vin for car in setup_complex_object_array] == ['789', '456', '123']
+
+    def test_argsort_should_return_the_stable_sorting_order_without_changing_the_array(self):
+        array = Array[int]([3, 1, 2, 1], data_type=int)
+        assert list(array.argsort()) == [1, 3, 2, 0]
+        assert list(array.argsort(reverse=True)) == [0, 2, 1, 3]
+        assert list(array.argsort(key=lambda item: -item)) == [0, 2, 1, 3]
+        assert list(array) == [3, 1, 2, 1]
+
+    def test_del_operator_should_remove_a_slice_of_items(self, setup_numerical_array: Array):
+        del setup_numerical_array[2:5]
+        assert list(setup_numerical_array) == [0, 1, 5, 6, 7, 8, 9]
+        del setup_numerical_array[::2]
+        assert list(setup_numerical_array) == [1, 6, 8]
+
+    def test_del_operator_should_remove_the_items_at_a_sequence_of_indices(self, setup_complex_object_array: Array):
+        del setup_complex_object_array[[0, 2]]
+        assert [car.vin for car in setup_complex_object_array] == ['456']
+        with pytest.raises(IndexError):
+            del setup_complex_object_array[[0, 1]]
+
+    def test_del_operator_should_remove_the_items_selected_by_a_boolean_mask(self, setup_numerical_array: Array):
+        del setup_numerical_array[setup_numerical_array.to_numpy() % 2 == 1]
+        assert list(setup_numerical_array) == [0, 2, 4, 6, 8]
+        with pytest.raises(IndexError):
+            del setup_numerical_array[np.array([True, False])]
+
+    def test_del_operator_with_many_items_should_shrink_the_physical_size(self):
+        array = Array[int](starting_sequence=list(range(100)), data_type=int)
+        del array[10:]
+        assert list(array) == list(range(10))
+        assert array.capacity == 25
+        del array[:]
+        assert len(array) == 0 and array.capacity == 1
+
+    def test_retain_should_keep_only_the_items_that_satisfy_the_predicate(self, setup_numerical_array: Array, setup_complex_object_array: Array):
+        setup_numerical_array.retain(lambda items: items >= 7, vectorized=True)
+        assert list(setup_numerical_array) == [7, 8, 9]
+        setup_complex_object_array.retain(lambda car: car.make == Make.FORD)
+        assert [car.vin for car in setup_complex_object_array] == ['789']
+
+    def test_equality_operator_should_compare_native_dtype_arrays_by_value(self):
+        assert Array([1, 2, 3], int) == Array([1.0, 2.0, 3.0], float)
+        assert Array([1, 2, 3], int) != Array([1, 2, 4], int)
+        assert Array([1, 2, 3], int)[::2] == Array([1, 3], int)
+
+    def test_fingerprint_should_match_for_equal_contents_and_change_after_a_write(self, setup_numerical_array: Array):
+        fingerprint = setup_numerical_array.fingerprint()
+        assert fingerprint == Array(list(range(10)), int).fingerprint()
+        assert fingerprint == setup_numerical_array.fingerprint()
+        setup_numerical_array[0] = 100
+        assert setup_numerical_array.fingerprint() != fingerprint
+        setup_numerical_array[0] = 0
+        assert setup_numerical_array.fingerprint() == fingerprint
+        setup_numerical_array.append(10)
+        assert setup_numerical_array.fingerprint() != fingerprint
+
+    def test_fingerprint_should_see_writes_made_outside_the_array(self, setup_numerical_array: Array):
+        fingerprint = setup_numerical_array.fingerprint()
+        setup_numerical_array.to_numpy(writable=True)[0] = 100
+        assert setup_numerical_array.fingerprint() != fingerprint
+        values = np.arange(3)
+        array = Array.from_numpy(values)
+        fingerprint = array.fingerprint()
+        values[0] = 5
+        assert array.fingerprint() != fingerprint
+
+    def test_fingerprint_should_see_objects_changed_in_place(self, setup_complex_object_array: Array):
+        fingerprint = setup_complex_object_array.fingerprint()
+        setup_complex_object_array[0].vin = '000'
+        assert setup_complex_object_array.fingerprint() != fingerprint
+
+    def test_save_and_load_should_round_trip_a_numerical_array_as_npy(self, setup_numerical_array: Array, tmp_path):
+        path = tmp_path / 'numbers.npy'
+        setup_numerical_array.pop_front()
+        setup_numerical_array.save(path)
+        assert np.load(path).tolist() == list(range(1, 10))
+        loaded = Array.load(path)
+        assert loaded == setup_numerical_array
+        assert loaded.dtype == np.int64
+
+    def test_load_with_mmap_should_copy_on_the_first_write(self, setup_numerical_array: Array, tmp_path):
+        path = tmp_path / 'numbers.npy'
+        setup_numerical_array.save(path)
+        loaded = Array.load(path, mmap=True)
+        assert list(loaded) == list(range(10))
+        loaded[0] = 100
+        assert loaded[0] == 100
+        assert Array.load(path)[0] == 0
+
+    def test_save_and_load_should_round_trip_an_object_array(self, setup_complex_object_array: Array, tmp_path):
+        path = tmp_path / 'cars.bin'
+        setup_complex_object_array.save(path)
+        loaded = Array.load(path)
+        assert loaded == setup_complex_object_array
+        with pytest.raises(TypeError):
+            loaded.append('not a car')
+        with pytest.raises(ValueError):
+            Array.load(path, mmap=True)
+
+    def test_load_should_raise_a_value_error_for_a_file_not_written_by_save(self, tmp_path):
+        path = tmp_path / 'other.bin'
+        path.write_bytes(b'hello world')
+        with pytest.raises(ValueError):
+            Array.load(path)
+
+    def test_pickle_protocol_5_should_pass_the_items_out_of_band(self, setup_numerical_array: Array):
+        import pickle
+        buffers = []
+        data = pickle.dumps(setup_numerical_array, protocol=5, buffer_callback=buffers.append)
+        assert len(buffers) == 1
+        restored = pickle.loads(data, buffers=buffers)
+        assert restored == setup_numerical_array
+        assert pickle.loads(pickle.dumps(setup_numerical_array, protocol=2)) == setup_numerical_array
+        restored.append(10)
+        assert len(setup_numerical_array) == 10
+
+    def test_pickling_and_copying_should_keep_validate_off(self):
+        import pickle
+        array = Array[int]([1, 2, 3], data_type=int, validate=False)
+        for restored in (pickle.loads(pickle.dumps(array, protocol=5)), pickle.loads(pickle.dumps(array, protocol=2)),
+                         copy.deepcopy(array), copy.copy(array)):
+            assert restored.validate is False
+            restored[0] = 7.9
+            assert restored[0] == 7
+
+    def test_to_shared_should_let_worker_processes_write_to_the_same_buffer(self, setup_numerical_array: Array):
+        from concurrent.futures import ProcessPoolExecutor
+        shared = setup_numerical_array.to_shared()
+        try:
+            with ProcessPoolExecutor(max_workers=1) as pool:
+                assert pool.submit(double_shared_items, shared).result() == 90
+            assert list(shared) == [2 * i for i in range(10)]
+            assert list(setup_numerical_array) == list(range(10))
+        finally:
+            shared.close()
+
+    def test_attach_shared_should_see_the_same_items(self, setup_numerical_array: Array):
+        shared = setup_numerical_array.to_shared()
+        attached = Array.attach_shared(shared.shared_name)
+        attached[0] = 100
+        assert shared[0] == 100
+        attached.close()
+        shared.close()
+        assert setup_numerical_array.shared_name is None
+
+    def test_shared_array_should_have_a_fixed_length(self, setup_numerical_array: Array):
+        shared = setup_numerical_array.to_shared()
+        with pytest.raises(BufferError):
+            shared.append(10)
+        with pytest.raises(BufferError):
+            shared.pop()
+        with pytest.raises(BufferError):
+            del shared[0]
+        assert len(shared) == 10
+        shared.close()
+
+    def test_closing_a_shared_array_should_not_invalidate_slices_or_live_views(self, setup_numerical_array: Array):
+        shared = setup_numerical_array.to_shared()
+        part = shared[0:5]
+        view = shared.to_numpy()
+        with pytest.raises(BufferError):
+            shared.close()
+        del view
+        shared.close()
+        assert sum(part) == 10 and list(part) == [0, 1, 2, 3, 4]
+
+    def test_copying_a_shared_array_should_give_an_independent_in_memory_array(self, setup_numerical_array: Array):
+        shared = setup_numerical_array.to_shared()
+        deep, shallow = copy.deepcopy(shared), copy.copy(shared)
+        deep[0] = 77
+        shallow[1] = 88
+        assert list(shared) == list(range(10))
+        assert deep.shared_name is None and shallow.shared_name is None
+        shared.close()
+
+    def test_to_shared_should_reject_object_arrays(self, setup_complex_object_array: Array):
+        with pytest.raises(TypeError):
+            setup_complex_object_array.to_shared()
+
+    def test_map_should_return_a_new_array_of_the_results(self, setup_numerical_array: Array, setup_complex_object_array: Array):
+        doubled = setup_numerical_array.map(lambda items: items * 2, vectorized=True)
+        assert list(doubled) == [2 * i for i in range(10)] and doubled.dtype == np.int64
+        assert setup_numerical_array.map(lambda items: items / 2, vectorized=True).dtype == np.float64
+        assert list(setup_complex_object_array.map(lambda car: car.vin, str)) == ['123', '456', '789']
+        assert list(setup_numerical_array) == list(range(10))
+        with pytest.raises(TypeError):
+            setup_numerical_array.map(lambda items: items.sum(), vectorized=True)
+
+    def test_vectorized_map_and_ufunc_at_should_not_share_buffers(self):
+        array = Array[int]([1, 2, 3, 4], data_type=int)
+        same = array.map(lambda items: items, vectorized=True)
+        array[0] = 99
+        assert same[0] == 1
+        part = array[0:2]
+        fingerprint = part.fingerprint()
+        np.add.at(part, [0], 100)
+        assert list(part) == [199, 2] and list(array) == [99, 2, 3, 4]
+        assert part.fingerprint() != fingerprint
+
+    def test_map_should_call_fn_once_per_item_for_every_dtype(self, setup_numerical_array: Array):
+        flags = setup_numerical_array.map(lambda item: 1 if item > 1 else 0)
+        assert list(flags) == [0, 0] + [1] * 8 and flags.dtype == np.int64
+        assert setup_numerical_array.map(lambda item: item / 2).dtype == np.float64
+        assert setup_numerical_array.map(str).dtype == object
+        assert Array[int](data_type=int).map(str).dtype == np.int64
+        with pytest.raises(TypeError):
+            setup_numerical_array.map(lambda item: item / 2, int)
+
+    def test_reduce_should_combine_the_items_left_to_right(self, setup_numerical_array: Array):
+        assert setup_numerical_array.reduce(np.add) == 45
+        assert setup_numerical_array.reduce(lambda total, item: total * 10 + item) == 123456789
+        assert Array[str](['a', 'b', 'c'], data_type=str).reduce(lambda joined, item: joined + item, '>') == '>abc'
+        assert Array[int](data_type=int).reduce(np.add) == 0
+        with pytest.raises(TypeError):
+            Array[int](data_type=int).reduce(lambda a, b: a + b)
+
+    def test_sum_min_max_and_mean_should_aggregate_the_items(self, setup_numerical_array: Array):
+        assert setup_numerical_array.sum() == 45 and isinstance(setup_numerical_array.sum(), int)
+        assert setup_numerical_array.min() == 0 and setup_numerical_array.max() == 9
+        assert setup_numerical_array.mean() == 4.5
+        assert Array[str](['b', 'a', 'c'], data_type=str).min() == 'a'
+        with pytest.raises(ValueError):
+            Array[int](data_type=int).max()
+        with pytest.raises(ValueError):
+            Array[int](data_type=int).mean()
+
+    def test_numpy_ufuncs_should_run_on_the_items_and_return_new_arrays(self, setup_numerical_array: Array):
+        total = np.add(setup_numerical_array, setup_numerical_array)
+        assert isinstance(total, Array) and list(total) == [2 * i for i in range(10)]
+        assert isinstance(np.sqrt(setup_numerical_array), Array)
+        assert np.add.reduce(setup_numerical_array) == 45
+        assert list(np.greater(setup_numerical_array, 6)) == [False] * 7 + [True] * 3
+        np.multiply(setup_numerical_array, 3, out=setup_numerical_array)
+        assert list(setup_numerical_array) == [3 * i for i in range(10)]
+
+    def test_numpy_should_see_a_read_only_view_of_the_items(self, setup_numerical_array: Array):
+        items = np.asarray(setup_numerical_array)
+        assert not items.flags.writeable
+        assert np.shares_memory(items, setup_numerical_array.to_numpy())
+        assert np.array(setup_numerical_array).flags.writeable
+        assert np.asarray(setup_numerical_array, dtype=np.float32).dtype == np.float32
+
+    def test_an_unvalidated_array_should_skip_the_type_checks(self):
+        array = Array[int]([1, 2, 3.9], data_type=int, validate=False)
+        assert list(array) == [1, 2, 3]
+        array[0] = 7.5
+        array.append(True)
+        array.extend([4.2])
+        assert list(array) == [7, 2, 3, 1, 4]
+        assert array[1:].validate is False and array.copy().validate is False
+        with pytest.raises(TypeError):
+            Array[int]([1, 2, 3.9], data_type=int)
+        with pytest.raises(TypeError):
+            Array[int]([1], data_type=int)[0] = 7.5
+
+    def test_map_should_store_object_results_of_a_native_type_natively(self, setup_complex_object_array: Array):
+        lengths = setup_complex_object_array.map(lambda car: len(car.vin), int)
+        assert lengths.dtype == np.int64 and list(lengths) == [3, 3, 3]
+        with pytest.raises(TypeError):
+            setup_complex_object_array.map(lambda car: car.vin, int)
@@ -1,7 +1,12 @@
+import numpy as np
 import pytest
 
 from datastructures.array2d import Array2D
 
+def square_plus_one(band: np.ndarray) -> np.ndarray:
+    """A picklable function for the parallel_map_blocks tests."""
+    return band * band + 1
+
 class TestArray2D:
     
     # ✅ Fixtures to create test instances of Array2D
@@ -108,4 +113,306 @@ class TestArray2D:
     def test_init_inconsistent_lengths(self) -> None:
         """Ensures a ValueError is raised if rows in `starting_sequence` have different lengths."""
         with pytest.raises(ValueError, match="must be a sequence of sequences with the same length"):
-            _ = Array2D([[1, 2, 3], [4, 5]], data_type=int)
\ No newline at end of file
+            _ = Array2D([[1, 2, 3], [4, 5]], data_type=int)
+
+    # ✅ Test Native NumPy Backing
+    def test_native_backing(self, filled3x3: Array2D[int]) -> None:
+        """Checks that numeric items are stored in one 2-D NumPy array with a native dtype."""
+        items = filled3x3.to_numpy()
+        assert items.shape == (3, 3) and items.dtype == np.int64
+        assert filled3x3.shape == (3, 3)
+        assert not items.flags.writeable
+        filled3x3.to_numpy(writable=True)[2, 2] = 90
+        assert filled3x3[2][2] == 90
+        assert isinstance(filled3x3[0][0], int)
+
+    # ✅ Test Rows Are Views
+    def test_rows_are_views(self, filled3x3: Array2D[int]) -> None:
+        """Ensures a Row writes straight through to the grid."""
+        row = filled3x3[1]
+        row[0] = 40
+        assert filled3x3.to_numpy()[1, 0] == 40
+        assert list(row.to_numpy()) == [40, 5, 6]
+        with pytest.raises(TypeError):
+            row[0] = "forty"
+
+    # ✅ Test Object Items
+    def test_object_items(self) -> None:
+        """Checks that empty() builds a separate default object for every cell of a non-numeric type."""
+        grid = Array2D.empty(2, 2, list)
+        grid[0][0].append(1)
+        assert grid[0][1] == [] and grid.dtype == object
+        assert Array2D([[2 ** 70]], data_type=int)[0][0] == 2 ** 70
+
+    # ✅ Test Vectorized Operations
+    def test_vectorized_operations(self, filled3x3: Array2D[int]) -> None:
+        """Checks the whole-grid reductions, map and fill."""
+        assert filled3x3.sum() == 45
+        assert list(filled3x3.sum(axis=0)) == [12, 15, 18]
+        assert list(filled3x3.max(axis=1)) == [3, 6, 9]
+        assert filled3x3.mean() == 5.0 and filled3x3.min() == 1
+        assert str(filled3x3.map(lambda items: items * 2)) == "[[2, 4, 6], [8, 10, 12], [14, 16, 18]]"
+        same = filled3x3.map(lambda items: items, vectorized=True)
+        same[0][0] = 100
+        assert filled3x3[0][0] == 1
+        filled3x3.fill(7)
+        assert filled3x3.sum() == 63
+        with pytest.raises(ValueError):
+            filled3x3.sum(axis=2)
+
+    # ✅ Test Reductions on an Empty Grid
+    def test_reductions_on_an_empty_grid(self) -> None:
+        """Checks an empty grid sums to 0 (or zeros along an axis) like an empty Array, while min, max and mean raise."""
+        grid = Array2D.empty(0, 3, float)
+        assert grid.sum() == 0 and list(grid.sum(axis=0)) == [0.0, 0.0, 0.0] and len(grid.sum(axis=1)) == 0
+        for reduction in (grid.min, grid.max, grid.mean):
+            with pytest.raises(ValueError, match="empty"):
+                reduction()
+
+    # ✅ Test Tuple Indexing
+    def test_tuple_indexing(self, filled3x3: Array2D[int]) -> None:
+        """Checks grid[r, c] reads and writes a single item without going through a Row."""
+        assert filled3x3[1, 2] == 6
+        filled3x3[1, 2] = 60
+        assert filled3x3[1][2] == 60
+        with pytest.raises(IndexError):
+            _ = filled3x3[0, 3]
+        with pytest.raises(IndexError):
+            _ = filled3x3[-1, 0]
+        with pytest.raises(TypeError):
+            filled3x3[0, 0] = 1.5
+
+    # ✅ Test Submatrix Views
+    def test_submatrix_views(self, filled3x3: Array2D[int]) -> None:
+        """Ensures slicing returns views that share the grid's items."""
+        block = filled3x3[1:3, 0:2]
+        assert isinstance(block, Array2D) and str(block) == "[[4, 5], [7, 8]]"
+        block[0, 0] = 40
+        assert filled3x3[1, 0] == 40
+        assert str(filled3x3[:2]) == "[[1, 2, 3], [40, 5, 6]]"
+        assert list(filled3x3[2, 1:]) == [8, 9]
+        assert list(filled3x3[:, 1]) == [2, 5, 8]
+
+    # ✅ Test Column Views
+    def test_column_views(self, filled3x3: Array2D[int]) -> None:
+        """Checks column(j) returns an Array view of a column."""
+        column = filled3x3.column(2)
+        assert list(column) == [3, 6, 9]
+        column[1] = 66
+        assert filled3x3[1, 2] == 66
+        assert column.sum() == 78
+        with pytest.raises(IndexError):
+            filled3x3.column(3)
+        assert list(Array2D([[2 ** 70, 1]], data_type=int).column(0)) == [2 ** 70]
+
+    # ✅ Test Fast Constructors
+    def test_zeros_and_full(self) -> None:
+        """Checks zeros() and full() allocate and fill the grid in one step."""
+        zeros = Array2D.zeros(2, 3, int)
+        assert zeros.shape == (2, 3) and zeros.sum() == 0 and zeros.dtype == np.int64
+        assert str(Array2D.full(2, 2, 1.5)) == "[[1.5, 1.5], [1.5, 1.5]]"
+        lists = Array2D.full(1, 2, [0])
+        lists[0, 0].append(1)
+        assert lists[0, 1] == [0]
+        with pytest.raises(TypeError):
+            Array2D.zeros(2, 2, str)
+        with pytest.raises(TypeError):
+            Array2D.full(2, 2, 1, float)
+
+    # ✅ Test from_numpy and from_buffer
+    def test_from_numpy_and_from_buffer(self) -> None:
+        """Ensures from_numpy and from_buffer use the given memory without copying it."""
+        items = np.arange(6).reshape(2, 3)
+        grid = Array2D.from_numpy(items)
+        grid[1, 1] = 40
+        assert items[1, 1] == 40 and grid.data_type is int
+        assert Array2D.from_numpy(items, float)[1, 2] == 5.0
+        with pytest.raises(ValueError):
+            Array2D.from_numpy(np.arange(3))
+        with pytest.raises(TypeError):
+            Array2D.from_numpy(np.ones((2, 2)), int)
+
+        buffer = bytearray(np.arange(4, dtype=np.int64).tobytes())
+        grid = Array2D.from_buffer(buffer, 2, 2, int)
+        assert str(grid) == "[[0, 1], [2, 3]]"
+        grid[0, 0] = 9
+        assert np.frombuffer(buffer, dtype=np.int64)[0] == 9
+
+    # ✅ Test from_function
+    def test_from_function(self) -> None:
+        """Checks from_function builds native grids from index arrays and other grids cell by cell."""
+        assert str(Array2D.from_function(2, 3, lambda r, c: r * 3 + c)) == "[[0, 1, 2], [3, 4, 5]]"
+        assert Array2D.from_function(2, 2, lambda r, c: r == c, bool)[1, 1] is True
+        assert Array2D.from_function(2, 2, lambda r, c: 7, int).sum() == 28
+        assert str(Array2D.from_function(1, 2, lambda r, c: f"{r}{c}", str)) == "[[00, 01]]"
+
+    # ✅ Test Neighborhood Sums
+    def test_neighborhood_sum(self) -> None:
+        """Checks neighborhood_sum counts neighbors for each boundary mode."""
+        diagonal = Array2D([[True, False, False], [False, True, False], [False, False, True]], data_type=bool)
+        neighbors = [[1, 1, 1], [1, 0, 1], [1, 1, 1]]
+        assert str(diagonal.neighborhood_sum(neighbors)) == "[[1, 2, 1], [2, 2, 2], [1, 2, 1]]"
+        assert str(diagonal.neighborhood_sum(neighbors, boundary='wrap')) == "[[2, 3, 3], [3, 2, 3], [3, 3, 2]]"
+        row = Array2D([[1, 2], [3, 4]], data_type=int)
+        assert str(row.neighborhood_sum([[1, 1, 1]], boundary='reflect')) == "[[5, 4], [11, 10]]"
+        assert row.neighborhood_sum([[0.5]]).data_type is float
+        with pytest.raises(ValueError):
+            row.neighborhood_sum([[1, 1]])
+        with pytest.raises(ValueError):
+            row.neighborhood_sum(neighbors, boundary='mirror')
+        with pytest.raises(TypeError):
+            Array2D.empty(2, 2, list).neighborhood_sum(neighbors)
+
+    # ✅ Test Mapping Objects to Numbers
+    def test_map_objects_to_a_native_type(self) -> None:
+        """Ensures mapping object items to a numeric type gives a native grid."""
+        words = Array2D([["a", "bb"], ["ccc", ""]], data_type=str)
+        lengths = words.map(len, int)
+        assert lengths.dtype == np.int64 and lengths.sum() == 6
+        flags = Array2D([[1, 2], [3, 0]], data_type=int).map(lambda item: 1 if item > 1 else 0)
+        assert str(flags) == "[[0, 1], [1, 0]]" and flags.dtype == np.int64
+
+    # ✅ Test Growing Rows
+    def test_append_and_insert_rows(self, filled3x3: Array2D[int]) -> None:
+        """Checks rows can be added with spare capacity doubling as the grid grows."""
+        filled3x3.append_row([10, 11, 12])
+        assert filled3x3.capacity == (6, 3)
+        filled3x3.insert_row(0, np.array([0, 0, 0]))
+        assert str(filled3x3) == "[[0, 0, 0], [1, 2, 3], [4, 5, 6], [7, 8, 9], [10, 11, 12]]"
+        assert filled3x3.shape == (5, 3) and filled3x3.capacity == (6, 3)
+        with pytest.raises(ValueError):
+            filled3x3.append_row([1, 2])
+        with pytest.raises(TypeError):
+            filled3x3.append_row([1, 2, "3"])
+        grid = Array2D.empty(0, 0, int)
+        for i in range(5):
+            grid.append_row([i, i])
+        assert grid.shape == (5, 2) and grid.sum(axis=0)[0] == 10
+
+    # ✅ Test Growing Columns
+    def test_append_and_insert_columns(self, filled3x3: Array2D[int]) -> None:
+        """Checks columns can be added on the right or in the middle."""
+        filled3x3.append_column([30, 60, 90])
+        filled3x3.insert_column(1, [0, 0, 0])
+        assert str(filled3x3) == "[[1, 0, 2, 3, 30], [4, 0, 5, 6, 60], [7, 0, 8, 9, 90]]"
+        assert filled3x3.capacity == (3, 6)
+        assert list(filled3x3.column(4)) == [30, 60, 90]
+        filled3x3.append_column([2 ** 70, 0, 0])
+        assert filled3x3[0, 5] == 2 ** 70 and filled3x3[2, 4] == 90
+
+    # ✅ Test Deleting Rows and Columns
+    def test_delete_rows_and_columns(self, filled3x3: Array2D[int]) -> None:
+        """Ensures deleting a row or column closes the gap."""
+        filled3x3.delete_row(0)
+        filled3x3.delete_column(1)
+        assert str(filled3x3) == "[[4, 6], [7, 9]]"
+        assert filled3x3.capacity == (3, 3)
+        filled3x3.shrink_to_fit()
+        assert filled3x3.capacity == (2, 2)
+        with pytest.raises(IndexError):
+            filled3x3.delete_row(2)
+
+    # ✅ Test Resizing
+    def test_resize(self, filled3x3: Array2D[int]) -> None:
+        """Checks resize keeps the items that fit and fills new cells like empty()."""
+        filled3x3.resize(2, 4)
+        assert str(filled3x3) == "[[1, 2, 3, 0], [4, 5, 6, 0]]"
+        filled3x3.resize(3, 2)
+        assert str(filled3x3) == "[[1, 2], [4, 5], [0, 0]]"
+        grid = Array2D.empty(1, 1, list)
+        grid.resize(2, 2)
+        grid[1, 1].append(1)
+        assert str(grid) == "[[[], []], [[], [1]]]"
+
+    # ✅ Test Parallel Map over Row Blocks
+    def test_parallel_map_blocks(self) -> None:
+        """Checks every band is mapped in place by the worker processes, including through a view."""
+        grid = Array2D.from_function(50, 40, lambda r, c: r * 40 + c, int)
+        expected = grid.to_numpy() ** 2 + 1
+        grid.parallel_map_blocks(square_plus_one, block_rows=7, workers=2)
+        assert np.array_equal(grid.to_numpy(), expected)
+        grid[10:20, 5:10].parallel_map_blocks(np.negative, block_rows=3, workers=2)
+        assert grid[10, 5] == -expected[10, 5] and grid[9, 5] == expected[9, 5]
+
+    def test_parallel_map_blocks_errors(self, filled3x3: Array2D[int]) -> None:
+        """Ensures object grids and results that do not fit the grid are rejected."""
+        with pytest.raises(TypeError):
+            filled3x3.parallel_map_blocks(np.sqrt, workers=1)
+        with pytest.raises(TypeError):
+            filled3x3.parallel_map_blocks(np.sqrt, block_rows=1, workers=2)
+        with pytest.raises(TypeError):
+            Array2D.empty(2, 2, list).parallel_map_blocks(square_plus_one)
+        assert str(filled3x3) == "[[1, 2, 3], [4, 5, 6], [7, 8, 9]]"
+
+    # ✅ Test Writes That Overflow, Object Fill and Safe Map
+    def test_single_cell_writes_fall_back_to_object_storage(self, filled3x3: Array2D[int]) -> None:
+        """Ensures an int too wide for int64 can be written through grid[r][c] and grid[r, c]."""
+        row = filled3x3[0]
+        row[0] = 2 ** 70
+        filled3x3[1, 1] = 2 ** 71
+        row[1] = 20
+        assert filled3x3[0, 0] == 2 ** 70 and filled3x3[1][1] == 2 ** 71 and filled3x3[0, 1] == 20
+        filled3x3.fill(2 ** 72)
+        assert filled3x3.sum() == 9 * 2 ** 72
+
+    def test_fill_copies_object_values_per_cell(self) -> None:
+        """Checks fill gives every object cell its own copy, as full() does."""
+        grid = Array2D.empty(2, 2, list)
+        grid.fill([1])
+        assert grid[0][0] is not grid[1][1] and grid[1][1] == [1]
+
+    def test_vectorized_map_rejects_unsafe_casts(self, filled3x3: Array2D[int]) -> None:
+        """Ensures map does not silently truncate results that do not fit data_type."""
+        with pytest.raises(TypeError):
+            filled3x3.map(lambda items: items / 2, int, vectorized=True)
+        with pytest.raises(TypeError):
+            filled3x3.map(lambda item: item / 2, int)
+        assert str(filled3x3.map(lambda items: items * 2, float, vectorized=True)[0]) == "[2.0, 4.0, 6.0]"
+
+    # ✅ Test NumPy Integer Indices
+    def test_numpy_integer_indices(self, filled3x3: Array2D[int]) -> None:
+        """Checks NumPy integers index rows, cells and columns like Python ints."""
+        row, column = np.int64(1), np.int32(2)
+        assert filled3x3[row, 0] == 4 and filled3x3[row][column] == 6
+        filled3x3[row, column] = 60
+        assert list(filled3x3.column(column)) == [3, 60, 9]
+        assert list(filled3x3[row, 0:2]) == [4, 5]
+
+    # ✅ Test Reshaping Views
+    def test_reshaping_a_view_leaves_the_grid_alone(self) -> None:
+        """Ensures deleting, inserting or resizing through a view never shifts or clears the grid's cells."""
+        grid = Array2D([[1, 1], [2, 2], [3, 3], [4, 4]], data_type=int)
+        view = grid[0:3]
+        view.delete_row(0)
+        view.delete_column(0)
+        assert str(view) == "[[2], [3]]"
+        assert str(grid) == "[[1, 1], [2, 2], [3, 3], [4, 4]]"
+        view[0, 0] = 20
+        assert grid[1, 1] == 2
+        words = Array2D([["a", "b"], ["c", "d"]], data_type=str)
+        words[0:2].resize(1, 2)
+        words[0:2, 0:1].insert_row(0, ["x"])
+        assert str(words) == "[[a, b], [c, d]]"
+        values = np.arange(6).reshape(3, 2)
+        Array2D.from_numpy(values).delete_row(0)
+        assert values.tolist() == [[0, 1], [2, 3], [4, 5]]
+        zeros = np.zeros((3, 2), np.int64)
+        zeros[0] = 1
+        given = Array2D.from_numpy(zeros)
+        given.delete_row(0)
+        given.resize(1, 2)
+        assert zeros.tolist() == [[1, 1], [0, 0], [0, 0]] and given.shape == (1, 2)
+
+    # ✅ Test Changing the Length of a Column View
+    def test_length_changes_on_a_column_view_leave_the_grid_alone(self) -> None:
+        """Ensures del, pop and retain on a column or row-slice view never shift or clear the grid's cells."""
+        grid = Array2D([[1], [2], [3], [4]], data_type=int)
+        column = grid.column(0)
+        del column[2]
+        assert list(column) == [1, 2, 4] and list(grid.column(0)) == [1, 2, 3, 4]
+        grid.column(0).retain(lambda item: item % 2 == 0)
+        grid[0, 0:1].pop()
+        assert list(grid.column(0)) == [1, 2, 3, 4]
+        words = Array2D([["a"], ["b"], ["c"], ["d"]], data_type=str)
+        assert words.column(0).pop() == "d"
+        assert words[3, 0] == "d"
@@ -0,0 +1,78 @@
+import numpy as np
+import pytest
+
+from datastructures.bitarray import BitArray
+
+
+class TestBitArray:
+
+    @pytest.fixture
+    def flags(self) -> BitArray:
+        return BitArray([True, False, False, True, True, False, False, False, False, True])
+
+    def test_constructor_should_store_the_flags_in_order(self, flags: BitArray):
+        assert list(flags) == [True, False, False, True, True, False, False, False, False, True]
+        assert len(flags) == 10
+
+    def test_constructor_should_pack_eight_flags_per_byte(self, flags: BitArray):
+        assert len(flags.packed) == 2
+
+    def test_constructor_should_raise_a_type_error_for_items_that_are_not_bools(self):
+        with pytest.raises(TypeError):
+            BitArray([True, 1])
+        with pytest.raises(TypeError):
+            BitArray([1, 0], data_type=int)
+
+    def test_setitem_and_getitem_should_update_a_single_flag(self, flags: BitArray):
+        flags[1] = True
+        flags[0] = False
+        assert flags[1] is True and flags[0] is False
+        with pytest.raises(IndexError):
+            flags[10]
+        with pytest.raises(TypeError):
+            flags[2] = 1
+
+    def test_append_and_pop_should_work_at_the_end(self):
+        flags = BitArray()
+        for i in range(20):
+            flags.append(i % 3 == 0)
+        assert [flags.pop() for _ in range(20)] == [i % 3 == 0 for i in reversed(range(20))]
+        assert len(flags) == 0
+
+    def test_front_operations_and_delete_should_keep_the_order(self, flags: BitArray):
+        flags.append_front(False)
+        assert flags.pop_front() is False
+        assert flags.pop_front() is True
+        del flags[2]
+        assert list(flags) == [False, False, True, False, False, False, False, True]
+
+    def test_popcount_and_count_should_count_the_flags(self, flags: BitArray):
+        assert flags.popcount() == 4
+        assert flags.count(True) == 4
+        assert flags.count(False) == 6
+        assert True in flags and 'True' not in flags
+
+    def test_find_first_set_should_return_the_first_true_index(self, flags: BitArray):
+        assert flags.find_first_set() == 0
+        assert BitArray.zeros(100).find_first_set() == -1
+        sparse = BitArray.zeros(100)
+        sparse[77] = True
+        assert sparse.find_first_set() == 77
+
+    def test_bitwise_operators_should_combine_flags_elementwise(self):
+        left = BitArray.from_numpy(np.arange(13) % 2 == 0)
+        right = BitArray.from_numpy(np.arange(13) % 3 == 0)
+        assert list(left & right) == [bool(i % 6 == 0) for i in range(13)]
+        assert list(left | right) == [bool(i % 2 == 0 or i % 3 == 0) for i in range(13)]
+        assert list(left ^ right) == [bool((i % 2 == 0) != (i % 3 == 0)) for i in range(13)]
+        assert list(~left) == [bool(i % 2) for i in range(13)]
+        assert (~left).popcount() == 6
+
+    def test_bitwise_operators_should_raise_a_value_error_for_different_lengths(self, flags: BitArray):
+        with pytest.raises(ValueError):
+            flags & BitArray([True])
+
+    def test_equality_and_slicing(self, flags: BitArray):
+        assert flags == BitArray(list(flags))
+        assert flags != BitArray(list(flags)[:-1])
+        assert flags[3:5] == BitArray([True, True])
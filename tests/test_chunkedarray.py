@@ -0,0 +1,138 @@
+import random
+
+import numpy as np
+import pytest
+
+from datastructures.chunkedarray import ChunkedArray
+
+
+class TestChunkedArray:
+
+    @pytest.fixture
+    def numbers(self) -> ChunkedArray:
+        return ChunkedArray(list(range(100)), data_type=int, block_size=8)
+
+    def test_constructor_should_spread_the_items_over_fixed_size_blocks(self, numbers: ChunkedArray):
+        assert list(numbers) == list(range(100))
+        assert len(numbers) == 100
+        assert numbers.block_count == 17
+        assert numbers.dtype == np.int64
+
+    def test_constructor_should_raise_a_type_error_for_items_of_the_wrong_type(self):
+        with pytest.raises(TypeError):
+            ChunkedArray([1, 'two'], data_type=int)
+        with pytest.raises(ValueError):
+            ChunkedArray([1, 2], data_type=int, block_size=2)
+
+    def test_getitem_should_find_the_item_in_any_block(self, numbers: ChunkedArray):
+        assert [numbers[i] for i in range(100)] == list(range(100))
+        assert isinstance(numbers[42], int)
+        with pytest.raises(IndexError):
+            numbers[100]
+
+    def test_slicing_should_return_a_new_chunked_array(self, numbers: ChunkedArray):
+        assert list(numbers[5:30:3]) == list(range(100))[5:30:3]
+        assert list(numbers[90:10:-7]) == list(range(100))[90:10:-7]
+        assert isinstance(numbers[:3], ChunkedArray)
+        assert len(numbers[50:50]) == 0
+
+    def test_insert_should_split_a_full_block_and_keep_the_order(self, numbers: ChunkedArray):
+        expected = list(range(100))
+        for value in range(200, 260):
+            index = (value * 37) % (len(expected) + 1)
+            numbers.insert(index, value)
+            expected.insert(index, value)
+        assert list(numbers) == expected
+        assert list(reversed(numbers)) == expected[::-1]
+
+    def test_delitem_should_remove_single_items_and_merge_sparse_blocks(self, numbers: ChunkedArray):
+        expected = list(range(100))
+        while len(expected) > 3:
+            index = (len(expected) * 13) % len(expected)
+            del numbers[index]
+            del expected[index]
+        assert list(numbers) == expected
+        assert numbers.block_count == 1
+
+    def test_delitem_with_a_slice_should_remove_a_range_or_an_extended_slice(self, numbers: ChunkedArray):
+        expected = list(range(100))
+        del numbers[10:60]
+        del expected[10:60]
+        del numbers[::4]
+        del expected[::4]
+        assert list(numbers) == expected
+
+    def test_slice_assignment_should_splice_a_sequence_of_any_length(self, numbers: ChunkedArray):
+        expected = list(range(100))
+        numbers[20:25] = list(range(1000, 1030))
+        expected[20:25] = list(range(1000, 1030))
+        numbers[50:80] = [7]
+        expected[50:80] = [7]
+        numbers[3:3] = [-1, -2]
+        expected[3:3] = [-1, -2]
+        assert list(numbers) == expected
+
+    def test_extended_slice_assignment_should_require_a_matching_length(self, numbers: ChunkedArray):
+        numbers[::10] = [0] * 10
+        assert [numbers[i] for i in range(0, 100, 10)] == [0] * 10
+        with pytest.raises(ValueError):
+            numbers[::10] = [1, 2]
+        with pytest.raises(TypeError):
+            numbers[0:2] = 5
+
+    def test_append_and_pop_should_work_at_both_ends(self):
+        numbers = ChunkedArray[int](data_type=int, block_size=4)
+        for i in range(20):
+            numbers.append(i)
+            numbers.append_front(-i)
+        assert numbers.pop() == 19
+        assert numbers.pop_front() == -19
+        assert list(numbers) == list(range(-18, 1)) + list(range(0, 19))
+        with pytest.raises(IndexError):
+            ChunkedArray[int](data_type=int).pop()
+
+    def test_random_edits_should_match_a_list(self):
+        rng = random.Random(152)
+        numbers = ChunkedArray[int](data_type=int, block_size=16)
+        expected: list[int] = []
+        for step in range(2000):
+            operation = rng.random()
+            if operation < 0.5 or not expected:
+                index = rng.randint(0, len(expected))
+                numbers.insert(index, step)
+                expected.insert(index, step)
+            elif operation < 0.8:
+                index = rng.randrange(len(expected))
+                del numbers[index]
+                del expected[index]
+            else:
+                start = rng.randint(0, len(expected))
+                stop = rng.randint(start, len(expected))
+                replacement = list(range(rng.randint(0, 20)))
+                numbers[start:stop] = replacement
+                expected[start:stop] = replacement
+        assert list(numbers) == expected
+        assert [numbers[i] for i in range(len(expected))] == expected
+
+    def test_a_value_too_large_for_int64_should_move_the_blocks_to_object_storage(self, numbers: ChunkedArray):
+        numbers.insert(50, 2 ** 70)
+        assert numbers.dtype == object
+        assert numbers[50] == 2 ** 70
+        assert numbers[51] == 50
+
+    def test_object_items_should_be_copied_per_the_copy_policy(self):
+        lists = ChunkedArray([[1], [2]], data_type=list)
+        item = [3]
+        lists.insert(1, item)
+        item.append(4)
+        assert list(lists) == [[1], [3], [2]]
+        assert [3] in lists and [4] not in lists
+
+    def test_contains_eq_and_to_numpy_should_use_the_live_items(self, numbers: ChunkedArray):
+        assert 99 in numbers and 100 not in numbers and 'a' not in numbers
+        assert numbers == ChunkedArray(list(range(100)), data_type=int, block_size=32)
+        assert np.array_equal(numbers.to_numpy(), np.arange(100))
+        numbers.clear()
+        assert len(numbers) == 0 and numbers.block_count == 0
+        numbers.append(1)
+        assert list(numbers) == [1]
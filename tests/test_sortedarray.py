@@ -0,0 +1,61 @@
+import pytest
+
+from datastructures.sortedarray import SortedArray
+from tests.car import Car, Color, Make, Model
+
+
+class TestSortedArray:
+
+    @pytest.fixture
+    def numbers(self) -> SortedArray[int]:
+        return SortedArray[int]([8, 3, 5, 1, 4, 5], data_type=int)
+
+    @pytest.fixture
+    def words(self) -> SortedArray[str]:
+        return SortedArray[str](['pear', 'apple', 'fig'], data_type=str)
+
+    def test_constructor_should_sort_the_starting_sequence(self, numbers: SortedArray[int], words: SortedArray[str]):
+        assert list(numbers) == [1, 3, 4, 5, 5, 8]
+        assert list(words) == ['apple', 'fig', 'pear']
+
+    def test_add_should_keep_the_items_in_order(self, numbers: SortedArray[int], words: SortedArray[str]):
+        for item in [0, 9, 5, 2]:
+            numbers.add(item)
+        words.add('banana')
+        assert list(numbers) == [0, 1, 2, 3, 4, 5, 5, 5, 8, 9]
+        assert list(words) == ['apple', 'banana', 'fig', 'pear']
+
+    def test_add_should_raise_a_type_error_if_the_item_is_not_the_same_type(self, numbers: SortedArray[int]):
+        with pytest.raises(TypeError):
+            numbers.add('seven')
+
+    def test_contains_operator_should_use_the_sorted_order(self, numbers: SortedArray[int], words: SortedArray[str]):
+        assert 5 in numbers and 8 in numbers
+        assert 2 not in numbers and 9 not in numbers
+        assert 'fig' in words and 'kiwi' not in words
+
+    def test_contains_operator_should_return_false_for_values_of_another_type(self, numbers: SortedArray[int], words: SortedArray[str]):
+        assert None not in numbers and 'five' not in numbers and 2 ** 70 not in numbers
+        assert None not in words and 5 not in words
+        with pytest.raises(ValueError):
+            words.remove(None)
+
+    def test_bisect_should_return_the_insertion_points(self, numbers: SortedArray[int], words: SortedArray[str]):
+        assert numbers.bisect_left(5) == 3
+        assert numbers.bisect_right(5) == 5
+        assert words.bisect_left('banana') == 1
+
+    def test_range_should_return_the_items_from_low_up_to_but_not_including_high(self, numbers: SortedArray[int]):
+        assert list(numbers.range(3, 8)) == [3, 4, 5, 5]
+        assert list(numbers.range(6, 2)) == []
+
+    def test_remove_should_remove_one_matching_item(self, numbers: SortedArray[int]):
+        numbers.remove(5)
+        assert list(numbers) == [1, 3, 4, 5, 8]
+        with pytest.raises(ValueError):
+            numbers.remove(7)
+
+    def test_sorted_array_of_objects_should_order_by_the_objects_comparisons(self):
+        cars = SortedArray[Car]([Car('789', Color.RED, Make.FORD, Model.FUSION), Car('123', Color.RED, Make.FORD, Model.FUSION)], data_type=Car)
+        cars.add(Car('456', Color.RED, Make.FORD, Model.FUSION))
+        assert [car.vin for car in cars] == sorted(car.vin for car in cars)
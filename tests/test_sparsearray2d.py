@@ -0,0 +1,79 @@
+import numpy as np
+import pytest
+
+from datastructures.array2d import Array2D
+from datastructures.sparsearray2d import SparseArray2D
+
+
+class TestSparseArray2D:
+
+    @pytest.fixture
+    def grid(self) -> SparseArray2D[int]:
+        return SparseArray2D([[0, 0, 3], [0, 0, 0], [7, 0, 9]], data_type=int)
+
+    def test_constructor_should_only_store_the_non_default_items(self, grid: SparseArray2D):
+        assert grid.nnz == 3
+        assert grid.shape == (3, 3)
+        assert str(grid) == "[[0, 0, 3], [0, 0, 0], [7, 0, 9]]"
+        assert repr(grid).startswith("SparseArray2D 3 Rows x 3 Columns")
+
+    def test_constructor_should_raise_the_same_errors_as_array2d(self):
+        with pytest.raises(ValueError, match="must be a sequence of sequences"):
+            SparseArray2D("invalid", data_type=int)
+        with pytest.raises(ValueError, match="All items must be of the same type"):
+            SparseArray2D([[1, "2"]], data_type=int)
+        with pytest.raises(ValueError, match="with the same length"):
+            SparseArray2D([[1, 2], [3]], data_type=int)
+
+    def test_indexing_should_return_the_default_for_unset_cells(self, grid: SparseArray2D):
+        assert grid[0][2] == 3 and grid[0, 2] == 3
+        assert grid[1][1] == 0
+        with pytest.raises(IndexError):
+            grid[3][0]
+        with pytest.raises(IndexError):
+            grid[0, 3]
+
+    def test_setting_a_cell_to_the_default_should_remove_it(self, grid: SparseArray2D):
+        grid[1][1] = 5
+        assert grid.nnz == 4 and grid[1, 1] == 5
+        grid[0, 2] = 0
+        assert grid.nnz == 3
+        with pytest.raises(TypeError):
+            grid[0, 0] = "x"
+
+    def test_empty_should_allocate_no_cells_for_a_huge_grid(self):
+        grid = SparseArray2D.empty(100_000, 100_000, float, default=-1.0)
+        grid[99_999, 5] = 2.5
+        assert grid[0, 0] == -1.0 and grid.nnz == 1
+        assert list(grid.column_items(5)) == [(99_999, 2.5)]
+
+    def test_to_csr_and_to_csc_should_compress_the_non_default_cells(self, grid: SparseArray2D):
+        values, columns, offsets = grid.to_csr()
+        assert list(values) == [3, 7, 9] and list(columns) == [2, 0, 2] and list(offsets) == [0, 1, 1, 3]
+        values, rows, offsets = grid.to_csc()
+        assert list(values) == [7, 3, 9] and list(rows) == [2, 0, 2] and list(offsets) == [0, 1, 1, 3]
+        assert grid.to_csr() is grid.to_csr()
+        grid[1, 1] = 4
+        assert list(grid.to_csr()[0]) == [3, 4, 7, 9]
+
+    def test_row_items_column_items_and_items_should_visit_only_non_default_cells(self, grid: SparseArray2D):
+        assert list(grid.row_items(2)) == [(0, 7), (2, 9)]
+        assert list(grid.row_items(1)) == []
+        assert list(grid.column_items(2)) == [(0, 3), (2, 9)]
+        assert list(grid.items()) == [((0, 2), 3), ((2, 0), 7), ((2, 2), 9)]
+
+    def test_iteration_should_fill_in_the_default(self, grid: SparseArray2D):
+        assert [list(row) for row in grid] == [[0, 0, 3], [0, 0, 0], [7, 0, 9]]
+        assert [list(row) for row in reversed(grid)][0] == [7, 0, 9]
+        assert list(reversed(grid[0])) == [3, 0, 0]
+
+    def test_conversion_to_and_from_dense_grids(self, grid: SparseArray2D):
+        dense = grid.to_array2d()
+        assert isinstance(dense, Array2D) and str(dense) == str(grid)
+        sparse = SparseArray2D.from_numpy(np.array([[0.0, 1.5], [0.0, 0.0]]))
+        assert sparse.nnz == 1 and sparse[0, 1] == 1.5 and sparse.default == 0.0
+
+    def test_object_items_should_use_data_type_as_the_default(self):
+        words = SparseArray2D([["", "a"], ["", ""]], data_type=str)
+        assert words.nnz == 1 and words[1, 1] == ""
+        assert list(words.items()) == [((0, 1), "a")]
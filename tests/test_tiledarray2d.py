@@ -0,0 +1,81 @@
+import os
+import numpy as np
+import pytest
+
+from datastructures.tiledarray2d import TiledArray2D
+
+
+class TestTiledArray2D:
+
+    @pytest.fixture
+    def path(self, tmp_path) -> str:
+        return str(tmp_path / "grid.tiles")
+
+    def test_constructor_should_write_the_items_and_raise_the_same_errors_as_array2d(self):
+        with TiledArray2D([[1, 2, 3], [4, 5, 6]], data_type=int, tile_shape=(1, 2)) as grid:
+            assert grid.shape == (2, 3)
+            assert str(grid) == "[[1, 2, 3], [4, 5, 6]]"
+            assert grid[1][2] == 6 and grid[0, 1] == 2
+            assert [list(row) for row in reversed(grid)] == [[4, 5, 6], [1, 2, 3]]
+        with pytest.raises(ValueError, match="must be a sequence of sequences"):
+            TiledArray2D("invalid", data_type=int)
+        with pytest.raises(ValueError, match="All items must be of the same type"):
+            TiledArray2D([[1, "2"]], data_type=int)
+        with pytest.raises(ValueError, match="with the same length"):
+            TiledArray2D([[1, 2], [3]], data_type=int)
+        with pytest.raises(TypeError):
+            TiledArray2D.empty(2, 2, str)
+
+    def test_indexing_should_check_bounds_and_types(self):
+        with TiledArray2D.empty(3, 3, float) as grid:
+            grid[2][2] = 1.5
+            assert grid[2, 2] == 1.5 and grid[0, 0] == 0.0
+            with pytest.raises(IndexError):
+                grid[3][0]
+            with pytest.raises(IndexError):
+                grid[0, 3]
+            with pytest.raises(TypeError):
+                grid[0, 0] = "x"
+
+    def test_writes_should_survive_eviction_of_dirty_tiles(self, path: str):
+        with TiledArray2D.create(path, 100, 100, int, tile_shape=(10, 10), cache_tiles=4) as grid:
+            for i in range(100):
+                grid[i, 99 - i] = i
+            assert grid.resident_tiles == 4
+            assert [grid[i, 99 - i] for i in range(100)] == list(range(100))
+
+    def test_open_mmap_should_read_back_a_closed_grid(self, path: str):
+        with TiledArray2D.create(path, 50, 70, float, tile_shape=(16, 16)) as grid:
+            grid.write_block(10, 20, np.full((30, 40), 2.5))
+            grid[49, 69] = -1.0
+        with TiledArray2D.open_mmap(path, mode='r') as grid:
+            assert grid.shape == (50, 70) and grid.tile_shape == (16, 16) and grid.dtype == np.float64
+            block = grid.read_block(9, 41, 19, 61)
+            assert block[0].sum() == 0 and block[1:31, 1:41].sum() == 2.5 * 30 * 40
+            assert grid[49][69] == -1.0
+            with pytest.raises(ValueError):
+                grid[0, 0] = 1.0
+
+    def test_a_large_grid_should_keep_only_cache_tiles_resident(self, path: str):
+        with TiledArray2D.create(path, 100_000, 100_000, bool, tile_shape=(256, 256), cache_tiles=8) as grid:
+            for i in range(0, 100_000, 997):
+                grid[i, i] = True
+            assert grid.resident_tiles == 8
+            assert grid[99_700, 99_700] and not grid[99_700, 0]
+
+    def test_reads_should_come_from_the_file_without_filling_the_cache(self, path: str):
+        with TiledArray2D.create(path, 64, 1_000, int, tile_shape=(16, 16), cache_tiles=2) as grid:
+            grid[3, 999] = 7
+            assert sum(grid[3]) == 7 and grid.read_block(0, 64, 0, 1_000).sum() == 7
+            assert grid.resident_tiles == 1
+            grid.flush()
+            grid[3, 0] = 1
+            grid[40, 500] = 2
+            assert grid[3, 999] == 7 and grid[3, 0] == 1 and grid.resident_tiles == 2
+
+    def test_an_empty_temporary_grid_should_remove_its_file_on_close(self):
+        grid = TiledArray2D.empty(4, 4, int)
+        grid[3, 3] = 9
+        assert grid[3, 3] == 9
+        grid.close()
+        assert not os.path.exists(grid.path)